@@ -35,14 +35,17 @@ __version__ = "1.0.0"
 __author__ = "Velotales"
 __email__ = "velotales@users.noreply.github.com"
 
-from .services.device_scanner import DeviceScanner
-from .devices.bike_sensor import BikeSensor
-from .devices.heart_rate_monitor import HeartRateMonitor
-from .utils.usb_detector import ANTUSBDetector
-
-__all__ = [
-    "DeviceScanner",
-    "HeartRateMonitor",
-    "BikeSensor",
-    "ANTUSBDetector",
-]
+from .utils.lazy import lazy_exports
+
+# Public names are resolved on first access (PEP 562) so that entry points
+# which never touch the ANT+ stack do not pay for openant/pyusb imports.
+_LAZY_EXPORTS = {
+    "DeviceScanner": ".services.device_scanner",
+    "HeartRateMonitor": ".devices.heart_rate_monitor",
+    "BikeSensor": ".devices.bike_sensor",
+    "ANTUSBDetector": ".utils.usb_detector",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
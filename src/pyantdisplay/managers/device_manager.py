@@ -25,10 +25,9 @@ SOFTWARE.
 Manages device connections and data display.
 """
 
-from colorama import Fore, Style
+import threading
 
-from ..devices.bike_sensor import BikeSensor
-from ..devices.heart_rate_monitor import HeartRateMonitor
+from colorama import Fore, Style
 
 
 class DeviceManager:
@@ -47,48 +46,51 @@ class DeviceManager:
         self.hr_data: dict = {}
         self.bike_data: dict = {}
 
+        # Set whenever new sensor data arrives so displays can redraw on change
+        self.data_event = threading.Event()
+
     def connect_devices(self):
         """Connect to configured devices."""
+        # Deferred so menu paths that never connect skip the openant import
+        from ..devices.bike_sensor import BikeSensor
+        from ..devices.heart_rate_monitor import HeartRateMonitor
+
         network_key = self.config["ant_network"]["key"]
+        devices_cfg = self.config["devices"]
+        hr_cfg = devices_cfg["heart_rate"]
+        bike_cfg = devices_cfg["bike_data"]
         self.devices = []  # Reset devices list
+        pending = []  # (sensor, failure message) in display order
 
-        # Connect heart rate monitor
-        if (
-            self.config["devices"]["heart_rate"]["enabled"]
-            and self.config["devices"]["heart_rate"]["device_id"]
-        ):
-            hr_device_id = self.config["devices"]["heart_rate"]["device_id"]
-            self.hr_monitor = HeartRateMonitor(hr_device_id, network_key)
+        # Heart rate monitor
+        if hr_cfg["enabled"] and hr_cfg["device_id"]:
+            self.hr_monitor = HeartRateMonitor(hr_cfg["device_id"], network_key)
             self.hr_monitor.on_heart_rate_data = self._on_hr_data
+            pending.append((self.hr_monitor, "Failed to connect to heart rate monitor"))
 
-            if self.hr_monitor.connect():
-                self.devices.append(self.hr_monitor)
-            else:
-                print(
-                    f"{Fore.RED}Failed to connect to heart rate monitor{Style.RESET_ALL}"
-                )
-
-        # Connect bike sensor
-        if (
-            self.config["devices"]["bike_data"]["enabled"]
-            and self.config["devices"]["bike_data"]["device_id"]
-        ):
-            bike_device_id = self.config["devices"]["bike_data"]["device_id"]
-            self.bike_sensor = BikeSensor(bike_device_id, network_key)
+        # Bike sensor
+        if bike_cfg["enabled"] and bike_cfg["device_id"]:
+            self.bike_sensor = BikeSensor(bike_cfg["device_id"], network_key)
             self.bike_sensor.on_bike_data = self._on_bike_data
+            pending.append((self.bike_sensor, "Failed to connect to bike sensor"))
 
-            if self.bike_sensor.connect():
-                self.devices.append(self.bike_sensor)
+        # Connect one at a time: every Node() finds, resets and claims the same
+        # USB stick, so overlapping connects would race on the device
+        for sensor, failure_message in pending:
+            if sensor.connect():
+                self.devices.append(sensor)
             else:
-                print(f"{Fore.RED}Failed to connect to bike sensor{Style.RESET_ALL}")
+                print(f"{Fore.RED}{failure_message}{Style.RESET_ALL}")
 
     def _on_hr_data(self, data):
         """Callback for heart rate data."""
-        self.hr_data = data
+        self.hr_data.update(data)
+        self.data_event.set()
 
     def _on_bike_data(self, data):
         """Callback for bike sensor data."""
-        self.bike_data = data
+        self.bike_data.update(data)
+        self.data_event.set()
 
     def get_connected_devices(self):
         """Get list of connected devices."""
@@ -96,7 +98,7 @@ class DeviceManager:
 
     def has_connected_devices(self):
         """Check if any devices are connected."""
-        return len(self.get_connected_devices()) > 0
+        return any(d.connected for d in self.devices)
 
     def stop(self):
         """Stop the device manager and disconnect devices."""
@@ -107,3 +109,7 @@ class DeviceManager:
 
         if self.bike_sensor:
             self.bike_sensor.disconnect()
+
+        # Keep devices limited to live connections so the connected checks
+        # stay a scan of the sensors that are actually up
+        self.devices = []
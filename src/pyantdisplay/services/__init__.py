@@ -1,13 +1,16 @@
 """Service modules for business logic."""
 
-from .device_scan import DeviceScanService
-from .device_list import DeviceListService
-from .device_config import DeviceConfigurationService
-from .app_modes import AppModeService
-
-__all__ = [
-    "DeviceScanService",
-    "DeviceListService",
-    "DeviceConfigurationService",
-    "AppModeService",
-]
+from ..utils.lazy import lazy_exports
+
+# Resolved on first access (PEP 562); importing one service no longer loads
+# the scanner, MQTT and curses stacks pulled in by the others.
+_LAZY_EXPORTS = {
+    "DeviceScanService": ".device_scan",
+    "DeviceListService": ".device_list",
+    "DeviceConfigurationService": ".device_config",
+    "AppModeService": ".app_modes",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
@@ -25,21 +25,26 @@ SOFTWARE.
 Handles different application modes and their orchestration.
 """
 
-import json
-import time
 from typing import Optional
 
 from colorama import Fore, Style
 
-from .device_scanner import DeviceScanner
 from .config_manager import ConfigManager
 from ..managers.device_manager import DeviceManager
 from ..ui.menu_manager import MenuManager
-from ..ui.live_monitor import ANT_PLUS_NETWORK_KEY, LiveMonitor
-from .mqtt_monitor import MqttMonitor
+from ..utils.common import format_timestamp, load_found_devices, write_block
 from ..utils.config_loader import ConfigLoader
 from ..utils.usb_detector import ANTUSBDetector
 
+_CYAN = Fore.CYAN
+_GREEN = Fore.GREEN
+_RED = Fore.RED
+_YELLOW = Fore.YELLOW
+_RESET = Style.RESET_ALL
+
+
+_LIST_COLUMNS = f"{'ID':<8} {'Type':<6} {'Key':<15} {'Last Seen':<20}\n" + "-" * 60
+
 
 class AppModeService:
     """Handles different application modes and their orchestration."""
@@ -66,7 +71,7 @@ class AppModeService:
             menu_manager.show_menu()
 
         except KeyboardInterrupt:
-            print(f"\n{Fore.YELLOW}Application interrupted{Style.RESET_ALL}")
+            print(f"\n{_YELLOW}Application interrupted{_RESET}")
         finally:
             # Cleanup
             if "device_manager" in locals():
@@ -76,21 +81,22 @@ class AppModeService:
         self, app_config: str, local_config: Optional[str] = None, debug: bool = False
     ):
         """Run device scanning mode."""
+        from .device_scanner import DeviceScanner
+        from ..ui.live_monitor import ANT_PLUS_NETWORK_KEY
+
         cfg = self.config_loader.load_app_config(app_config, local_config)
         key = cfg.get("ant_network", {}).get("key", ANT_PLUS_NETWORK_KEY)
         timeout = cfg.get("app", {}).get("scan_timeout", 30)
         backend_pref = cfg.get("app", {}).get("backend", None)
         save_path = cfg.get("app", {}).get("found_devices_file", "found_devices.json")
 
-        print(f"{Fore.CYAN}ANT+ Device Scanner{Style.RESET_ALL}")
+        print(f"{_CYAN}ANT+ Device Scanner{_RESET}")
         scanner = DeviceScanner(
             key, scan_timeout=timeout, debug=debug, backend_preference=backend_pref
         )
         devices = scanner.scan_for_devices()
         scanner.save_found_devices(save_path)
-        print(
-            f"{Fore.GREEN}Saved {len(devices)} devices to {save_path}{Style.RESET_ALL}"
-        )
+        print(f"{_GREEN}Saved {len(devices)} devices to {save_path}{_RESET}")
 
     def run_list(self, app_config: str, local_config: Optional[str] = None):
         """List discovered devices."""
@@ -98,23 +104,24 @@ class AppModeService:
         save_path = cfg.get("app", {}).get("found_devices_file", "found_devices.json")
 
         try:
-            with open(save_path, "r") as f:
-                devices = json.load(f)
+            devices = load_found_devices(save_path)
         except FileNotFoundError:
-            print(f"{Fore.YELLOW}No device file found: {save_path}{Style.RESET_ALL}")
+            print(f"{_YELLOW}No device file found: {save_path}{_RESET}")
             return
         except Exception as e:
-            print(f"{Fore.RED}Error reading {save_path}: {e}{Style.RESET_ALL}")
+            print(f"{_RED}Error reading {save_path}: {e}{_RESET}")
             return
 
         if not devices:
-            print(f"{Fore.YELLOW}No devices in {save_path}{Style.RESET_ALL}")
+            print(f"{_YELLOW}No devices in {save_path}{_RESET}")
             return
 
         self._display_device_list(devices)
 
     def run_monitor(self, sensor_config: str, save_path: str, debug: bool = False):
         """Run live monitoring mode with curses dashboard."""
+        from ..ui.live_monitor import LiveMonitor
+
         mon = LiveMonitor(sensor_config, save_path, debug=debug)
         mon.run()
 
@@ -127,6 +134,8 @@ class AppModeService:
         debug: bool = False,
     ):
         """Run MQTT publishing mode."""
+        from .mqtt_monitor import MqttMonitor
+
         mon = MqttMonitor(
             sensor_config_path=sensor_config,
             save_path=save_path,
@@ -138,13 +147,14 @@ class AppModeService:
 
     def _display_device_list(self, devices: dict):
         """Display devices in a formatted list."""
-        print(f"\n{Fore.CYAN}Found ANT+ Devices ({len(devices)}){Style.RESET_ALL}")
-        print(f"{'ID':<8} {'Type':<6} {'Key':<15} {'Last Seen':<20}")
-        print("-" * 60)
+        lines = [
+            f"\n{_CYAN}Found ANT+ Devices ({len(devices)}){_RESET}",
+            _LIST_COLUMNS,
+        ]
         for k, v in devices.items():
-            last = time.strftime(
-                "%Y-%m-%d %H:%M:%S", time.localtime(v.get("last_seen", 0))
-            )
-            print(
+            last = format_timestamp(v.get("last_seen", 0))
+            lines.append(
                 f"{v.get('device_id', '-'):<8} {v.get('device_type', '-'):<6} {k:<15} {last:<20}"
             )
+        lines.append("")
+        write_block("\n".join(lines))
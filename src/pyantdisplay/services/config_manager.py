@@ -25,12 +25,36 @@ SOFTWARE.
 Handles configuration loading, saving, and device configuration.
 """
 
+import json
+import os
 import sys
+from typing import List, Optional
 
-import yaml
-from colorama import Fore, Style
+from colorama import Fore
 
 from ..services.device_config import DeviceConfigurationService
+from ..utils.common import cprint
+
+# Bump when the sidecar cache layout changes to invalidate old cache files
+_CONFIG_CACHE_VERSION = 1
+
+# (yaml module, loader class, dumper class), resolved on first use
+_YAML_CODEC = None
+
+
+def _yaml_codec():
+    """Import PyYAML and resolve its loader/dumper classes once per process."""
+    global _YAML_CODEC
+    if _YAML_CODEC is None:
+        import yaml
+
+        # Prefer the libyaml-backed C implementations when PyYAML was built with them
+        _YAML_CODEC = (
+            yaml,
+            getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+            getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        )
+    return _YAML_CODEC
 
 
 class ConfigManager:
@@ -38,36 +62,112 @@ class ConfigManager:
 
     def __init__(self, config_file: str = "config/config.yaml"):
         self.config_file = config_file
+        self.cache_file = f"{config_file}.cache.json"
+        self._last_serialized_config: Optional[str] = None
         self.config = self.load_config()
+        # Cheap fingerprint of the loaded config so no-op saves skip yaml.dump
+        self._config_hash = self._config_digest()
 
     def load_config(self) -> dict:
         """Load configuration from YAML file."""
         try:
-            with open(self.config_file, "r") as f:
-                config = yaml.safe_load(f)
-            print(
-                f"{Fore.GREEN}Loaded configuration from {self.config_file}{Style.RESET_ALL}"
-            )
+            signature = self._config_signature()
+            config = self._read_config_cache(signature)
+            if config is None:
+                # PyYAML is only imported when the JSON cache cannot be used
+                yaml, loader, _ = _yaml_codec()
+                with open(self.config_file, "r") as f:
+                    text = f.read()
+                config = yaml.load(text, Loader=loader)
+                # Remember on-disk content so unchanged saves can be skipped
+                self._last_serialized_config = text
+                self._write_config_cache(signature, config)
+            cprint(Fore.GREEN, f"Loaded configuration from {self.config_file}")
             return config
         except FileNotFoundError:
-            print(
-                f"{Fore.RED}Configuration file {self.config_file} not found{Style.RESET_ALL}"
-            )
+            cprint(Fore.RED, f"Configuration file {self.config_file} not found")
             sys.exit(1)
         except Exception as e:
-            print(f"{Fore.RED}Error loading configuration: {e}{Style.RESET_ALL}")
+            cprint(Fore.RED, f"Error loading configuration: {e}")
             sys.exit(1)
 
     def save_config(self):
         """Save current configuration to YAML file."""
         try:
-            with open(self.config_file, "w") as f:
-                yaml.dump(self.config, f, default_flow_style=False, indent=2)
-            print(
-                f"{Fore.GREEN}Configuration saved to {self.config_file}{Style.RESET_ALL}"
+            digest = self._config_digest()
+            if digest == self._config_hash:
+                cprint(Fore.GREEN, "Configuration unchanged, nothing to save")
+                return
+
+            yaml, _, dumper = _yaml_codec()
+            serialized = yaml.dump(
+                self.config, Dumper=dumper, default_flow_style=False, indent=2
             )
+            if serialized == self._last_serialized_config:
+                self._config_hash = digest
+                cprint(Fore.GREEN, "Configuration unchanged, nothing to save")
+                return
+
+            # Write to a sibling temp file and swap it in atomically
+            tmp_file = f"{self.config_file}.tmp"
+            with open(tmp_file, "w") as f:
+                f.write(serialized)
+            os.replace(tmp_file, self.config_file)
+            self._last_serialized_config = serialized
+            self._config_hash = digest
+            self._write_config_cache(self._config_signature(), self.config)
+            cprint(Fore.GREEN, f"Configuration saved to {self.config_file}")
         except Exception as e:
-            print(f"{Fore.RED}Error saving configuration: {e}{Style.RESET_ALL}")
+            cprint(Fore.RED, f"Error saving configuration: {e}")
+
+    def _config_digest(self) -> int:
+        """Return a hash of the in-memory config used to detect changes."""
+        return hash(repr(self.config))
+
+    def _config_signature(self) -> Optional[List[int]]:
+        """
+        Return the cache key (format version, mtime, size, inode) of the config
+        file. The inode catches editors that save by renaming a new file over
+        the old one, which can leave mtime and size unchanged.
+        """
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
+            return None
+        return [_CONFIG_CACHE_VERSION, st.st_mtime_ns, st.st_size, st.st_ino]
+
+    def _read_config_cache(self, signature: Optional[List[int]]) -> Optional[dict]:
+        """Return the cached parsed config if it matches the file signature."""
+        if signature is None:
+            return None
+        try:
+            with open(self.cache_file, "r") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("meta") != signature:
+            return None
+        return cached.get("config")
+
+    def _write_config_cache(self, signature: Optional[List[int]], config) -> None:
+        """
+        Persist the parsed config as JSON next to the YAML file. The sidecar
+        (and its .tmp) lands beside whatever --config path is given, so only
+        the repo's own config directory is covered by .gitignore.
+        """
+        if signature is None or config is None:
+            return
+        try:
+            encoded = json.dumps({"meta": signature, "config": config})
+            # Skip configs JSON cannot round-trip (e.g. non-string keys)
+            if json.loads(encoded)["config"] != config:
+                return
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, "w") as f:
+                f.write(encoded)
+            os.replace(tmp_file, self.cache_file)
+        except (OSError, TypeError, ValueError):
+            pass
 
     def configure_devices_interactive(self):
         """Interactive device configuration."""
@@ -25,10 +25,14 @@ SOFTWARE.
 Handles interactive device configuration and selection.
 """
 
-import json
-
 from colorama import Fore, Style
 
+from ..utils.common import load_found_devices
+
+# ANT+ device types offered for each configuration slot
+_HR_TYPE = 120
+_BIKE_TYPES = frozenset((121, 122, 123))
+
 
 class DeviceConfigurationService:
     """Handles interactive device configuration and selection."""
@@ -43,8 +47,7 @@ class DeviceConfigurationService:
         # Load found devices
         devices_file = self.config["app"]["found_devices_file"]
         try:
-            with open(devices_file, "r") as f:
-                found_devices = json.load(f)
+            found_devices = load_found_devices(devices_file)
         except FileNotFoundError:
             print(
                 f"{Fore.YELLOW}No found devices file. Run scan first.{Style.RESET_ALL}"
@@ -55,65 +58,72 @@ class DeviceConfigurationService:
             print(f"{Fore.YELLOW}No devices found. Run scan first.{Style.RESET_ALL}")
             return False
 
+        hr_devices, bike_devices = self._split_devices(found_devices)
+
         # Configure heart rate monitor
-        self._configure_heart_rate_monitor(found_devices)
+        self._configure_heart_rate_monitor(hr_devices)
 
         # Configure bike sensor
-        self._configure_bike_sensor(found_devices)
+        self._configure_bike_sensor(bike_devices)
 
         return True
 
-    def _configure_heart_rate_monitor(self, found_devices):
+    def _split_devices(self, found_devices):
+        """Split found devices into HR and bike lists in a single pass."""
+        hr_devices, bike_devices = [], []
+        for device in found_devices.values():
+            device_type = device["device_type"]
+            if device_type == _HR_TYPE:
+                hr_devices.append(device)
+            elif device_type in _BIKE_TYPES:
+                bike_devices.append(device)
+        return hr_devices, bike_devices
+
+    def _configure_heart_rate_monitor(self, hr_devices):
         """Configure heart rate monitor selection."""
         print(f"\n{Fore.GREEN}Heart Rate Monitors:{Style.RESET_ALL}")
-        hr_devices = {k: v for k, v in found_devices.items() if v["device_type"] == 120}
 
         if hr_devices:
-            for i, (key, device) in enumerate(hr_devices.items(), 1):
+            for i, device in enumerate(hr_devices, 1):
                 print(f"  {i}. {device['device_name']} (ID: {device['device_id']})")
 
             try:
                 choice = input(
                     f"\nSelect heart rate monitor (1-{len(hr_devices)}, 0 to skip): "
                 )
-                if choice != "0" and 1 <= int(choice) <= len(hr_devices):
-                    selected_device = list(hr_devices.values())[int(choice) - 1]
-                    self.config["devices"]["heart_rate"]["device_id"] = selected_device[
-                        "device_id"
-                    ]
-                    print(
-                        f"{Fore.GREEN}Selected heart rate monitor ID: {selected_device['device_id']}{Style.RESET_ALL}"
-                    )
+                if choice != "0":
+                    index = int(choice) - 1
+                    if 0 <= index < len(hr_devices):
+                        device_id = hr_devices[index]["device_id"]
+                        self.config["devices"]["heart_rate"]["device_id"] = device_id
+                        print(
+                            f"{Fore.GREEN}Selected heart rate monitor ID: {device_id}{Style.RESET_ALL}"
+                        )
             except (ValueError, IndexError):
                 print(f"{Fore.YELLOW}Invalid selection{Style.RESET_ALL}")
         else:
             print(f"  {Fore.YELLOW}No heart rate monitors found{Style.RESET_ALL}")
 
-    def _configure_bike_sensor(self, found_devices):
+    def _configure_bike_sensor(self, bike_devices):
         """Configure bike sensor selection."""
         print(f"\n{Fore.GREEN}Bike Sensors:{Style.RESET_ALL}")
-        bike_devices = {
-            k: v
-            for k, v in found_devices.items()
-            if v["device_type"] in [121, 122, 123]
-        }
 
         if bike_devices:
-            for i, (key, device) in enumerate(bike_devices.items(), 1):
+            for i, device in enumerate(bike_devices, 1):
                 print(f"  {i}. {device['device_name']} (ID: {device['device_id']})")
 
             try:
                 choice = input(
                     f"\nSelect bike sensor (1-{len(bike_devices)}, 0 to skip): "
                 )
-                if choice != "0" and 1 <= int(choice) <= len(bike_devices):
-                    selected_device = list(bike_devices.values())[int(choice) - 1]
-                    self.config["devices"]["bike_data"]["device_id"] = selected_device[
-                        "device_id"
-                    ]
-                    print(
-                        f"{Fore.GREEN}Selected bike sensor ID: {selected_device['device_id']}{Style.RESET_ALL}"
-                    )
+                if choice != "0":
+                    index = int(choice) - 1
+                    if 0 <= index < len(bike_devices):
+                        device_id = bike_devices[index]["device_id"]
+                        self.config["devices"]["bike_data"]["device_id"] = device_id
+                        print(
+                            f"{Fore.GREEN}Selected bike sensor ID: {device_id}{Style.RESET_ALL}"
+                        )
             except (ValueError, IndexError):
                 print(f"{Fore.YELLOW}Invalid selection{Style.RESET_ALL}")
         else:
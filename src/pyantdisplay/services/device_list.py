@@ -26,61 +26,67 @@ Handles device listing and display operations.
 """
 
 import json
-import time
 
 from colorama import Fore, Style
 
+from ..utils.common import format_timestamp, load_found_devices, write_block
+
+_CYAN = Fore.CYAN
+_RED = Fore.RED
+_YELLOW = Fore.YELLOW
+_RESET = Style.RESET_ALL
+
+
+_TABLE_HEADER = "\n".join(
+    (
+        f"\n{_CYAN}=== Found ANT+ Devices ==={_RESET}",
+        f"{'ID':<8} {'Type':<6} {'Name':<25} {'Last Seen':<20}",
+        "-" * 70,
+    )
+)
+
 
 class DeviceListService:
     """Handles device listing and display operations."""
 
     def __init__(self, config: dict):
         self.config = config
+        self._devices_file = config["app"]["found_devices_file"]
 
     def list_found_devices(self):
         """Display list of found devices."""
-        devices_file = self.config["app"]["found_devices_file"]
+        devices_file = self._devices_file
 
         try:
-            with open(devices_file, "r") as f:
-                devices = json.load(f)
+            devices = load_found_devices(devices_file)
         except FileNotFoundError:
-            print(
-                f"{Fore.YELLOW}No found devices file. Run scan first.{Style.RESET_ALL}"
-            )
+            print(f"{_YELLOW}No found devices file. Run scan first.{_RESET}")
             return
         except Exception as e:
-            print(f"{Fore.RED}Error loading found devices: {e}{Style.RESET_ALL}")
+            print(f"{_RED}Error loading found devices: {e}{_RESET}")
             return
 
         if not devices:
-            print(f"{Fore.YELLOW}No devices found in {devices_file}{Style.RESET_ALL}")
+            print(f"{_YELLOW}No devices found in {devices_file}{_RESET}")
             return
 
         self._display_devices_table(devices)
 
     def _display_devices_table(self, devices: dict):
         """Display devices in a formatted table."""
-        print(f"\n{Fore.CYAN}=== Found ANT+ Devices ==={Style.RESET_ALL}")
-        print(f"{'ID':<8} {'Type':<6} {'Name':<25} {'Last Seen':<20}")
-        print("-" * 70)
-
-        for key, device in devices.items():
-            last_seen = time.strftime(
-                "%Y-%m-%d %H:%M:%S", time.localtime(device["last_seen"])
-            )
-            print(
+        lines = [_TABLE_HEADER]
+        for device in devices.values():
+            last_seen = format_timestamp(device["last_seen"])
+            lines.append(
                 f"{device['device_id']:<8} {device['device_type']:<6} "
                 f"{device['device_name']:<25} {last_seen}"
             )
+        lines.append("")
+        write_block("\n".join(lines))
 
     def get_device_count(self) -> int:
         """Get the count of found devices."""
-        devices_file = self.config["app"]["found_devices_file"]
-
         try:
-            with open(devices_file, "r") as f:
-                devices = json.load(f)
-            return len(devices)
+            return len(load_found_devices(self._devices_file))
         except (FileNotFoundError, json.JSONDecodeError):
             return 0
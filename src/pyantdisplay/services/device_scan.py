@@ -25,44 +25,50 @@ SOFTWARE.
 Handles ANT+ device scanning operations.
 """
 
+from typing import Optional
+
 from colorama import Fore, Style
 
 from .device_scanner import DeviceScanner
 
+_CYAN = Fore.CYAN
+_RESET = Style.RESET_ALL
+
 
 class DeviceScanService:
     """Handles ANT+ device scanning operations."""
 
     def __init__(self, config: dict):
         self.config = config
+        app_config = config["app"]
+        self._network_key = config["ant_network"]["key"]
+        self._scan_timeout = app_config["scan_timeout"]
+        self._backend_pref = app_config.get("backend", None)
+        self._devices_file = app_config["found_devices_file"]
+        # Created on the first scan and reused for later ones
+        self._scanner: Optional[DeviceScanner] = None
 
     def scan_for_devices(self) -> dict:
         """Scan for ANT+ devices and save to file."""
-        print(f"\n{Fore.CYAN}=== ANT+ Device Scanner ==={Style.RESET_ALL}")
-
-        network_key = self.config["ant_network"]["key"]
-        scan_timeout = self.config["app"]["scan_timeout"]
-        backend_pref = self.config.get("app", {}).get("backend", None)
-
-        # Keep scanner output concise unless explicitly debugging
-        scanner = DeviceScanner(
-            network_key, scan_timeout, debug=False, backend_preference=backend_pref
-        )
+        print(f"\n{_CYAN}=== ANT+ Device Scanner ==={_RESET}")
+
+        scanner = self._scanner
+        if scanner is None:
+            # Keep scanner output concise unless explicitly debugging
+            scanner = self._scanner = DeviceScanner(
+                self._network_key,
+                self._scan_timeout,
+                debug=False,
+                backend_preference=self._backend_pref,
+            )
+        else:
+            scanner.reset_results()
 
         print("Make sure your ANT+ devices are active and transmitting...")
         print("Starting scan...")
 
-        # Load previously found devices
-        devices_file = self.config["app"]["found_devices_file"]
-        found_devices = scanner.load_found_devices(devices_file)
-
         # Scan for new devices
-        new_devices = scanner.scan_for_devices()
-
-        # Merge with existing devices
-        found_devices.update(new_devices)
-
-        # Save updated device list
-        scanner.save_found_devices(devices_file)
+        scanner.scan_for_devices()
 
-        return found_devices
+        # Merge into the saved device list in one pass and return the result
+        return scanner.save_found_devices(self._devices_file)
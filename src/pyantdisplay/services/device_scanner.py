@@ -26,7 +26,6 @@ ANT+ Device Scanner
 Scans for available ANT+ devices and saves them to a configuration file.
 """
 
-import json
 import logging
 import threading
 import time
@@ -36,7 +35,13 @@ import colorama
 from colorama import Fore, Style
 
 from ..core.ant_backend import AntBackend, ChannelType
-from ..utils.common import deep_merge_save, load_manufacturers, parse_common_pages
+from ..utils.common import (
+    deep_merge_save,
+    load_found_devices,
+    load_manufacturers,
+    parse_common_pages,
+    write_found_devices,
+)
 from ..utils.usb_detector import ANTUSBDetector
 
 colorama.init()
@@ -85,6 +90,10 @@ class DeviceScanner:
                 f"{Fore.BLUE}[DEBUG] Using ANT backend: {self.backend.name}{Style.RESET_ALL}"
             )
 
+    def reset_results(self):
+        """Forget devices from a previous scan so the scanner can be reused."""
+        self.found_devices = {}
+
     def scan_for_devices(self) -> Dict:
         """Scan for ANT+ devices and return a dictionary of found devices."""
         print(
@@ -458,32 +467,41 @@ class DeviceScanner:
                 )
                 traceback.print_exc()
 
-    def save_found_devices(self, filename: str):
-        """Save found devices to a JSON file."""
+    def save_found_devices(self, filename: str) -> Dict:
+        """Merge found devices into a JSON file and return the merged devices."""
+        merged = dict(self.found_devices or {})
         try:
-            # Load existing devices (if any) and merge updates
+            # Load existing devices (if any) at save time so records written
+            # by other tools during the scan are kept
             try:
-                with open(filename, "r") as f:
-                    existing = json.load(f)
+                existing = load_found_devices(filename)
             except FileNotFoundError:
-                existing = {}
+                existing = None
 
-            merged = existing.copy()
-            merged.update(self.found_devices or {})
+            if existing is not None:
+                merged = {**existing, **merged}
+                if merged == existing:
+                    # Nothing new was seen; leave the file (and its cache
+                    # signature) untouched
+                    print(
+                        f"{Fore.GREEN}{filename} is up to date "
+                        f"({len(merged)} devices){Style.RESET_ALL}"
+                    )
+                    return merged
 
-            with open(filename, "w") as f:
-                json.dump(merged, f, indent=2)
+            write_found_devices(filename, merged)
             print(
                 f"{Fore.GREEN}Saved {len(merged)} devices to {filename}{Style.RESET_ALL}"
             )
         except Exception as e:
             print(f"{Fore.RED}Error saving devices: {e}{Style.RESET_ALL}")
+        return merged
 
     def load_found_devices(self, filename: str) -> Dict:
         """Load previously found devices from a JSON file."""
         try:
-            with open(filename, "r") as f:
-                devices = json.load(f)
+            # Copy so callers can merge into it without touching the shared cache
+            devices = dict(load_found_devices(filename))
             print(
                 f"{Fore.GREEN}Loaded {len(devices)} devices from {filename}{Style.RESET_ALL}"
             )
@@ -27,15 +27,34 @@ MQTT publishing monitor for Home Assistant integration.
 
 import json
 import logging
+import os
+import socket
 import sys
 import threading
 import time
-from typing import Dict, List, Optional
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import yaml
 from colorama import Fore, Style
 
-from ..utils.common import deep_merge_save, load_manufacturers, parse_common_pages
+from ..utils.common import (
+    CHANNEL_PERIODS,
+    deep_merge_save,
+    load_manufacturers,
+    parse_common_pages_cached,
+)
 
 try:
     from openant.easy.channel import Channel
@@ -49,8 +68,174 @@ try:
 except ImportError:
     mqtt = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml-backed parser when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# path -> ((mtime, size, inode), parsed document); parsed configs are shared
+# between monitors and only ever read
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int, int], dict]] = {}
+_YAML_CACHE_LOCK = threading.Lock()
+
+# (base path, local path) -> (base document, local document, merged config)
+_MERGED_CACHE: Dict[Tuple[str, str], Tuple[dict, dict, dict]] = {}
+
+
+def _merge_config(base: dict, override: dict) -> dict:
+    """
+    Deep-merge override into a copy of base. Only the dicts on the override's
+    paths are copied, so the (cached, shared) inputs are never modified.
+    """
+    out = dict(base)
+    stack = [(out, override)]
+    while stack:
+        target, updates = stack.pop()
+        for k, v in updates.items():
+            cur = target.get(k)
+            if type(v) is dict and type(cur) is dict:
+                target[k] = nested = dict(cur)
+                stack.append((nested, v))
+            else:
+                target[k] = v
+    return out
+
+
+# paho accepts bytes payloads, so orjson output is published as-is
+_discovery_dumps = orjson.dumps if orjson is not None else json.dumps
+
+# Home Assistant sensors: (metric, _UserRecord field that enables it, name,
+# unit, device_class, icon)
+_DISCOVERY_ENTITIES = (
+    ("hr", "hr_ids", "Heart Rate", "bpm", None, "mdi:heart"),
+    ("speed", "speed_id", "Speed", "km/h", None, "mdi:speedometer"),
+    ("cadence", "cadence_id", "Cadence", "rpm", None, "mdi:timer-sync"),
+    ("power", "power_id", "Power", "W", "power", "mdi:flash"),
+)
+
 ANT_PLUS_NETWORK_KEY = [0xB9, 0xA5, 0x21, 0xFB, 0xBD, 0x72, 0xC3, 0x45]
 
+# paho client limits: the default window of 20 unacknowledged QoS 1 messages
+# throttles bursts of small publishes, and the default queue is unbounded
+_MQTT_MAX_INFLIGHT = 200
+_MQTT_MAX_QUEUED = 10000
+
+# Per-device change bits: which metrics got a new value since the last pass
+_HR_BIT = 1 << 0
+_SPEED_BIT = 1 << 1
+_CADENCE_BIT = 1 << 2
+_POWER_BIT = 1 << 3
+_ALL_BITS = _HR_BIT | _SPEED_BIT | _CADENCE_BIT | _POWER_BIT
+
+# Seconds between channel ID requests / periodic device record saves
+_META_INTERVAL_SECS = 30.0
+
+
+def _fmt_int(value) -> str:
+    return str(int(value))
+
+
+def _fmt_speed(value) -> str:
+    return f"{float(value):.2f}"
+
+
+# (metric key, log label, payload formatter) in publish order
+_METRIC_SPECS = (
+    ("hr", "HR", _fmt_int),
+    ("speed", "speed", _fmt_speed),
+    ("cadence", "cadence", _fmt_int),
+    ("power", "power", _fmt_int),
+)
+_METRIC_KEYS = tuple(spec[0] for spec in _METRIC_SPECS)
+
+
+def _decode_bike(
+    evt_time: int,
+    revs: int,
+    last_time: int,
+    last_revs: int,
+    circ: float,
+    want_speed: bool,
+    want_cadence: bool,
+) -> Tuple[Optional[float], Optional[float]]:
+    """Speed (km/h) and cadence (rpm) from two successive event time/rev pairs."""
+    dt_ticks = (evt_time - last_time) & 0xFFFF
+    if not dt_ticks:
+        return None, None
+    sec = dt_ticks / 1024.0
+    d_revs = (revs - last_revs) & 0xFFFF
+    speed = d_revs * circ / sec * 3.6 if want_speed else None
+    cadence = d_revs / sec * 60.0 if want_cadence else None
+    return speed, cadence
+
+
+class _UserTopics(NamedTuple):
+    """Fully qualified MQTT topics for one user, built once per user."""
+
+    # Metric topics first, in _METRIC_SPECS order, so the two zip together
+    hr: str
+    speed: str
+    cadence: str
+    power: str
+    availability: str
+
+
+class _DeviceState:
+    """Latest decoded readings for one channel device."""
+
+    __slots__ = (
+        "device_id",
+        "device_type",
+        "label",
+        "ts",
+        "evt_time",
+        "revs",
+        "hr",
+        "speed",
+        "cadence",
+        "power",
+    )
+
+    def __init__(self, device_id: int, device_type: int, label: str):
+        self.device_id = device_id
+        self.device_type = device_type
+        self.label = label
+        self.ts: Optional[float] = None
+        self.evt_time: Optional[int] = None
+        self.revs: Optional[int] = None
+        self.hr: Optional[int] = None
+        self.speed: Optional[float] = None
+        self.cadence: Optional[float] = None
+        self.power: Optional[int] = None
+
+
+def _new_user_values() -> Dict[str, Optional[float]]:
+    return {"hr": None, "speed": None, "cadence": None, "power": None, "updated": 0}
+
+
+class _UserRecord(NamedTuple):
+    """A sensor_map user with its device IDs resolved once at startup."""
+
+    name: Optional[str]
+    hr_ids: Tuple[int, ...]
+    speed_id: Optional[int]
+    cadence_id: Optional[int]
+    power_id: Optional[int]
+    device_ids: FrozenSet[int]
+
+
+def _user_hr_ids(user: dict) -> Tuple[int, ...]:
+    # Support both old single hr_device_id and new hr_device_ids list
+    hr_ids = user.get("hr_device_ids", [])
+    if not hr_ids:  # Fallback to old format
+        old_hr_id = user.get("hr_device_id")
+        if old_hr_id:
+            hr_ids = [old_hr_id]
+    return tuple(hr_ids)
+
 
 def configure_logging(debug: bool):
     logging.basicConfig(
@@ -88,21 +273,44 @@ class MqttMonitor:
         self.app_config = self._merge_yaml(
             self.app_config_path, self.local_app_config_path
         )
+        self._build_user_tables()
+        # Static for the monitor's lifetime; read once for the bike decoders
+        self._circ_m = float(self.sensor_config.get("wheel_circumference_m", 2.105))
         self.node: Optional[Node] = None
         self.loop_thread: Optional[threading.Thread] = None
         self.channels: List[Channel] = []
 
-        # Device and user state
+        # Device and user state. Channel callbacks only append to _events; the
+        # run() thread drains it and alone mutates device and user state. The
+        # lock guards the publish queue and availability against stop().
         self.lock = threading.Lock()
-        self.device_values: Dict[int, Dict] = {}
+        self._events: Deque[Tuple[Callable[[Any, float], None], Any, float]] = deque()
+        # Device ID -> position in _devices, registered as channels open
+        self._device_index: Dict[int, int] = {}
+        self._devices: List[_DeviceState] = []
         self.user_values: Dict[str, Dict] = {}
         self.last_hr_active_user: Optional[str] = None
         self.stop_event = threading.Event()
-        self.last_save_times: Dict[str, float] = {}
+        # Set by channel callbacks so run() publishes as soon as data arrives
+        self._wakeup = threading.Event()
+        # Per channel device: when its channel ID was last requested, and the
+        # (device number, device type, transmission type) it returned
+        self._last_meta_req: Dict[int, float] = {}
+        self._channel_ids: Dict[int, Tuple[int, int, int]] = {}
         self.last_published_values: Dict[
             str, Dict[str, Optional[float]]
         ] = {}  # Track last published values
         self.last_availability: Dict[str, bool] = {}  # Track last availability state
+        # Devices heard since the last assignment pass, mapped to the change
+        # bits of the metrics whose value moved, and users whose values changed
+        # since the last publish pass (both owned by the run thread)
+        self._dirty_devices: Dict[int, int] = {}
+        self._dirty_users: Set[str] = set()
+        # (topic, payload, retain) queued by run() and sent back to back by
+        # _flush_publishes
+        self._pending_pubs: List[Tuple[str, str, bool]] = []
+        # Per-user topic strings, built on first use (seeded at channel open)
+        self._user_topics: Dict[str, _UserTopics] = {}
         self.manufacturer_map: Dict[int, str] = load_manufacturers()
 
         # MQTT config
@@ -122,31 +330,91 @@ class MqttMonitor:
         self.discovery_prefix = str(mqtt_cfg.get("discovery_prefix", "homeassistant"))
         self.mqtt_client = None
 
+    def _build_user_tables(self):
+        """Resolve sensor_map users and shared sensors into lookup tables."""
+        sensor_map = (
+            self.sensor_config.get("sensor_map", {})
+            if isinstance(self.sensor_config, dict)
+            else {}
+        )
+        records = []
+        for user in sensor_map.get("users", []):
+            hr_ids = _user_hr_ids(user)
+            bike_ids = (
+                user.get("speed_device_id"),
+                user.get("cadence_device_id"),
+                user.get("power_device_id"),
+            )
+            device_ids = frozenset(i for i in hr_ids + bike_ids if i)
+            records.append(_UserRecord(user.get("name"), hr_ids, *bike_ids, device_ids))
+        self._user_records = tuple(records)
+        # First record wins for a repeated name, as the old linear search did
+        self._user_by_name: Dict[str, _UserRecord] = {}
+        for rec in self._user_records:
+            if rec.name:
+                self._user_by_name.setdefault(rec.name, rec)
+        # User -> serialized discovery messages, built on first publish
+        self._discovery_cache: Dict[str, List[Tuple[str, str, Any]]] = {}
+        # First user listing an HR strap owns it
+        self._hr_owner: Dict[int, Optional[str]] = {}
+        for rec in self._user_records:
+            for hr_id in rec.hr_ids:
+                self._hr_owner.setdefault(hr_id, rec.name)
+
+        wattbike = sensor_map.get("wattbike", {})
+        self._wattbike_ids: Optional[Tuple[Optional[int], ...]] = (
+            (
+                wattbike.get("speed_device_id"),
+                wattbike.get("cadence_device_id"),
+                wattbike.get("power_device_id"),
+            )
+            if wattbike
+            else None
+        )
+        # New HR data can move the wattbike to another rider, so HR straps
+        # count as wattbike inputs too
+        self._wattbike_inputs: FrozenSet[int] = (
+            frozenset(i for i in self._wattbike_ids if i).union(self._hr_owner)
+            if self._wattbike_ids
+            else frozenset()
+        )
+
     def _load_yaml(self, path: str) -> dict:
+        try:
+            st = os.stat(path)
+            signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            signature = None
+        if signature is not None:
+            with _YAML_CACHE_LOCK:
+                cached = _YAML_CACHE.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
         try:
             with open(path, "r") as f:
-                return yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YamlLoader) or {}
         except Exception:
             return {}
+        if signature is not None:
+            with _YAML_CACHE_LOCK:
+                _YAML_CACHE[path] = (signature, data)
+        return data
 
     def _merge_yaml(self, base_path: str, local_path: Optional[str]) -> dict:
         base = self._load_yaml(base_path)
         if local_path:
             try:
-                with open(local_path, "r") as f:
-                    local = yaml.safe_load(f) or {}
-
-                # shallow merge is sufficient for our config structure
-                def _deep(a, b):
-                    out = dict(a)
-                    for k, v in (b or {}).items():
-                        if isinstance(v, dict) and isinstance(out.get(k), dict):
-                            out[k] = _deep(out[k], v)
-                        else:
-                            out[k] = v
-                    return out
-
-                base = _deep(base, local)
+                local = self._load_yaml(local_path)
+                key = (base_path, local_path)
+                with _YAML_CACHE_LOCK:
+                    cached = _MERGED_CACHE.get(key)
+                # Both documents came back from the parse cache unchanged
+                if cached is not None and cached[0] is base and cached[1] is local:
+                    return cached[2]
+                merged = _merge_config(base, local)
+                with _YAML_CACHE_LOCK:
+                    _MERGED_CACHE[key] = (base, local, merged)
+                base = merged
             except Exception:
                 pass
         return base
@@ -158,6 +426,11 @@ class MqttMonitor:
             )
             sys.exit(1)
         self.mqtt_client = mqtt.Client(client_id=self.client_id, clean_session=True)
+        # Many small QoS 1 publishes per cycle: keep more PUBACKs outstanding,
+        # but bound the queue so a broker outage cannot grow it forever
+        self.mqtt_client.max_inflight_messages_set(_MQTT_MAX_INFLIGHT)
+        self.mqtt_client.max_queued_messages_set(_MQTT_MAX_QUEUED)
+        self.mqtt_client.on_connect = self._on_mqtt_connect
         if self.mqtt_username:
             self.mqtt_client.username_pw_set(self.mqtt_username, self.mqtt_password)
         logging.info(f"Connecting to MQTT broker {self.mqtt_host}:{self.mqtt_port}")
@@ -165,29 +438,60 @@ class MqttMonitor:
         self.mqtt_client.loop_start()
         logging.info("MQTT connected")
 
-    def _publish(self, topic: str, payload: str):
-        full = f"{self.base_topic}/{topic}"
+    def _on_mqtt_connect(self, client, userdata, flags, rc, properties=None):
+        # Runs on every (re)connect, each of which opens a new socket; disable
+        # Nagle so small publishes are not held back waiting to coalesce
         try:
-            self.mqtt_client.publish(
-                full, payload=payload, qos=self.qos, retain=self.retain
-            )
-        except Exception:
+            client.socket().setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError):
             pass
 
+    def _user_topics_for(self, user: str) -> _UserTopics:
+        topics = self._user_topics.get(user)
+        if topics is None:
+            prefix = f"{self.base_topic}/users/{user}/"
+            topics = self._user_topics[user] = _UserTopics._make(
+                (*(prefix + key for key in _METRIC_KEYS), prefix + "availability")
+            )
+        return topics
+
+    def _publish_raw(self, full: str, payload: str):
+        self._pending_pubs.append((full, payload, self.retain))
+
+    def _flush_publishes(self):
+        """Send the publishes queued since the last flush back to back."""
+        with self.lock:
+            pending, self._pending_pubs = self._pending_pubs, []
+        publish = self.mqtt_client.publish
+        qos = self.qos
+        for full, payload, retain in pending:
+            try:
+                publish(full, payload=payload, qos=qos, retain=retain)
+            except Exception:
+                pass
+
     def _publish_discovery_for_user(self, user: str):
         if not self.discovery_enabled:
             return
 
-        # Find user configuration to determine which devices they have
-        user_config = None
-        for u in self.sensor_config.get("sensor_map", {}).get("users", []):
-            if u.get("name") == user:
-                user_config = u
-                break
+        messages = self._discovery_cache.get(user)
+        if messages is None:
+            rec = self._user_by_name.get(user)
+            if rec is None:
+                return
+            messages = self._discovery_cache[user] = self._build_discovery(rec)
 
-        if not user_config:
-            return
+        publish = self.mqtt_client.publish
+        for metric, topic, payload in messages:
+            try:
+                publish(topic, payload=payload, qos=1, retain=True)
+                logging.info(f"Published HA discovery for '{user}' {metric}")
+            except Exception:
+                pass
 
+    def _build_discovery(self, rec: _UserRecord) -> List[Tuple[str, str, Any]]:
+        """Serialize the (metric, topic, payload) discovery configs of a user."""
+        user = rec.name
         # Common device block
         device = {
             "identifiers": [f"pyantdisplay_user_{user}"],
@@ -195,140 +499,61 @@ class MqttMonitor:
             "model": "ANT+ Monitor",
             "name": f"PyANTDisplay {user}",
         }
-
+        # Fields shared by every entity of this user
+        user_topic = f"{self.base_topic}/users/{user}"
+        shared = {
+            "availability_topic": f"{user_topic}/availability",
+            "payload_available": "online",
+            "payload_not_available": "offline",
+            "qos": self.qos,
+            "device": device,
+            "retain": self.retain,
+        }
+        messages = []
         # Only create entities for configured devices
-        entities = []
-
-        # HR - check for hr_device_ids or hr_device_id (old format)
-        hr_ids = user_config.get("hr_device_ids", [])
-        if not hr_ids:  # Fallback to old format
-            old_hr_id = user_config.get("hr_device_id")
-            if old_hr_id:
-                hr_ids = [old_hr_id]
-        if hr_ids:
-            entities.append(
-                {
-                    "metric": "hr",
-                    "name": f"{user} Heart Rate",
-                    "unit": "bpm",
-                    "state_class": "measurement",
-                    "icon": "mdi:heart",
-                }
-            )
-
-        # Speed
-        if user_config.get("speed_device_id"):
-            entities.append(
-                {
-                    "metric": "speed",
-                    "name": f"{user} Speed",
-                    "unit": "km/h",
-                    "state_class": "measurement",
-                    "icon": "mdi:speedometer",
-                }
-            )
-
-        # Cadence
-        if user_config.get("cadence_device_id"):
-            entities.append(
-                {
-                    "metric": "cadence",
-                    "name": f"{user} Cadence",
-                    "unit": "rpm",
-                    "state_class": "measurement",
-                    "icon": "mdi:timer-sync",
-                }
-            )
-
-        # Power
-        if user_config.get("power_device_id"):
-            entities.append(
-                {
-                    "metric": "power",
-                    "name": f"{user} Power",
-                    "unit": "W",
-                    "device_class": "power",
-                    "state_class": "measurement",
-                    "icon": "mdi:flash",
-                }
-            )
-        for ent in entities:
-            obj_id = f"pyantdisplay_{user}_{ent['metric']}"
-            state_topic = f"{self.base_topic}/users/{user}/{ent['metric']}"
-            avail_topic = f"{self.base_topic}/users/{user}/availability"
+        for metric, field, name, unit, device_class, icon in _DISCOVERY_ENTITIES:
+            if not getattr(rec, field):
+                continue
+            obj_id = f"pyantdisplay_{user}_{metric}"
             payload = {
-                "name": ent["name"],
+                "name": f"{user} {name}",
                 "unique_id": obj_id,
-                "state_topic": state_topic,
-                "availability_topic": avail_topic,
-                "payload_available": "online",
-                "payload_not_available": "offline",
-                "qos": self.qos,
-                "device": device,
-                "retain": self.retain,
-                "unit_of_measurement": ent["unit"],
-                "icon": ent.get("icon"),
+                "state_topic": f"{user_topic}/{metric}",
+                **shared,
+                "unit_of_measurement": unit,
+                "icon": icon,
             }
-            if ent.get("device_class"):
-                payload["device_class"] = ent["device_class"]
-            if ent.get("state_class"):
-                payload["state_class"] = ent["state_class"]
+            if device_class:
+                payload["device_class"] = device_class
+            payload["state_class"] = "measurement"
             topic = f"{self.discovery_prefix}/sensor/{obj_id}/config"
-            try:
-                self.mqtt_client.publish(
-                    topic, payload=json.dumps(payload), qos=1, retain=True
-                )
-                logging.info(f"Published HA discovery for '{user}' {ent['metric']}")
-            except Exception:
-                pass
+            messages.append((metric, topic, _discovery_dumps(payload)))
+        return messages
 
     def _availability(self, user: str, online: bool):
         # Only publish availability changes
         if self.last_availability.get(user) != online:
             state = "online" if online else "offline"
             # Use retain=True for availability so HA gets state after restart
-            try:
-                full = f"{self.base_topic}/users/{user}/availability"
-                self.mqtt_client.publish(full, payload=state, qos=self.qos, retain=True)
-                logging.info(f"Availability for '{user}': {state}")
-                self.last_availability[user] = online
-            except Exception:
-                pass
+            full = self._user_topics_for(user).availability
+            self._pending_pubs.append((full, state, True))
+            logging.info(f"Availability for '{user}': {state}")
+            self.last_availability[user] = online
 
     def _publish_user_metrics(self, user: str, vals: Dict[str, Optional[float]]):
         # Only publish values that have changed
-        last_vals = self.last_published_values.get(user, {})
-
-        # Check each metric for changes
-        if vals.get("hr") is not None and vals.get("hr") != last_vals.get("hr"):
-            self._publish(f"users/{user}/hr", str(int(vals["hr"])))
-            logging.info(f"Published HR update for user '{user}'")
-
-        if vals.get("speed") is not None and vals.get("speed") != last_vals.get(
-            "speed"
-        ):
-            self._publish(f"users/{user}/speed", f"{float(vals['speed']):.2f}")
-            logging.info(f"Published speed update for user '{user}'")
-
-        if vals.get("cadence") is not None and vals.get("cadence") != last_vals.get(
-            "cadence"
-        ):
-            self._publish(f"users/{user}/cadence", str(int(vals["cadence"])))
-            logging.info(f"Published cadence update for user '{user}'")
-
-        if vals.get("power") is not None and vals.get("power") != last_vals.get(
-            "power"
-        ):
-            self._publish(f"users/{user}/power", str(int(vals["power"])))
-            logging.info(f"Published power update for user '{user}'")
-
-        # Update last published values
-        self.last_published_values[user] = {
-            "hr": vals.get("hr"),
-            "speed": vals.get("speed"),
-            "cadence": vals.get("cadence"),
-            "power": vals.get("power"),
-        }
+        last_vals = self.last_published_values.get(user)
+        if last_vals is None:
+            last_vals = self.last_published_values[user] = dict.fromkeys(_METRIC_KEYS)
+
+        topics = self._user_topics_for(user)
+        for (key, label, fmt), topic in zip(_METRIC_SPECS, topics):
+            value = vals.get(key)
+            if value is not None and value != last_vals[key]:
+                self._publish_raw(topic, fmt(value))
+                logging.info(f"Published {label} update for user '{user}'")
+            # Track every value, None included, as the last published state
+            last_vals[key] = value
 
     def start(self):
         # MQTT first
@@ -345,15 +570,15 @@ class MqttMonitor:
         self._open_configured_channels()
         # Publish discovery for known users
         try:
-            for user in self.sensor_config.get("sensor_map", {}).get("users", []):
-                name = user.get("name")
-                if name:
-                    self._publish_discovery_for_user(name)
+            for rec in self._user_records:
+                if rec.name:
+                    self._publish_discovery_for_user(rec.name)
         except Exception:
             pass
 
     def stop(self):
         self.stop_event.set()
+        self._wakeup.set()
         try:
             for ch in self.channels:
                 try:
@@ -370,8 +595,10 @@ class MqttMonitor:
             if self.mqtt_client:
                 try:
                     # Mark users offline
-                    for user in list(self.user_values.keys()):
-                        self._availability(user, False)
+                    with self.lock:
+                        for user in list(self.user_values.keys()):
+                            self._availability(user, False)
+                    self._flush_publishes()
                     self.mqtt_client.loop_stop()
                     self.mqtt_client.disconnect()
                 except Exception:
@@ -380,102 +607,30 @@ class MqttMonitor:
 
     def _open_channel(self, device_id: int, device_type: int, label: str):
         ch = self.node.new_channel(Channel.Type.BIDIRECTIONAL_RECEIVE)
+        # device_type is fixed per channel, so pick its decoder once here
+        state = self._device_state(device_id, device_type, label)
+        if device_type == 120:
+            apply = self._make_hr_apply(state)
+        elif device_type in (121, 122, 123):
+            apply = self._make_bike_apply(state)
+        elif device_type == 11:
+            apply = self._make_power_apply(state)
+        else:
+            apply = self._make_unknown_apply(state)
+        append = self._events.append
+        wakeup = self._wakeup
 
         def on_broadcast(data):
-            with self.lock:
-                parsed = None
-                if device_type == 120:
-                    try:
-                        hr = data[7]
-                        parsed = {"type": "hr", "hr": hr, "ts": time.time()}
-                    except Exception:
-                        parsed = {"type": "hr", "ts": time.time()}
-                elif device_type in (121, 123, 122):
-                    try:
-                        evt_time = data[4] | (data[5] << 8)
-                        revs = data[6] | (data[7] << 8)
-                        prev = self.device_values.get(device_id, {})
-                        last_time = prev.get("evt_time")
-                        last_revs = prev.get("revs")
-                        speed = None
-                        cadence = None
-                        if last_time is not None and last_revs is not None:
-                            dt_ticks = (evt_time - last_time) & 0xFFFF
-                            d_revs = (revs - last_revs) & 0xFFFF
-                            sec = dt_ticks / 1024.0 if dt_ticks > 0 else 0.0
-                            if sec > 0 and d_revs >= 0:
-                                circ = self.sensor_config.get(
-                                    "wheel_circumference_m", 2.105
-                                )
-                                if device_type == 123 or device_type == 121:
-                                    mps = (d_revs * circ) / sec
-                                    speed = mps * 3.6
-                                if device_type == 122 or device_type == 121:
-                                    cadence = (d_revs / sec) * 60.0
-                        parsed = {
-                            "type": "bike",
-                            "speed": speed,
-                            "cadence": cadence,
-                            "evt_time": evt_time,
-                            "revs": revs,
-                            "ts": time.time(),
-                        }
-                    except Exception:
-                        parsed = {"type": "bike", "ts": time.time()}
-                elif device_type == 11:
-                    try:
-                        power = (data[7] | (data[8] << 8)) if len(data) >= 9 else None
-                        parsed = {"type": "power", "power": power, "ts": time.time()}
-                    except Exception:
-                        parsed = {"type": "power", "ts": time.time()}
-                else:
-                    parsed = {"type": "unknown", "ts": time.time()}
-
-                dv = self.device_values.get(device_id, {})
-                first = not dv
-                dv.update(parsed)
-                dv["label"] = label
-                dv["device_type"] = device_type
-                dv["device_id"] = device_id
-                self.device_values[device_id] = dv
-
-                # First data event
-                if first:
-                    logging.info(
-                        f"First data received for device '{label}' (ID={device_id}, type={device_type})"
-                    )
-
-                # Request channel ID once and persist
-                try:
-                    res = ch.request_message(Message.ID.RESPONSE_CHANNEL_ID)
-                    _, _, id_data = res
-                    dev_num = id_data[0] | (id_data[1] << 8)
-                    dev_type = id_data[2]
-                    trans_type = id_data[3]
-                    extra = parse_common_pages(data)
-                    deep_merge_save(
-                        self.save_path,
-                        dev_num,
-                        dev_type,
-                        trans_type,
-                        base_extra=extra or None,
-                        manufacturers=self.manufacturer_map,
-                        rate_limit_secs=30,
-                        last_save_times=self.last_save_times,
-                    )
-                except Exception:
-                    pass
-
-                # Update HR active user
-                if device_type == 120 and dv.get("hr", 0):
-                    self.last_hr_active_user = self._user_for_hr(device_id)
-                    if self.last_hr_active_user:
-                        self._availability(self.last_hr_active_user, True)
-                        logging.info(f"Active HR user: {self.last_hr_active_user}")
+            now = time.time()
+            # deque.append is atomic, so the ANT thread never takes the lock
+            append((apply, data, now))
+            # ANT round trips and file writes stay on the ANT thread
+            self._persist_device_meta(ch, device_id, data, now)
+            wakeup.set()
 
         ch.on_broadcast_data = on_broadcast
         ch.on_burst_data = on_broadcast
-        ch.set_period(8070 if device_type == 120 else 8086)
+        ch.set_period(CHANNEL_PERIODS.get(device_type, 8086))
         ch.set_search_timeout(30)
         ch.set_rf_freq(57)
         ch.set_id(device_id or 0, device_type, 0)
@@ -487,18 +642,161 @@ class MqttMonitor:
         logging.info(f"Opened channel '{label}' (ID={device_id}, type={device_type})")
         self.channels.append(ch)
 
+    def _device_state(self, device_id: int, device_type: int, label: str):
+        """Return the state slot for device_id, registering it on first use."""
+        idx = self._device_index.get(device_id)
+        if idx is not None:
+            return self._devices[idx]
+        state = _DeviceState(device_id, device_type, label)
+        self._device_index[device_id] = len(self._devices)
+        self._devices.append(state)
+        return state
+
+    def _state_for(self, device_id: int) -> Optional[_DeviceState]:
+        idx = self._device_index.get(device_id)
+        return None if idx is None else self._devices[idx]
+
+    def _received(self, state: _DeviceState, now: float, changed: int):
+        """Stamp a decoded broadcast on its device with its change bits."""
+        if state.ts is None:
+            logging.info(
+                f"First data received for device '{state.label}' "
+                f"(ID={state.device_id}, type={state.device_type})"
+            )
+        state.ts = now
+        dirty = self._dirty_devices
+        dirty[state.device_id] = dirty.get(state.device_id, 0) | changed
+
+    def _drain_events(self):
+        """Apply queued broadcasts in arrival order. Runs on the run() thread."""
+        popleft = self._events.popleft
+        while True:
+            try:
+                apply, data, now = popleft()
+            except IndexError:
+                break
+            apply(data, now)
+
+    def _make_hr_apply(self, state: _DeviceState):
+        device_id = state.device_id
+
+        def apply(data, now: float):
+            old = state.hr
+            try:
+                state.hr = data[7]
+            except Exception:
+                pass
+            self._received(state, now, _HR_BIT if state.hr != old else 0)
+            # Update HR active user
+            if state.hr:
+                self.last_hr_active_user = self._user_for_hr(device_id)
+                if self.last_hr_active_user:
+                    with self.lock:
+                        self._availability(self.last_hr_active_user, True)
+                    logging.info(f"Active HR user: {self.last_hr_active_user}")
+
+        return apply
+
+    def _make_bike_apply(self, state: _DeviceState):
+        # Combined sensors (121) report both; the others only one
+        want_speed = state.device_type in (121, 123)
+        want_cadence = state.device_type in (121, 122)
+        circ = self._circ_m
+
+        def apply(data, now: float):
+            old_speed = state.speed
+            old_cadence = state.cadence
+            try:
+                evt_time = data[4] | (data[5] << 8)
+                revs = data[6] | (data[7] << 8)
+                last_time = state.evt_time
+                last_revs = state.revs
+                speed = None
+                cadence = None
+                if last_time is not None and last_revs is not None:
+                    speed, cadence = _decode_bike(
+                        evt_time,
+                        revs,
+                        last_time,
+                        last_revs,
+                        circ,
+                        want_speed,
+                        want_cadence,
+                    )
+                state.speed = speed
+                state.cadence = cadence
+                state.evt_time = evt_time
+                state.revs = revs
+            except Exception:
+                pass
+            changed = 0
+            if state.speed != old_speed:
+                changed |= _SPEED_BIT
+            if state.cadence != old_cadence:
+                changed |= _CADENCE_BIT
+            self._received(state, now, changed)
+
+        return apply
+
+    def _make_power_apply(self, state: _DeviceState):
+        def apply(data, now: float):
+            old = state.power
+            try:
+                state.power = (data[7] | (data[8] << 8)) if len(data) >= 9 else None
+            except Exception:
+                pass
+            self._received(state, now, _POWER_BIT if state.power != old else 0)
+
+        return apply
+
+    def _make_unknown_apply(self, state: _DeviceState):
+        def apply(data, now: float):
+            self._received(state, now, 0)
+
+        return apply
+
+    def _persist_device_meta(self, ch, device_id: int, data, now: float):
+        """
+        Merge the channel's device record into the save file. The channel ID is
+        requested from the stick at most once per _META_INTERVAL_SECS; common
+        pages (manufacturer/product info) are saved whenever they arrive.
+        """
+        chid = self._channel_ids.get(device_id)
+        due = now - self._last_meta_req.get(device_id, 0.0) >= _META_INTERVAL_SECS
+        try:
+            if due:
+                self._last_meta_req[device_id] = now
+                _, _, id_data = ch.request_message(Message.ID.RESPONSE_CHANNEL_ID)
+                chid = (id_data[0] | (id_data[1] << 8), id_data[2], id_data[3])
+                self._channel_ids[device_id] = chid
+            if chid is None:
+                return
+            extra = parse_common_pages_cached(data)
+            if extra or due:
+                dev_num, dev_type, trans_type = chid
+                deep_merge_save(
+                    self.save_path,
+                    dev_num,
+                    dev_type,
+                    trans_type,
+                    base_extra=extra or None,
+                    manufacturers=self.manufacturer_map,
+                )
+        except Exception:
+            pass
+
     def _open_configured_channels(self):
-        users = self.sensor_config.get("sensor_map", {}).get("users", [])
-        wattbike = self.sensor_config.get("sensor_map", {}).get("wattbike", {})
-
-        for user in users:
-            name = user.get("name")
-            # Support both old single hr_device_id and new hr_device_ids list
-            hr_ids = user.get("hr_device_ids", [])
-            if not hr_ids:  # Fallback to old format
-                old_hr_id = user.get("hr_device_id")
-                if old_hr_id:
-                    hr_ids = [old_hr_id]
+        # Seed the store of every HR-owning user before any channel opens, so
+        # no broadcast can mark a user online first
+        with self.lock:
+            for rec in self._user_records:
+                if rec.hr_ids:
+                    self.user_values.setdefault(rec.name, _new_user_values())
+                    self._availability(rec.name, False)
+
+        for rec in self._user_records:
+            name = rec.name
+            hr_ids = rec.hr_ids
 
             # Open channels for all HR devices assigned to this user
             for i, hr_id in enumerate(hr_ids):
@@ -506,38 +804,15 @@ class MqttMonitor:
                     self._open_channel(
                         hr_id, 120, f"{name}-HR{i+1 if len(hr_ids) > 1 else ''}"
                     )
-
-            # Initialize user store if they have any HR devices
-            if hr_ids:
-                with self.lock:
-                    self.user_values.setdefault(
-                        name,
-                        {
-                            "hr": None,
-                            "speed": None,
-                            "cadence": None,
-                            "power": None,
-                            "updated": 0,
-                        },
-                    )
-                    self._availability(name, False)
-
-        for user in users:
-            name = user.get("name")
-            sp = user.get("speed_device_id")
-            cad = user.get("cadence_device_id")
-            pow_id = user.get("power_device_id")
-            if sp:
-                self._open_channel(sp, 123, f"{name}-Speed")
-            if cad:
-                self._open_channel(cad, 122, f"{name}-Cadence")
-            if pow_id:
-                self._open_channel(pow_id, 11, f"{name}-Power")
-
-        if wattbike:
-            sp = wattbike.get("speed_device_id")
-            cad = wattbike.get("cadence_device_id")
-            pow_id = wattbike.get("power_device_id")
+            if rec.speed_id:
+                self._open_channel(rec.speed_id, 123, f"{name}-Speed")
+            if rec.cadence_id:
+                self._open_channel(rec.cadence_id, 122, f"{name}-Cadence")
+            if rec.power_id:
+                self._open_channel(rec.power_id, 11, f"{name}-Power")
+
+        if self._wattbike_ids:
+            sp, cad, pow_id = self._wattbike_ids
             if sp:
                 self._open_channel(sp, 123, "Wattbike-Speed")
             if cad:
@@ -546,138 +821,150 @@ class MqttMonitor:
                 self._open_channel(pow_id, 11, "Wattbike-Power")
 
     def _user_for_hr(self, hr_device_id: int) -> Optional[str]:
-        for user in self.sensor_config.get("sensor_map", {}).get("users", []):
-            # Support both old single hr_device_id and new hr_device_ids list
-            hr_ids = user.get("hr_device_ids", [])
-            if not hr_ids:  # Fallback to old format
-                old_hr_id = user.get("hr_device_id")
-                if old_hr_id:
-                    hr_ids = [old_hr_id]
-
-            if hr_device_id in hr_ids:
-                return user.get("name")
-        return None
-
-    def _assign_shared_sensors(self):
-        users = self.sensor_config.get("sensor_map", {}).get("users", [])
+        return self._hr_owner.get(hr_device_id)
+
+    def _assign_shared_sensors(self, dirty: Optional[Dict[int, int]] = None):
+        """
+        Fold device readings into per-user values. With a dirty map (device ID
+        to change bits), only users fed by one of those devices are visited,
+        and users whose devices reported no new values are just kept alive;
+        None refreshes everyone.
+        """
+        state_for = self._state_for
+        updates = []  # (user, values) to fold into user_values
+        alive = []  # users heard from without any changed value
 
         # Process heart rate data for all users
-        for user in users:
-            name = user.get("name")
+        for rec in self._user_records:
+            name = rec.name
             if not name:
                 continue
-
-            # Support both old single hr_device_id and new hr_device_ids list
-            hr_ids = user.get("hr_device_ids", [])
-            if not hr_ids:  # Fallback to old format
-                old_hr_id = user.get("hr_device_id")
-                if old_hr_id:
-                    hr_ids = [old_hr_id]
+            if dirty is None:
+                changed = _ALL_BITS
+            else:
+                heard = False
+                changed = 0
+                for device_id in rec.device_ids:
+                    bits = dirty.get(device_id)
+                    if bits is not None:
+                        heard = True
+                        changed |= bits
+                if not heard:
+                    continue
+                if not changed:
+                    alive.append(name)
+                    continue
 
             # Check for active HR devices for this user
             hr_value = None
-            for hr_id in hr_ids:
-                if hr_id in self.device_values:
-                    dv = self.device_values[hr_id]
-                    if dv.get("hr") is not None:
-                        hr_value = dv.get("hr")
-                        break  # Use first active HR device
+            for hr_id in rec.hr_ids:
+                state = state_for(hr_id)
+                if state is not None and state.hr is not None:
+                    hr_value = state.hr
+                    break  # Use first active HR device
 
             # Update user values if we have HR data
             if hr_value is not None:
-                with self.lock:
-                    uv = self.user_values.setdefault(
-                        name,
-                        {
-                            "hr": None,
-                            "speed": None,
-                            "cadence": None,
-                            "power": None,
-                            "updated": 0,
-                        },
-                    )
-                    uv["hr"] = hr_value
-                    uv["updated"] = time.time()
-
-                    # Also handle individual bike sensors for this user
-                    if (
-                        user.get("speed_device_id")
-                        and user.get("speed_device_id") in self.device_values
-                    ):
-                        dv = self.device_values[user.get("speed_device_id")]
-                        if dv.get("speed") is not None:
-                            uv["speed"] = dv.get("speed")
-
-                    if (
-                        user.get("cadence_device_id")
-                        and user.get("cadence_device_id") in self.device_values
-                    ):
-                        dv = self.device_values[user.get("cadence_device_id")]
-                        if dv.get("cadence") is not None:
-                            uv["cadence"] = dv.get("cadence")
-
-                    if (
-                        user.get("power_device_id")
-                        and user.get("power_device_id") in self.device_values
-                    ):
-                        dv = self.device_values[user.get("power_device_id")]
-                        if dv.get("power") is not None:
-                            uv["power"] = dv.get("power")
+                # Also handle individual bike sensors for this user
+                values = self._bike_readings(rec.speed_id, rec.cadence_id, rec.power_id)
+                values["hr"] = hr_value
+                updates.append((name, values))
 
         # Handle shared wattbike sensors (existing functionality)
-        wattbike = self.sensor_config.get("sensor_map", {}).get("wattbike", {})
-        if not users or not wattbike:
-            return
         target = self.last_hr_active_user
-        if not target:
+        if (
+            target
+            and self._user_records
+            and self._wattbike_ids
+            and (dirty is None or not self._wattbike_inputs.isdisjoint(dirty))
+        ):
+            updates.append((target, self._bike_readings(*self._wattbike_ids)))
+
+        if not updates and not alive:
             return
-        sp = wattbike.get("speed_device_id")
-        cad = wattbike.get("cadence_device_id")
-        pow_id = wattbike.get("power_device_id")
-        with self.lock:
-            uv = self.user_values.setdefault(
-                target,
-                {
-                    "hr": None,
-                    "speed": None,
-                    "cadence": None,
-                    "power": None,
-                    "updated": 0,
-                },
-            )
-            if sp and sp in self.device_values:
-                dv = self.device_values[sp]
-                if dv.get("speed") is not None:
-                    uv["speed"] = dv.get("speed")
-            if cad and cad in self.device_values:
-                dv = self.device_values[cad]
-                if dv.get("cadence") is not None:
-                    uv["cadence"] = dv.get("cadence")
-            if pow_id and pow_id in self.device_values:
-                dv = self.device_values[pow_id]
-                if dv.get("power") is not None:
-                    uv["power"] = dv.get("power")
-            uv["updated"] = time.time()
-            self.user_values[target] = uv
+        now = time.time()
+        for name, values in updates:
+            uv = self.user_values.setdefault(name, _new_user_values())
+            uv.update(values)
+            uv["updated"] = now
+            self._dirty_users.add(name)
+        # Unchanged readings still count as signs of life for offline detection;
+        # the user only needs a publish pass if it has to come back online
+        for name in alive:
+            uv = self.user_values.get(name)
+            if uv is not None and uv["updated"]:
+                uv["updated"] = now
+                if not self.last_availability.get(name):
+                    self._dirty_users.add(name)
+
+    def _mark_stale_offline(self, now: float):
+        """
+        Offline detection: a user goes offline once stale_secs pass without a
+        broadcast from their devices. Users already offline need no check.
+        """
+        for name, online in list(self.last_availability.items()):
+            if not online:
+                continue
+            vals = self.user_values.get(name)
+            updated = vals.get("updated", 0) if vals else 0
+            if (now - updated) > self.stale_secs:
+                self._availability(name, False)
+
+    def _bike_readings(
+        self,
+        speed_id: Optional[int],
+        cadence_id: Optional[int],
+        power_id: Optional[int],
+    ) -> Dict[str, float]:
+        """Collect the latest non-empty speed/cadence/power readings."""
+        state_for = self._state_for
+        values = {}
+        if speed_id:
+            state = state_for(speed_id)
+            if state is not None and state.speed is not None:
+                values["speed"] = state.speed
+        if cadence_id:
+            state = state_for(cadence_id)
+            if state is not None and state.cadence is not None:
+                values["cadence"] = state.cadence
+        if power_id:
+            state = state_for(power_id)
+            if state is not None and state.power is not None:
+                values["power"] = state.power
+        return values
 
     def run(self):
         configure_logging(self.debug)
         self.start()
         logging.info("MQTT live monitor started")
+        # Idle wakeups only serve offline detection, so they need not be frequent
+        idle_wait = min(self.stale_secs, 1.0)
+        wakeup = self._wakeup
         try:
             while not self.stop_event.is_set():
-                # Shared sensors assignment and publish
-                self._assign_shared_sensors()
+                wakeup.wait(timeout=idle_wait)
+                wakeup.clear()
+
+                self._drain_events()
+
+                # Shared sensors assignment for devices that sent data
+                dirty_devices, self._dirty_devices = self._dirty_devices, {}
+                if dirty_devices:
+                    self._assign_shared_sensors(dirty_devices)
+
+                # Users whose values changed this cycle
+                changed = []
+                dirty_users, self._dirty_users = self._dirty_users, set()
                 with self.lock:
-                    for name, vals in self.user_values.items():
-                        updated = vals.get("updated", 0)
-                        if updated:
-                            self._publish_user_metrics(name, vals)
+                    for name in dirty_users:
+                        vals = self.user_values.get(name)
+                        if vals and vals.get("updated", 0):
+                            changed.append((name, vals))
                             self._availability(name, True)
-                        # Offline detection
-                        if (time.time() - updated) > self.stale_secs:
-                            self._availability(name, False)
-                time.sleep(0.5)
+                    self._mark_stale_offline(time.time())
+                for name, vals in changed:
+                    self._publish_user_metrics(name, vals)
+                self._flush_publishes()
         except KeyboardInterrupt:
             logging.info("Interrupted")
         finally:
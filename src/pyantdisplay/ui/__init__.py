@@ -1,5 +1,13 @@
 """User interface modules."""
 
-from .data_display import DataDisplayService
+from ..utils.lazy import lazy_exports
 
-__all__ = ["DataDisplayService"]
+# Resolved on first access (PEP 562) so importing a sibling module does not
+# drag in the terminal display stack.
+_LAZY_EXPORTS = {
+    "DataDisplayService": ".data_display",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
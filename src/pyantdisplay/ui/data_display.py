@@ -26,13 +26,142 @@ Handles real-time data display with terminal UI management.
 """
 
 import os
+import re
+from bisect import bisect_right
 import select
+import shutil
+import signal
 import sys
+import threading
 import time
 import unicodedata
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
 
+import colorama
 from colorama import Back, Fore, Style
 
+from ..utils.common import cprint, write_block
+
+# Platform console modules, imported once rather than on every use
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+    tty = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+# Windows consoles need colorama to translate the ANSI escapes below
+if os.name == "nt":
+    colorama.init()
+
+# Raw key bytes that stop the display
+_QUIT_KEYS = (b"q", b"Q")
+
+# Frame width cap, for readability on wide terminals
+_MAX_COLS = 80
+
+# Terminal height assumed when it cannot be measured
+_DEFAULT_ROWS = 24
+
+# Home cursor, clear the screen and its scrollback without spawning a shell
+_CLEAR = "\x1b[H\x1b[2J\x1b[3J"
+
+_HLINE_CACHE: Dict[int, str] = {}
+
+
+def _get_size() -> Tuple[int, int]:
+    """
+    Terminal (columns, rows). shutil takes each from $COLUMNS/$LINES when set
+    and only queries the terminal when one of them is missing.
+    """
+    try:
+        size = shutil.get_terminal_size((_MAX_COLS, _DEFAULT_ROWS))
+    except Exception:
+        return _MAX_COLS, _DEFAULT_ROWS
+    return size.columns, size.lines
+
+
+def _hline(width: int) -> str:
+    """Return a cached box-drawing horizontal rule of the given width."""
+    line = _HLINE_CACHE.get(width)
+    if line is None:
+        line = "─" * max(0, width)
+        _HLINE_CACHE[width] = line
+    return line
+
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+@lru_cache(maxsize=512)
+def _display_width(text: str) -> int:
+    """Terminal columns taken by text, ignoring ANSI codes (emojis count 2)."""
+    width = 0
+    for char in _ANSI_RE.sub("", text):
+        # Most emojis are wide characters (2 terminal columns)
+        if unicodedata.east_asian_width(char) in ("F", "W"):  # Full/Wide
+            width += 2
+        elif ord(char) >= 0x1F600:  # Most emoji range
+            width += 2
+        else:
+            width += 1
+    return width
+
+
+def _pad(line: str, box_width: int) -> str:
+    """Pad a box content line to the right border."""
+    return line + " " * max(0, box_width - _display_width(line)) + "│"
+
+
+class _BoxTemplate(NamedTuple):
+    """Border lines of one device box at one width."""
+
+    top: str
+    bottom: str
+
+
+# Colour codes bound once; the frame code reads these instead of colorama
+# attribute chains
+_CYAN = Fore.CYAN
+_GREEN = Fore.GREEN
+_YELLOW = Fore.YELLOW
+_RED = Fore.RED
+_DIM = Style.DIM
+_RESET = Style.RESET_ALL
+_HEADER_STYLE = Back.BLUE + Fore.WHITE
+_CONTROL_STYLE = Back.RED + Fore.WHITE
+
+# Heart rate zones: lower bounds (bpm) of every zone after the first, and the
+# (colour, name) of each zone
+_HR_ZONE_LIMITS = (100, 140, 170)
+_HR_ZONES = (
+    (_CYAN, "Rest"),
+    (_GREEN, "Aerobic"),
+    (_YELLOW, "Threshold"),
+    (_RED, "Anaerobic"),
+)
+
+# Frame line templates; colour codes are baked in once so each refresh only
+# formats the numeric fields.
+_TITLE_TEMPLATE = f"{_CYAN}┌─ {{title}}{{rule}}┐{_RESET}"
+_BOTTOM_TEMPLATE = f"{_CYAN}└{{rule}}┘{_RESET}"
+_TIMESTAMP_TEMPLATE = f"{_CYAN}🕐 {{timestamp}}{_RESET}"
+_REFRESH_TEMPLATE = f"\n{_DIM}Refreshing every {{interval}}s...{_RESET}"
+_HR_TEMPLATE = f"│ {{color}}💓 {{hr:3d}} BPM{_RESET} ({{zone}})"
+_RR_TEMPLATE = "│ 📈 R-R Intervals: {count} samples"
+_SPEED_TEMPLATE = f"│ {{color}}🚴 Speed: {{speed:5.1f}} km/h{_RESET}"
+_CADENCE_TEMPLATE = f"│ {{color}}🔄 Cadence: {{cadence:3d}} RPM{_RESET}"
+_DISTANCE_TEMPLATE = "│ 📏 Distance: {distance:6.2f} km"
+_NOT_CONNECTED_LINE = f"│ {_RED}❌ Not connected{_RESET}"
+_WAITING_LINE = f"│ {_YELLOW}⏳ Waiting for data...{_RESET}"
+_WAITING_HR_LINE = f"│ {_YELLOW}⏳ Connected, waiting for heart rate...{_RESET}"
+
 
 class DataDisplayService:
     """Handles real-time data display with terminal UI management."""
@@ -42,275 +171,419 @@ class DataDisplayService:
         self.config = config
         self.running = False
         self.quit_requested = False
+        # [stdin fd] for the quit-key poll, looked up on first use
+        self._stdin_fds = None
+
+        # Static frame pieces, formatted once rather than on every refresh
+        self._header_text = "🚴 ANT+ Device Data Display 📊"
+        self._header_width = self._calculate_display_width(self._header_text)
+        self._header_style = _HEADER_STYLE
+        self._control_line = (
+            f"{_CONTROL_STYLE} Press 'q' key to quit (no Enter needed) {_RESET}"
+        )
+
+        # Frame width -> the three banner lines above the clock
+        self._header_cache: Dict[int, Tuple[str, str, str]] = {}
+
+        # (title, icon, box width) -> border lines, built once per width
+        self._box_cache: Dict[Tuple[str, str, int], _BoxTemplate] = {}
+
+        # Header timestamp, reformatted only when the wall-clock second changes
+        self._last_sec = None
+        self._time_line = ""
+        # Date part of the clock, reformatted only when the day changes
+        self._cached_day = None
+        self._cached_date = ""
+
+        # Screen lines of the last frame written; None forces a full redraw
+        self._prev_lines = None
+        # Terminal height; frames that do not fit are always redrawn in full
+        self._rows = _DEFAULT_ROWS
+
+        # Displayed values behind the last rendered frame body, and its lines
+        self._body_state = None
+        self._body: List[str] = []
 
     def _check_for_quit(self):
         """Check for 'q' key press without blocking."""
         if os.name == "posix":  # Unix/Linux/macOS
-            # Use non-blocking read
+            # Zero-timeout poll: the frame loop already waits on data_event
             try:
-                if select.select([sys.stdin], [], [], 0.01) == ([sys.stdin], [], []):
-                    char = sys.stdin.read(1).lower()
-                    if char == "q":
+                fds = self._stdin_fds
+                if fds is None:
+                    fds = self._stdin_fds = [sys.stdin.fileno()]
+                if select.select(fds, [], [], 0)[0]:
+                    # stdin is in cbreak mode, so one raw byte is one key
+                    if os.read(fds[0], 1) in _QUIT_KEYS:
                         return True
             except Exception:
                 # If there's any issue with input, just continue
                 pass
         else:  # Windows
             try:
-                import msvcrt
-
-                if msvcrt.kbhit():
-                    char = msvcrt.getch().decode("utf-8").lower()
-                    if char == "q":
+                if msvcrt is not None and msvcrt.kbhit():
+                    if msvcrt.getch() in _QUIT_KEYS:
                         return True
-            except ImportError:
+            except Exception:
                 pass
         return False
 
+    def _start_input_watcher(self):
+        """Start the quit-key thread; returns it with its stop pipe's write end."""
+        fd = sys.stdin.fileno()
+        stop_r, stop_w = os.pipe()
+        thread = threading.Thread(
+            target=self._input_watcher,
+            args=(fd, stop_r),
+            name="display-quit-key",
+            daemon=True,
+        )
+        thread.start()
+        return thread, stop_w
+
+    def _stop_input_watcher(self, thread, stop_w):
+        """Wake the quit-key thread through its stop pipe and wait for it."""
+        try:
+            os.write(stop_w, b"x")
+        except OSError:
+            pass
+        thread.join(timeout=1.0)
+        os.close(stop_w)
+
+    def _input_watcher(self, fd, stop_fd):
+        """Block on stdin until the quit key, EOF or a stop request."""
+        try:
+            while True:
+                readable = select.select([fd, stop_fd], [], [])[0]
+                if stop_fd in readable:
+                    return
+                key = os.read(fd, 1)
+                if not key:
+                    return
+                if key in _QUIT_KEYS:
+                    self.quit_requested = True
+                    # Wake the frame loop instead of waiting out the interval
+                    self.device_manager.data_event.set()
+                    return
+        except (OSError, ValueError):
+            pass
+        finally:
+            os.close(stop_fd)
+
     def display_data(self):
         """Display real-time data from connected devices."""
-        print(f"\n{Fore.CYAN}=== ANT+ Data Display ==={Style.RESET_ALL}")
+        cprint(Fore.CYAN, "\n=== ANT+ Data Display ===")
         print("Initializing display...")
 
         self.running = True
         self.quit_requested = False
+        self._stdin_fds = None
         old_settings = None
 
         # Only set raw mode if we have devices to display
-        connected_devices = [d for d in self.device_manager.devices if d.connected]
-        if not connected_devices:
-            print(
-                f"{Fore.YELLOW}No ANT+ devices connected. Connect devices first using scan/configure options.{Style.RESET_ALL}"
+        if not any(d.connected for d in self.device_manager.devices):
+            cprint(
+                Fore.YELLOW,
+                "No ANT+ devices connected. Connect devices first using scan/configure options.",
             )
             return
 
         # Simpler approach: try to set raw mode but don't fail if it doesn't work
         try:
             if os.name == "posix":
-                import tty, termios
-
                 old_settings = termios.tcgetattr(sys.stdin)
                 # Set cbreak mode instead of raw mode - less intrusive
                 tty.setcbreak(sys.stdin.fileno())
         except Exception as e:
-            print(
-                f"{Fore.YELLOW}Note: Using fallback input mode (raw terminal mode unavailable){Style.RESET_ALL}"
+            cprint(
+                Fore.YELLOW,
+                "Note: Using fallback input mode (raw terminal mode unavailable)",
             )
             time.sleep(1)
 
+        # Bound once so the refresh rate stays fixed for the whole run
+        self._display_interval = self.config.get("app", {}).get(
+            "data_display_interval", 1
+        )
+
+        # Terminal size is measured once and then only when it resizes
+        self._update_size()
+        self._prev_lines = None
+        self._body_state = None
+        # With the terminal in cbreak mode a thread blocks on stdin for the
+        # quit key, so frames need no input polling; otherwise poll per frame
+        watcher = None
+        if old_settings is not None:
+            try:
+                watcher = self._start_input_watcher()
+            except (OSError, ValueError):
+                pass
+
+        old_winch = None
+        if hasattr(signal, "SIGWINCH"):
+            try:
+                old_winch = signal.signal(signal.SIGWINCH, self._on_resize)
+            except ValueError:
+                # Not the main thread; keep the width measured above
+                pass
+
         try:
-            while self.running and not self.quit_requested:
+            while self.running:
                 # Check for quit key first (before clearing screen)
-                if self._check_for_quit():
-                    print(f"\n{Fore.GREEN}✅ Quit key detected!{Style.RESET_ALL}")
+                if self.quit_requested or (watcher is None and self._check_for_quit()):
+                    cprint(Fore.GREEN, "\n✅ Quit key detected!")
                     self.quit_requested = True
                     break
 
-                # Clear screen (works on most terminals)
-                os.system("clear" if os.name == "posix" else "cls")
-
-                # Get terminal size for better layout
-                try:
-                    import shutil
-
-                    cols, rows = shutil.get_terminal_size()
-                    cols = min(cols, 80)  # Cap width for readability
-                except:
-                    cols = 80
-
-                # Display header with border
-                self._display_header(cols)
-
-                # Display device data
-                self._display_heart_rate_monitor(cols)
-                self._display_bike_sensor(cols)
-
-                # Footer with controls - always visible
-                self._display_footer(cols)
-
-                time.sleep(self.config["app"]["data_display_interval"])
+                cols = self._cols
+
+                # Evaluate connection/freshness once per frame
+                device_manager = self.device_manager
+                hr_monitor = device_manager.hr_monitor
+                bike_sensor = device_manager.bike_sensor
+                hr_connected = bool(hr_monitor and hr_monitor.connected)
+                bike_connected = bool(bike_sensor and bike_sensor.connected)
+                # Snapshot each device's data for the frame; None when stale
+                hr_data = device_manager.hr_data
+                if not (hr_connected and hr_data and hr_monitor.is_data_fresh()):
+                    hr_data = None
+                bike_data = device_manager.bike_data
+                if not (bike_connected and bike_data and bike_sensor.is_data_fresh()):
+                    bike_data = None
+
+                # Everything below the header depends only on these values, so
+                # the body is rebuilt only when one of them changes
+                state = (
+                    cols,
+                    hr_connected,
+                    bike_connected,
+                    self._hr_state(hr_data),
+                    self._bike_state(bike_data),
+                )
+                if state != self._body_state:
+                    body = []
+
+                    # Display device data
+                    self._display_heart_rate_monitor(body, cols, hr_connected, hr_data)
+                    self._display_bike_sensor(body, cols, bike_connected, bike_data)
+
+                    # Footer with controls - always visible
+                    self._display_footer(body, cols)
+                    body.append("")
+                    self._body_state = state
+                    self._body = body
+
+                # Compose the whole frame, then emit the changes with one write;
+                # with an unchanged body that is at most the header clock line
+                frame = []
+                self._display_header(frame, cols)
+                frame.extend(self._body)
+                update = self._frame_update(frame)
+                if update:
+                    write_block(update)
+
+                # Redraw as soon as new data arrives, or after the interval
+                # so the clock and staleness indicators keep ticking
+                data_event = self.device_manager.data_event
+                data_event.wait(timeout=self._display_interval)
+                data_event.clear()
 
         except KeyboardInterrupt:
-            print(f"\n{Fore.GREEN}✅ Data display stopped{Style.RESET_ALL}")
+            cprint(Fore.GREEN, "\n✅ Data display stopped")
         finally:
+            if watcher is not None:
+                self._stop_input_watcher(*watcher)
+
+            if old_winch is not None:
+                signal.signal(signal.SIGWINCH, old_winch)
+
             # Restore terminal settings
             if old_settings and os.name == "posix":
                 try:
-                    import termios
-
                     termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
                 except:
                     pass
 
             if self.quit_requested:
-                print(f"\n{Fore.GREEN}✅ Data display stopped{Style.RESET_ALL}")
-
-    def _display_header(self, cols):
+                cprint(Fore.GREEN, "\n✅ Data display stopped")
+
+    def _update_size(self):
+        """Measure the terminal width used to lay out frames and its height."""
+        cols, self._rows = _get_size()
+        self._cols = min(cols, _MAX_COLS)
+
+    def _on_resize(self, signum, frame):
+        """SIGWINCH handler: re-measure the terminal for the next frame."""
+        self._update_size()
+        # Old lines may have rewrapped, so the next frame starts from scratch
+        self._prev_lines = None
+
+    @staticmethod
+    def _hr_state(hr_data):
+        """The heart rate values shown in the HR box (None when stale)."""
+        if hr_data is None:
+            return None
+        return hr_data["heart_rate"], len(hr_data.get("rr_intervals") or ())
+
+    @staticmethod
+    def _bike_state(bike_data):
+        """The bike values shown in the bike box (None when stale)."""
+        if bike_data is None:
+            return None
+        return bike_data["speed"], bike_data["cadence"], bike_data["distance"]
+
+    def _frame_update(self, frame):
+        """
+        Return the output that turns the screen from the previous frame into
+        this one: the ANSI clear plus every line the first time (or when the
+        line count changes), otherwise only the changed lines, each addressed
+        by cursor position. Returns "" when nothing changed.
+
+        Row addressing only holds while the frame fits on screen; a frame as
+        tall as the terminal scrolls, so it is always redrawn in full.
+        """
+        lines = "\n".join(frame).split("\n")
+        prev = self._prev_lines
+        self._prev_lines = lines
+        if prev is None or len(prev) != len(lines) or len(lines) >= self._rows:
+            # The ANSI clear is translated by colorama on Windows
+            return _CLEAR + "\n".join(lines)
+
+        out = [
+            f"\x1b[{row};1H\x1b[2K{line}"
+            for row, (old, line) in enumerate(zip(prev, lines), 1)
+            if old != line
+        ]
+        if not out:
+            return ""
+        # Leave the cursor below the frame, where a full redraw leaves it
+        out.append(f"\x1b[{len(lines)};1H")
+        return "".join(out)
+
+    def _display_header(self, buf, cols):
         """Display the header with timestamp."""
-        header = f"🚴 ANT+ Device Data Display 📊"
-        header_width = self._calculate_display_width(header)
-        header_padding = max(0, (cols - header_width) // 2)
-        border_line = "═" * cols
-
-        print(f"{Back.BLUE}{Fore.WHITE}{border_line}{Style.RESET_ALL}")
-        print(
-            f"{Back.BLUE}{Fore.WHITE}{' ' * header_padding}{header}{' ' * (cols - header_width - header_padding)}{Style.RESET_ALL}"
-        )
-        print(f"{Back.BLUE}{Fore.WHITE}{border_line}{Style.RESET_ALL}")
-
-        timestamp = time.strftime("%H:%M:%S • %Y-%m-%d")
-        print(f"{Fore.CYAN}🕐 {timestamp}{Style.RESET_ALL}")
-        print()
+        banner = self._header_cache.get(cols)
+        if banner is None:
+            header = self._header_text
+            header_width = self._header_width
+            header_style = self._header_style
+            header_padding = max(0, (cols - header_width) // 2)
+            border_line = f"{header_style}{'═' * cols}{_RESET}"
+            title_line = f"{header_style}{' ' * header_padding}{header}{' ' * (cols - header_width - header_padding)}{_RESET}"
+            banner = self._header_cache[cols] = (border_line, title_line, border_line)
+        buf.extend(banner)
+
+        now = int(time.time())
+        if now != self._last_sec:
+            self._last_sec = now
+            tm = time.localtime(now)
+            day = (tm.tm_year, tm.tm_yday)
+            if day != self._cached_day:
+                self._cached_day = day
+                self._cached_date = time.strftime("%Y-%m-%d", tm)
+            self._time_line = _TIMESTAMP_TEMPLATE.format(
+                timestamp=f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d} • {self._cached_date}"
+            )
+        buf.append(self._time_line)
+        buf.append("")
 
-    def _display_footer(self, cols):
+    def _display_footer(self, buf, cols):
         """Display the footer with controls."""
-        control_line = f"{Back.RED}{Fore.WHITE} Press 'q' key to quit (no Enter needed) {Style.RESET_ALL}"
         control_padding = max(0, (cols - 40) // 2)
-        print(" " * control_padding + control_line)
+        buf.append(" " * control_padding + self._control_line)
 
-        print(
-            f"\n{Style.DIM}Refreshing every {self.config['app']['data_display_interval']}s...{Style.RESET_ALL}"
-        )
+        buf.append(_REFRESH_TEMPLATE.format(interval=self._display_interval))
 
     def _calculate_display_width(self, text):
         """Calculate actual display width accounting for emojis and ANSI codes."""
-        # Remove ANSI color codes for width calculation
-        import re
-
-        clean_text = re.sub(r"\x1b\[[0-9;]*m", "", text)
-
-        width = 0
-        for char in clean_text:
-            # Most emojis are wide characters (2 terminal columns)
-            if unicodedata.east_asian_width(char) in ("F", "W"):  # Full/Wide
-                width += 2
-            elif ord(char) >= 0x1F600:  # Most emoji range
-                width += 2
-            else:
-                width += 1
-        return width
+        return _display_width(text)
 
-    def _display_heart_rate_monitor(self, cols):
+    def _display_heart_rate_monitor(self, buf, cols, connected, hr_data):
         """Display heart rate monitor data in a box."""
         self._print_device_box(
+            buf,
             "Heart Rate Monitor",
             "💓",
-            self.device_manager.hr_monitor and self.device_manager.hr_monitor.connected,
+            connected,
             self._hr_display_func,
             cols,
+            hr_data,
         )
 
-    def _display_bike_sensor(self, cols):
+    def _display_bike_sensor(self, buf, cols, connected, bike_data):
         """Display bike sensor data in a box."""
         self._print_device_box(
+            buf,
             "Bike Sensor",
             "🚴",
-            self.device_manager.bike_sensor
-            and self.device_manager.bike_sensor.connected,
+            connected,
             self._bike_display_func,
             cols,
+            bike_data,
         )
 
-    def _print_device_box(self, title, icon, connected, data_func, cols):
+    def _print_device_box(self, buf, title, icon, connected, data_func, cols, data):
         """Print a device data box with border."""
         box_width = cols - 4
-        title_text = f"{icon} {title} "
-        title_display_width = self._calculate_display_width(title_text)
-        title_line = (
-            f"┌─ {title_text}" + "─" * max(0, box_width - title_display_width - 3) + "┐"
-        )
-
-        print(f"{Fore.CYAN}{title_line}{Style.RESET_ALL}")
+        key = (title, icon, box_width)
+        box = self._box_cache.get(key)
+        if box is None:
+            title_text = f"{icon} {title} "
+            rule = _hline(box_width - _display_width(title_text) - 3)
+            box = self._box_cache[key] = _BoxTemplate(
+                _TITLE_TEMPLATE.format(title=title_text, rule=rule),
+                _BOTTOM_TEMPLATE.format(rule=_hline(box_width - 1)),
+            )
+        buf.append(box.top)
 
         if connected:
-            data_func(box_width)
+            data_func(buf, box_width, data)
         else:
-            not_connected_text = f"│ {Fore.RED}❌ Not connected{Style.RESET_ALL}"
-            not_connected_width = self._calculate_display_width(not_connected_text)
-            padding = " " * max(0, box_width - not_connected_width) + "│"
-            print(not_connected_text + padding)
-
-        bottom_line = "└" + "─" * (box_width - 1) + "┘"
-        print(f"{Fore.CYAN}{bottom_line}{Style.RESET_ALL}")
-        print()
+            buf.append(_pad(_NOT_CONNECTED_LINE, box_width))
 
-    def _hr_display_func(self, box_width):
-        """Display heart rate data inside the box."""
-        hr_data = self.device_manager.hr_data
-        hr_monitor = self.device_manager.hr_monitor
+        buf.append(box.bottom)
+        buf.append("")
 
-        if hr_data and hr_monitor.is_data_fresh():
+    def _hr_display_func(self, buf, box_width, hr_data):
+        """Display heart rate data (None when stale) inside the box."""
+        if hr_data is not None:
             hr = hr_data["heart_rate"]
             if hr > 0:
                 # Color code heart rate zones
-                if hr < 100:
-                    hr_color = Fore.CYAN
-                    zone = "Rest"
-                elif hr < 140:
-                    hr_color = Fore.GREEN
-                    zone = "Aerobic"
-                elif hr < 170:
-                    hr_color = Fore.YELLOW
-                    zone = "Threshold"
-                else:
-                    hr_color = Fore.RED
-                    zone = "Anaerobic"
-
-                hr_line = f"│ {hr_color}💓 {hr:3d} BPM{Style.RESET_ALL} ({zone})"
-                hr_width = self._calculate_display_width(hr_line)
-                padding = " " * max(0, box_width - hr_width) + "│"
-                print(hr_line + padding)
+                hr_color, zone = _HR_ZONES[bisect_right(_HR_ZONE_LIMITS, hr)]
+
+                hr_line = _HR_TEMPLATE.format(color=hr_color, hr=hr, zone=zone)
+                buf.append(_pad(hr_line, box_width))
 
                 if hr_data.get("rr_intervals"):
                     rr_count = len(hr_data["rr_intervals"])
-                    rr_line = f"│ 📈 R-R Intervals: {rr_count} samples"
-                    rr_width = self._calculate_display_width(rr_line)
-                    rr_padding = " " * max(0, box_width - rr_width) + "│"
-                    print(rr_line + rr_padding)
+                    buf.append(_pad(_RR_TEMPLATE.format(count=rr_count), box_width))
             else:
-                waiting_hr_text = f"│ {Fore.YELLOW}⏳ Connected, waiting for heart rate...{Style.RESET_ALL}"
-                waiting_hr_width = self._calculate_display_width(waiting_hr_text)
-                padding = " " * max(0, box_width - waiting_hr_width) + "│"
-                print(waiting_hr_text + padding)
+                buf.append(_pad(_WAITING_HR_LINE, box_width))
         else:
-            waiting_text = f"│ {Fore.YELLOW}⏳ Waiting for data...{Style.RESET_ALL}"
-            waiting_width = self._calculate_display_width(waiting_text)
-            padding = " " * max(0, box_width - waiting_width) + "│"
-            print(waiting_text + padding)
-
-    def _bike_display_func(self, box_width):
-        """Display bike sensor data inside the box."""
-        bike_data = self.device_manager.bike_data
-        bike_sensor = self.device_manager.bike_sensor
+            buf.append(_pad(_WAITING_LINE, box_width))
 
-        if bike_data and bike_sensor.is_data_fresh():
+    def _bike_display_func(self, buf, box_width, bike_data):
+        """Display bike sensor data (None when stale) inside the box."""
+        if bike_data is not None:
             speed = bike_data["speed"]
             cadence = bike_data["cadence"]
             distance = bike_data["distance"]
 
             # Speed
-            speed_color = Fore.GREEN if speed > 0 else Fore.YELLOW
-            speed_line = f"│ {speed_color}🚴 Speed: {speed:5.1f} km/h{Style.RESET_ALL}"
-            speed_width = self._calculate_display_width(speed_line)
-            speed_padding = " " * max(0, box_width - speed_width) + "│"
-            print(speed_line + speed_padding)
+            speed_color = _GREEN if speed > 0 else _YELLOW
+            speed_line = _SPEED_TEMPLATE.format(color=speed_color, speed=speed)
+            buf.append(_pad(speed_line, box_width))
 
             # Cadence
-            cadence_color = Fore.GREEN if cadence > 0 else Fore.YELLOW
-            cadence_line = (
-                f"│ {cadence_color}🔄 Cadence: {cadence:3d} RPM{Style.RESET_ALL}"
+            cadence_color = _GREEN if cadence > 0 else _YELLOW
+            cadence_line = _CADENCE_TEMPLATE.format(
+                color=cadence_color, cadence=cadence
             )
-            cadence_width = self._calculate_display_width(cadence_line)
-            cadence_padding = " " * max(0, box_width - cadence_width) + "│"
-            print(cadence_line + cadence_padding)
+            buf.append(_pad(cadence_line, box_width))
 
             # Distance
-            distance_line = f"│ 📏 Distance: {distance:6.2f} km"
-            distance_width = self._calculate_display_width(distance_line)
-            distance_padding = " " * max(0, box_width - distance_width) + "│"
-            print(distance_line + distance_padding)
+            distance_line = _DISTANCE_TEMPLATE.format(distance=distance)
+            buf.append(_pad(distance_line, box_width))
         else:
-            waiting_text = f"│ {Fore.YELLOW}⏳ Waiting for data...{Style.RESET_ALL}"
-            waiting_width = self._calculate_display_width(waiting_text)
-            padding = " " * max(0, box_width - waiting_width) + "│"
-            print(waiting_text + padding)
+            buf.append(_pad(_WAITING_LINE, box_width))
@@ -31,17 +31,27 @@ Usage:
 
 import curses
 import logging
+import queue
+import re
 import signal
+import struct
 import sys
 import threading
 import time
 import unicodedata
-from typing import Dict, List, Optional, Union
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 import yaml
 from colorama import Fore, Style
 
-from ..utils.common import deep_merge_save, load_manufacturers, parse_common_pages
+from ..utils.common import (
+    CHANNEL_PERIODS,
+    deep_merge_save,
+    load_manufacturers,
+    parse_common_pages_cached,
+    record_key,
+)
 
 try:
     from openant.easy.channel import Channel
@@ -52,6 +62,83 @@ except ImportError:
 
 ANT_PLUS_NETWORK_KEY = [0xB9, 0xA5, 0x21, 0xFB, 0xBD, 0x72, 0xC3, 0x45]
 
+# Little-endian broadcast payload layouts, decoded in one C call per packet:
+# HR: beat event time (1/1024 s), beat count, computed heart rate at byte 4
+_HR_STRUCT = struct.Struct("<4xHBB")
+# Speed/cadence: event time (1/1024 s), cumulative revolutions at byte 4
+_BIKE_STRUCT = struct.Struct("<4xHH")
+# Power: watts at bytes 7-8
+_POWER_STRUCT = struct.Struct("<7xH")
+
+# Minimum seconds between saves of a device record without new common pages
+_SAVE_RATE_LIMIT_SECS = 30
+
+# ANSI colour codes are stripped before measuring display width
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Terminal column widths per codepoint; ASCII is a fixed table, the rest is
+# filled in lazily the first time a character is measured
+_ASCII_WIDTHS = (1,) * 128
+_WIDTH_CACHE: Dict[int, int] = {}
+
+
+def _char_width(cp: int) -> int:
+    if cp < 128:
+        return _ASCII_WIDTHS[cp]
+    width = _WIDTH_CACHE.get(cp)
+    if width is None:
+        # Full/Wide characters and most emoji take two terminal columns
+        wide = unicodedata.east_asian_width(chr(cp)) in ("F", "W")
+        width = 2 if wide or cp >= 0x1F600 else 1
+        _WIDTH_CACHE[cp] = width
+    return width
+
+
+# Fixed column layout of the live table
+_USER_W = 20
+_HR_W = 8
+_SP_W = 12
+_CAD_W = 13
+_PW_W = 8
+_GAP = 3
+_HR_COL = _USER_W + 1
+_SP_COL = _HR_COL + _HR_W + _GAP
+_CAD_COL = _SP_COL + _SP_W + _GAP
+_PW_COL = _CAD_COL + _CAD_W + _GAP
+# Values sit under the "R" in "❤️ HR"
+_HR_VALUE_COL = _HR_COL + 4
+_HR_VALUE_W = _SP_COL - _HR_VALUE_COL
+_TABLE_W = _PW_COL + _PW_W
+
+# Static header cells (row, col, text); emoji offsets visually align correctly
+_HEADER_CELLS = (
+    (3, 0, "User".ljust(_USER_W)),
+    (3, _HR_COL + 3, "❤️ HR"),
+    (3, _SP_COL + 4, "🚴 Speed"),
+    (3, _CAD_COL + 3, "🔁 Cadence"),
+    (3, _PW_COL + 1, "⚡ Power"),
+)
+_FIRST_ROW = 5
+
+# Redraw at least this often; new sensor data redraws immediately
+_FRAME_SECS = 0.5
+# How often the loop wakes to poll the keyboard between frames
+_KEY_POLL_SECS = 0.1
+
+
+def _new_user_values() -> Dict[str, Optional[float]]:
+    return {"hr": None, "speed": None, "cadence": None, "power": None, "updated": 0}
+
+
+def _user_hr_ids(user: dict) -> Tuple[int, ...]:
+    # Support both old single hr_device_id and new hr_device_ids list
+    hr_ids = user.get("hr_device_ids", [])
+    if not hr_ids:  # Fallback to old format
+        old_hr_id = user.get("hr_device_id")
+        if old_hr_id:
+            hr_ids = [old_hr_id]
+    return tuple(hr_ids)
+
 
 def configure_logging(debug: bool):
     logging.basicConfig(
@@ -77,36 +164,56 @@ class LiveMonitor:
         self.save_path = save_path
         self.debug = debug
         self.config = self._load_config()
+        # Wheel circumference from config if provided; static for the run
+        self._circ_m = float(self.config.get("wheel_circumference_m", 2.105))
+        self._build_indexes()
         self.node: Optional[Node] = None
         self.loop_thread: Optional[threading.Thread] = None
         self.channels: List[Channel] = []
 
-        # Device and user state
+        # Device and user state. Channel callbacks only append to _events; the
+        # curses thread drains it and alone writes device and user state. Each
+        # entry is replaced with a new dict rather than mutated, so readers on
+        # any thread get a complete entry without the lock, which only
+        # serializes writers.
         self.lock = threading.Lock()
-        self.device_values: Dict[int, Dict] = {}  # device_id -> parsed values + meta
-        self.user_values: Dict[str, Dict] = {}  # user -> hr/speed/cadence/power
-        self.last_hr_active_user: Optional[str] = None
+        self._events: Deque[Tuple[Callable[[Any, float], None], Any, float]] = deque()
+        # device_id -> parsed values + meta; "ts" is a time.monotonic() stamp
+        self.device_values: Dict[int, Dict] = {}
+        # user -> hr/speed/cadence/power, seeded up front for every user with
+        # an HR strap so the update paths never have to create entries
+        self.user_values: Dict[str, Dict] = {
+            name: _new_user_values()
+            for name, hr_ids in self._user_to_hr_ids.items()
+            if hr_ids
+        }
+        self._last_hr_active_user: Optional[str] = None
+        # Set when a wattbike packet arrives or the active HR user changes;
+        # _assign_shared_sensors has nothing to do until then
+        self._shared_dirty = False
         self.stop_event = threading.Event()
+        # Set by broadcast callbacks so the display redraws without polling
+        self._dirty = threading.Event()
         self.last_save_times: Dict[str, float] = {}
+        # Device records waiting to be merged into the save file by the save
+        # thread; None asks the thread to exit
+        self._save_queue: "queue.Queue[Optional[Tuple]]" = queue.Queue()
+        self._save_thread: Optional[threading.Thread] = None
         self.manufacturer_map: Dict[int, str] = load_manufacturers()
+        # Values and cells drawn on each table row, so frames only format rows
+        # whose values changed and only redraw the cells that differ
+        self._last_rendered: Dict[int, Tuple[Tuple, Tuple]] = {}
+        self._sep_cols: Optional[int] = None
+        self._last_clock: Optional[str] = None
 
     def _calculate_display_width(self, text):
         """Calculate actual display width accounting for emojis and wide characters."""
-        import re
-
+        # Plain ASCII (names, numbers) is one column per character
+        if text.isascii() and "\x1b" not in text:
+            return len(text)
         # Remove ANSI color codes for width calculation
-        clean_text = re.sub(r"\x1b\[[0-9;]*m", "", text)
-
-        width = 0
-        for char in clean_text:
-            # Most emojis are wide characters (2 terminal columns)
-            if unicodedata.east_asian_width(char) in ("F", "W"):  # Full/Wide
-                width += 2
-            elif ord(char) >= 0x1F600:  # Most emoji range
-                width += 2
-            else:
-                width += 1
-        return width
+        clean_text = _ANSI_RE.sub("", text)
+        return sum(_char_width(ord(char)) for char in clean_text)
 
     def _rjust_display_width(self, text, width):
         """Right-justify text accounting for emoji display width."""
@@ -116,10 +223,61 @@ class LiveMonitor:
         padding = width - display_width
         return " " * padding + text
 
+    def _build_indexes(self):
+        """Resolve sensor_map users' HR straps into lookup tables once."""
+        # User -> HR device IDs in config order, walked by the render loop
+        self._user_to_hr_ids: Dict[str, Tuple[int, ...]] = {}
+        # First user listing an HR strap owns it, as the old linear search did
+        self._hr_id_to_user: Dict[int, Optional[str]] = {}
+        for user in self.config.get("sensor_map", {}).get("users", []):
+            hr_ids = tuple(i for i in _user_hr_ids(user) if i)
+            self._user_to_hr_ids.setdefault(user.get("name", "Unknown"), hr_ids)
+            for hr_id in hr_ids:
+                self._hr_id_to_user.setdefault(hr_id, user.get("name"))
+        wattbike = self.config.get("sensor_map", {}).get("wattbike") or {}
+        # Shared wattbike sensors whose packets need an assignment pass
+        self._wattbike_ids = frozenset(
+            i
+            for i in (
+                wattbike.get("speed_device_id"),
+                wattbike.get("cadence_device_id"),
+                wattbike.get("power_device_id"),
+            )
+            if i
+        )
+        # User -> name truncated and padded to the user column
+        self._display_names: Dict[str, str] = {}
+        for name in self._user_to_hr_ids:
+            self._display_name(name)
+
+    @property
+    def last_hr_active_user(self) -> Optional[str]:
+        return self._last_hr_active_user
+
+    @last_hr_active_user.setter
+    def last_hr_active_user(self, user: Optional[str]):
+        if user != self._last_hr_active_user:
+            self._last_hr_active_user = user
+            # The wattbike follows the active rider
+            self._shared_dirty = True
+
+    def _display_name(self, name: str) -> str:
+        display = self._display_names.get(name)
+        if display is None:
+            # Prepare name with truncation/ellipsis for long entries
+            if len(name) > _USER_W:
+                display = name[: max(0, _USER_W - 3)] + "..."
+            else:
+                display = name
+            display = self._display_names[name] = display.ljust(_USER_W)
+        return display
+
     def _load_config(self) -> dict:
         try:
             with open(self.config_path, "r") as f:
-                return yaml.safe_load(f) or {}
+                data = yaml.safe_load(f)
+            # Anything but a mapping is treated as an empty config
+            return data if isinstance(data, dict) else {}
         except FileNotFoundError:
             print(f"{Fore.YELLOW}Config not found: {self.config_path}{Style.RESET_ALL}")
             return {
@@ -141,18 +299,36 @@ class LiveMonitor:
         trans_type: int,
         extra: Union[dict, None] = None,
     ):
-        deep_merge_save(
-            self.save_path,
-            dev_num,
-            dev_type,
-            trans_type,
-            base_extra=extra,
-            manufacturers=self.manufacturer_map,
-            rate_limit_secs=30,
-            last_save_times=self.last_save_times,
-        )
+        # File I/O happens on the save thread, never on the ANT thread
+        self._save_queue.put((dev_num, dev_type, trans_type, extra))
+
+    def _drain_save_queue(self):
+        """Merge queued device records into the save file until told to stop."""
+        while True:
+            item = self._save_queue.get()
+            if item is None:
+                break
+            dev_num, dev_type, trans_type, extra = item
+            try:
+                deep_merge_save(
+                    self.save_path,
+                    dev_num,
+                    dev_type,
+                    trans_type,
+                    base_extra=extra,
+                    manufacturers=self.manufacturer_map,
+                    rate_limit_secs=_SAVE_RATE_LIMIT_SECS,
+                    last_save_times=self.last_save_times,
+                )
+            except Exception as e:
+                logging.debug(f"Failed to save device {dev_num}: {e}")
 
     def start(self):
+        # Persist found devices in the background
+        self._save_thread = threading.Thread(
+            target=self._drain_save_queue, name="pyantdisplay.save", daemon=True
+        )
+        self._save_thread.start()
         # Start node in background
         self.node = Node()
         self.loop_thread = threading.Thread(
@@ -179,108 +355,53 @@ class LiveMonitor:
                     self.node.stop()
                 except Exception:
                     pass
+            # Let the save thread flush queued records before exiting
+            if self._save_thread is not None:
+                self._save_queue.put(None)
+                self._save_thread.join(timeout=2.0)
+                self._save_thread = None
+
+    def _save_due(self, dev_num: int, dev_type: int) -> bool:
+        """Whether the rate limit allows another save of this device record."""
+        last = self.last_save_times.get(record_key(dev_type, dev_num), 0)
+        return time.time() - last > _SAVE_RATE_LIMIT_SECS
 
     def _open_channel(self, device_id: int, device_type: int, label: str):
         ch = self.node.new_channel(Channel.Type.BIDIRECTIONAL_RECEIVE)
+        # device_type is fixed per channel, so pick its decoder once here
+        apply = self._make_apply(device_id, device_type, label)
+        # Bound once per channel rather than looked up on every packet
+        append = self._events.append
+        dirty = self._dirty
+        now = time.monotonic
+        # (device number, device type, transmission type) from the stick,
+        # requested on the first packet that arrives
+        chid: Optional[Tuple[int, int, int]] = None
 
         # Callbacks
         def on_broadcast(data):
-            # Parse based on device_type
-            with self.lock:
-                parsed = None
-                if device_type == 120:  # HR
-                    try:
-                        # page = data[0]  # Page number not currently used
-                        beat_time = (data[4] | (data[5] << 8)) / 1024.0
-                        beat_count = data[6]
-                        hr = data[7]
-                        parsed = {
-                            "type": "hr",
-                            "hr": hr,
-                            "beat_time": beat_time,
-                            "beat_count": beat_count,
-                            "ts": time.time(),
-                        }
-                    except Exception:
-                        parsed = {"type": "hr", "hr": 0, "ts": time.time()}
-                elif device_type in (121, 123, 122):
-                    # Speed/Cadence profiles
-                    try:
-                        # page = data[0]  # Page number not currently used
-                        evt_time = data[4] | (data[5] << 8)
-                        revs = data[6] | (data[7] << 8)
-                        prev = self.device_values.get(device_id, {})
-                        last_time = prev.get("evt_time")
-                        last_revs = prev.get("revs")
-                        speed = None
-                        cadence = None
-                        if last_time is not None and last_revs is not None:
-                            dt_ticks = (evt_time - last_time) & 0xFFFF
-                            d_revs = (revs - last_revs) & 0xFFFF
-                            sec = dt_ticks / 1024.0 if dt_ticks > 0 else 0.0
-                            if sec > 0 and d_revs >= 0:
-                                if (
-                                    device_type == 123 or device_type == 121
-                                ):  # Speed or combined
-                                    # Assume wheel circumference from config if provided
-                                    circ = self.config.get(
-                                        "wheel_circumference_m", 2.105
-                                    )
-                                    mps = (d_revs * circ) / sec
-                                    speed = mps * 3.6
-                                if (
-                                    device_type == 122 or device_type == 121
-                                ):  # Cadence or combined
-                                    cadence = (d_revs / sec) * 60.0
-                        parsed = {
-                            "type": "bike",
-                            "speed": speed,
-                            "cadence": cadence,
-                            "evt_time": evt_time,
-                            "revs": revs,
-                            "ts": time.time(),
-                        }
-                    except Exception:
-                        parsed = {"type": "bike", "ts": time.time()}
-                elif device_type == 11:
-                    try:
-                        # Power typically at bytes 7-8
-                        power = (data[7] | (data[8] << 8)) if len(data) >= 9 else None
-                        parsed = {"type": "power", "power": power, "ts": time.time()}
-                    except Exception:
-                        parsed = {"type": "power", "ts": time.time()}
-                else:
-                    parsed = {"type": "unknown", "ts": time.time()}
-
-                # Update device store
-                dv = self.device_values.get(device_id, {})
-                dv.update(parsed)
-                dv["label"] = label
-                dv["device_type"] = device_type
-                dv["device_id"] = device_id
-                self.device_values[device_id] = dv
-
-                # Request channel ID once and persist
-                try:
+            nonlocal chid
+            # deque.append is atomic, so the ANT thread never takes the lock
+            append((apply, data, now()))
+            # ANT round trips and file writes stay on the ANT thread.
+            # Request channel ID once and persist
+            try:
+                if chid is None:
                     res = ch.request_message(Message.ID.RESPONSE_CHANNEL_ID)
                     _, _, id_data = res
-                    dev_num = id_data[0] | (id_data[1] << 8)
-                    dev_type = id_data[2]
-                    trans_type = id_data[3]
-                    # If parsed contains common info, include it
-                    extra = parse_common_pages(data)
-                    self._save_found(dev_num, dev_type, trans_type, extra=extra or None)
-                except Exception:
-                    pass
-
-                # Update user mapping if HR
-                if device_type == 120 and dv.get("hr", 0) > 0:
-                    self.last_hr_active_user = self._user_for_hr(device_id)
+                    chid = (id_data[0] | (id_data[1] << 8), id_data[2], id_data[3])
+                # If parsed contains common info, include it
+                extra = parse_common_pages_cached(data)
+                if extra or self._save_due(chid[0], chid[1]):
+                    self._save_found(*chid, extra=extra or None)
+            except Exception:
+                pass
+            dirty.set()
 
         ch.on_broadcast_data = on_broadcast
         ch.on_burst_data = on_broadcast
         # Parameters
-        ch.set_period(8070 if device_type == 120 else 8086)
+        ch.set_period(CHANNEL_PERIODS.get(device_type, 8086))
         ch.set_search_timeout(30)
         ch.set_rf_freq(57)
         ch.set_id(device_id or 0, device_type, 0)  # 0 = wildcard if not known
@@ -292,6 +413,137 @@ class LiveMonitor:
         ch.open()
         self.channels.append(ch)
 
+    def _drain_events(self):
+        """Apply queued broadcasts in arrival order. Runs on the curses thread."""
+        popleft = self._events.popleft
+        while True:
+            try:
+                apply, data, ts = popleft()
+            except IndexError:
+                break
+            apply(data, ts)
+
+    def _make_apply(
+        self, device_id: int, device_type: int, label: str
+    ) -> Callable[[Any, float], None]:
+        """
+        Return the decoder that applies a channel's packets to its device.
+        Each decoder publishes the device entry as a new dict in one store, so
+        readers never see a half-applied packet; meta seeds the first entry.
+        """
+        factory = {
+            120: self._make_hr_apply,
+            121: self._make_bike_apply,
+            122: self._make_bike_apply,
+            123: self._make_bike_apply,
+            11: self._make_power_apply,
+        }.get(device_type, self._make_unknown_apply)
+        return factory(device_id, device_type, label)
+
+    def _make_hr_apply(self, device_id: int, device_type: int, label: str):
+        device_values = self.device_values
+        meta = {"label": label, "device_type": device_type, "device_id": device_id}
+
+        def apply(data, ts: float):
+            try:
+                # page = data[0]  # Page number not currently used
+                beat_ticks, beat_count, hr = _HR_STRUCT.unpack_from(data)
+                parsed = {
+                    "type": "hr",
+                    "hr": hr,
+                    "beat_time": beat_ticks / 1024.0,
+                    "beat_count": beat_count,
+                    "ts": ts,
+                }
+            except Exception:
+                hr = 0
+                parsed = {"type": "hr", "hr": hr, "ts": ts}
+            device_values[device_id] = {
+                **(device_values.get(device_id) or meta),
+                **parsed,
+            }
+            # Update user mapping if HR
+            if hr > 0:
+                self.last_hr_active_user = self._user_for_hr(device_id)
+
+        return apply
+
+    def _make_bike_apply(self, device_id: int, device_type: int, label: str):
+        device_values = self.device_values
+        meta = {"label": label, "device_type": device_type, "device_id": device_id}
+        circ = self._circ_m
+        has_speed = device_type in (121, 123)  # Speed or combined
+        has_cadence = device_type in (121, 122)  # Cadence or combined
+        shared = device_id in self._wattbike_ids
+
+        def apply(data, ts: float):
+            prev = device_values.get(device_id) or meta
+            try:
+                # page = data[0]  # Page number not currently used
+                evt_time, revs = _BIKE_STRUCT.unpack_from(data)
+                last_time = prev.get("evt_time")
+                last_revs = prev.get("revs")
+                speed = None
+                cadence = None
+                if last_time is not None and last_revs is not None:
+                    dt_ticks = (evt_time - last_time) & 0xFFFF
+                    d_revs = (revs - last_revs) & 0xFFFF
+                    if dt_ticks > 0:
+                        sec = dt_ticks / 1024.0
+                        if has_speed:
+                            speed = (d_revs * circ) / sec * 3.6
+                        if has_cadence:
+                            cadence = (d_revs / sec) * 60.0
+                parsed = {
+                    "type": "bike",
+                    "speed": speed,
+                    "cadence": cadence,
+                    "evt_time": evt_time,
+                    "revs": revs,
+                    "ts": ts,
+                }
+            except Exception:
+                parsed = {"type": "bike", "ts": ts}
+            device_values[device_id] = {**prev, **parsed}
+            if shared:
+                self._shared_dirty = True
+
+        return apply
+
+    def _make_power_apply(self, device_id: int, device_type: int, label: str):
+        device_values = self.device_values
+        meta = {"label": label, "device_type": device_type, "device_id": device_id}
+        shared = device_id in self._wattbike_ids
+
+        def apply(data, ts: float):
+            try:
+                # Power typically at bytes 7-8
+                power = _POWER_STRUCT.unpack_from(data)[0] if len(data) >= 9 else None
+                parsed = {"type": "power", "power": power, "ts": ts}
+            except Exception:
+                parsed = {"type": "power", "ts": ts}
+            device_values[device_id] = {
+                **(device_values.get(device_id) or meta),
+                **parsed,
+            }
+            if shared:
+                self._shared_dirty = True
+
+        return apply
+
+    def _make_unknown_apply(self, device_id: int, device_type: int, label: str):
+        device_values = self.device_values
+        meta = {"label": label, "device_type": device_type, "device_id": device_id}
+
+        def apply(data, ts: float):
+            device_values[device_id] = {
+                **(device_values.get(device_id) or meta),
+                "type": "unknown",
+                "ts": ts,
+            }
+
+        return apply
+
     def _open_configured_channels(self):
         # Users and sensors from config
         users = self.config.get("sensor_map", {}).get("users", [])
@@ -300,12 +552,7 @@ class LiveMonitor:
         # Open user HR channels (supporting multiple HR devices per user)
         for user in users:
             name = user.get("name")
-            # Support both old single hr_device_id and new hr_device_ids list
-            hr_ids = user.get("hr_device_ids", [])
-            if not hr_ids:  # Fallback to old format
-                old_hr_id = user.get("hr_device_id")
-                if old_hr_id:
-                    hr_ids = [old_hr_id]
+            hr_ids = _user_hr_ids(user)
 
             # Open channels for all HR devices assigned to this user
             for i, hr_id in enumerate(hr_ids):
@@ -316,17 +563,7 @@ class LiveMonitor:
 
             # Initialize user store if they have any HR devices
             if hr_ids:
-                with self.lock:
-                    self.user_values.setdefault(
-                        name,
-                        {
-                            "hr": None,
-                            "speed": None,
-                            "cadence": None,
-                            "power": None,
-                            "updated": 0,
-                        },
-                    )
+                self.user_values.setdefault(name, _new_user_values())
 
         # Open explicit user bike sensors
         for user in users:
@@ -354,20 +591,13 @@ class LiveMonitor:
                 self._open_channel(pow_id, 11, "Wattbike-Power")
 
     def _user_for_hr(self, hr_device_id: int) -> Optional[str]:
-        for user in self.config.get("sensor_map", {}).get("users", []):
-            # Support both old single hr_device_id and new hr_device_ids list
-            hr_ids = user.get("hr_device_ids", [])
-            if not hr_ids:  # Fallback to old format
-                old_hr_id = user.get("hr_device_id")
-                if old_hr_id:
-                    hr_ids = [old_hr_id]
-
-            if hr_device_id in hr_ids:
-                return user.get("name")
-        return None
+        return self._hr_id_to_user.get(hr_device_id)
 
     def _assign_shared_sensors(self):
         # Assign shared wattbike sensors to the most recently active HR user
+        if not self._shared_dirty:
+            return
+        self._shared_dirty = False
         users = self.config.get("sensor_map", {}).get("users", [])
         wattbike = self.config.get("sensor_map", {}).get("wattbike", {})
         if not users or not wattbike:
@@ -379,31 +609,113 @@ class LiveMonitor:
         sp = wattbike.get("speed_device_id")
         cad = wattbike.get("cadence_device_id")
         pow_id = wattbike.get("power_device_id")
+        uv = self.user_values.get(target)
+        if uv is None:
+            return
+        updates = {"updated": time.time()}
+        if sp and sp in self.device_values:
+            dv = self.device_values[sp]
+            if dv.get("speed") is not None:
+                updates["speed"] = dv.get("speed")
+        if cad and cad in self.device_values:
+            dv = self.device_values[cad]
+            if dv.get("cadence") is not None:
+                updates["cadence"] = dv.get("cadence")
+        if pow_id and pow_id in self.device_values:
+            dv = self.device_values[pow_id]
+            if dv.get("power") is not None:
+                updates["power"] = dv.get("power")
+        self.user_values[target] = {**uv, **updates}
+
+    def _format_row(self, name: str, hr, sp, cad, pw) -> Tuple:
+        """Build the (col, text, attr) cells for one user's table row."""
+        hr_s = f"{hr}" if hr is not None else "-"
+        sp_s = f"{sp:.1f}" if sp is not None else "-"
+        cad_s = f"{int(cad)}" if cad is not None else "-"
+        pw_s = f"{int(pw)}" if pw is not None else "-"
+        # Choose colors based on data freshness/values
+        good = curses.color_pair(2)
+        warn = curses.color_pair(3)
+        # Values are padded to their column width so a shorter value
+        # overwrites whatever the previous frame left behind
+        return (
+            (0, self._display_name(name), curses.A_NORMAL),
+            (_HR_VALUE_COL, f"{hr_s:<{_HR_VALUE_W}}", good if hr else warn),
+            (_SP_COL, f"{sp_s:>{_SP_W}}", good if sp else warn),
+            (_CAD_COL, f"{cad_s:>{_CAD_W}}", good if cad else warn),
+            (_PW_COL, f"{pw_s:>{_PW_W}}", good if pw else warn),
+        )
+
+    def _update_user_hr(self):
+        # Update HR-linked values for users
+        device_values = self.device_values
+        for name, hr_ids in self._user_to_hr_ids.items():
+            hr_val = None
+            # Find the first active HR device for this user
+            for hr_id in hr_ids:
+                dv = device_values.get(hr_id)
+                if dv is not None and dv.get("hr") is not None:
+                    hr_val = dv["hr"]
+                    break
+
+            if hr_val is not None:
+                # stamp last active
+                if hr_val:
+                    self.last_hr_active_user = name
+                    self.user_values[name] = {
+                        **self.user_values[name],
+                        "hr": hr_val,
+                        "updated": time.time(),
+                    }
+
+    def _draw_frame(self, stdscr):
+        # State is only written here, never while curses I/O is in progress
         with self.lock:
-            uv = self.user_values.setdefault(
-                target,
-                {
-                    "hr": None,
-                    "speed": None,
-                    "cadence": None,
-                    "power": None,
-                    "updated": 0,
-                },
+            self._drain_events()
+            # Assign shared sensors
+            self._assign_shared_sensors()
+            self._update_user_hr()
+
+        # Update display
+        clock = time.strftime("Time: %Y-%m-%d %H:%M:%S")
+        if clock != self._last_clock:
+            self._last_clock = clock
+            stdscr.addstr(1, 0, clock)
+        # Separator spans terminal width
+        _, cols = stdscr.getmaxyx()
+        if cols != self._sep_cols:
+            self._sep_cols = cols
+            stdscr.addstr(4, 0, "-" * max(_TABLE_W, cols))
+
+        # Render table rows, redrawing only cells whose text changed
+        row = _FIRST_ROW
+        last_rendered = self._last_rendered
+        for name, vals in self.user_values.items():
+            values = (
+                name,
+                vals.get("hr"),
+                vals.get("speed"),
+                vals.get("cadence"),
+                vals.get("power"),
             )
-            if sp and sp in self.device_values:
-                dv = self.device_values[sp]
-                if dv.get("speed") is not None:
-                    uv["speed"] = dv.get("speed")
-            if cad and cad in self.device_values:
-                dv = self.device_values[cad]
-                if dv.get("cadence") is not None:
-                    uv["cadence"] = dv.get("cadence")
-            if pow_id and pow_id in self.device_values:
-                dv = self.device_values[pow_id]
-                if dv.get("power") is not None:
-                    uv["power"] = dv.get("power")
-            uv["updated"] = time.time()
-            self.user_values[target] = uv
+            last = last_rendered.get(row)
+            if last is None or last[0] != values:
+                cells = self._format_row(*values)
+                for i, cell in enumerate(cells):
+                    if last is None or last[1][i] != cell:
+                        stdscr.addstr(row, *cell)
+                last_rendered[row] = (values, cells)
+            row += 1
+
+    def _draw_static(self, stdscr):
+        """Clear the window and draw the header; rows then redraw on change."""
+        stdscr.erase()
+        self._last_rendered.clear()
+        self._sep_cols = None
+        self._last_clock = None
+        stdscr.addstr(0, 0, " ANT+ Live Monitor (q to quit) ", curses.color_pair(1))
+        for cell in _HEADER_CELLS:
+            stdscr.addstr(*cell)
 
     def run_curses(self, stdscr):
         curses.curs_set(0)
@@ -413,8 +725,10 @@ class LiveMonitor:
         curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)  # good
         curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)  # warning
         curses.init_pair(4, curses.COLOR_RED, curses.COLOR_BLACK)  # error
+        # Key presses are polled without blocking; waiting is on self._dirty
         stdscr.nodelay(True)
-        stdscr.timeout(500)
+        self._draw_static(stdscr)
+        next_frame = 0.0
         # Main loop
         while not self.stop_event.is_set():
             # Handle key press (q to quit)
@@ -423,116 +737,23 @@ class LiveMonitor:
                 if ch in (ord("q"), ord("Q")):
                     self.stop_event.set()
                     break
+                if ch == curses.KEY_RESIZE:
+                    # The window was reallocated; start again from a blank one
+                    self._draw_static(stdscr)
+                    next_frame = 0.0
             except Exception:
                 pass
 
-            # Assign shared sensors
-            self._assign_shared_sensors()
-
-            # Update display
-            stdscr.erase()
-            stdscr.addstr(0, 0, " ANT+ Live Monitor (q to quit) ", curses.color_pair(1))
-            stdscr.addstr(1, 0, time.strftime("Time: %Y-%m-%d %H:%M:%S"))
-            # Compute fixed column positions for aligned header and rows
-            user_w = 20
-            hr_w = 8
-            sp_w = 12
-            cad_w = 13
-            pw_w = 8
-            gap = 3
-            hr_col = user_w + 1
-            sp_col = hr_col + hr_w + gap
-            cad_col = sp_col + sp_w + gap
-            pw_col = cad_col + cad_w + gap
-
-            # Header with fixed positions (emojis supported)
-            stdscr.addstr(3, 0, "User".ljust(user_w))
-            # Use fixed positions that visually align correctly
-            stdscr.addstr(3, hr_col + 3, "❤️ HR")
-            stdscr.addstr(3, sp_col + 4, "🚴 Speed")
-            stdscr.addstr(3, cad_col + 3, "🔁 Cadence")
-            stdscr.addstr(3, pw_col + 1, "⚡ Power")
-            # Separator spans terminal width
-            _, cols = stdscr.getmaxyx()
-            stdscr.addstr(4, 0, "-" * max(pw_col + pw_w, cols))
-
-            row = 5
-            with self.lock:
-                # Update HR-linked values for users
-                for user in self.config.get("sensor_map", {}).get("users", []):
-                    name = user.get("name", "Unknown")
-                    # Support both old single hr_device_id and new hr_device_ids list
-                    hr_ids = user.get("hr_device_ids", [])
-                    if not hr_ids:  # Fallback to old format
-                        old_hr_id = user.get("hr_device_id")
-                        if old_hr_id:
-                            hr_ids = [old_hr_id]
-
-                    hr_val = None
-                    active_hr_id = None
-                    # Find the first active HR device for this user
-                    for hr_id in hr_ids:
-                        if hr_id and hr_id in self.device_values:
-                            dv = self.device_values[hr_id]
-                            if dv.get("hr") is not None:
-                                hr_val = dv.get("hr")
-                                active_hr_id = hr_id
-                                break
-
-                    if hr_val is not None:
-                        # stamp last active
-                        if hr_val:
-                            self.last_hr_active_user = name
-                            uv = self.user_values.setdefault(
-                                name,
-                                {
-                                    "hr": None,
-                                    "speed": None,
-                                    "cadence": None,
-                                    "power": None,
-                                    "updated": 0,
-                                },
-                            )
-                            uv["hr"] = hr_val
-                            uv["updated"] = time.time()
-                            self.user_values[name] = uv
-
-                # Render table rows
-                for name, vals in self.user_values.items():
-                    # Prepare name with truncation/ellipsis for long entries
-                    if len(name) > user_w:
-                        display_name = name[: max(0, user_w - 3)] + "..."
-                    else:
-                        display_name = name
-                    hr = vals.get("hr")
-                    sp = vals.get("speed")
-                    cad = vals.get("cadence")
-                    pw = vals.get("power")
-                    hr_s = f"{hr}" if hr is not None else "-"
-                    sp_s = f"{sp:.1f}" if sp is not None else "-"
-                    cad_s = f"{int(cad)}" if cad is not None else "-"
-                    pw_s = f"{int(pw)}" if pw is not None else "-"
-                    # Choose colors based on data freshness/values
-                    hr_attr = curses.color_pair(2) if hr else curses.color_pair(3)
-                    sp_attr = curses.color_pair(2) if sp else curses.color_pair(3)
-                    cad_attr = curses.color_pair(2) if cad else curses.color_pair(3)
-                    pw_attr = curses.color_pair(2) if pw else curses.color_pair(3)
-                    stdscr.addstr(row, 0, display_name.ljust(user_w))
-                    # Align data values under the text portion of headers
-                    stdscr.addstr(row, 25, hr_s, hr_attr)  # Under "R" in "❤️ HR"
-                    stdscr.addstr(
-                        row, sp_col + sp_w - len(sp_s), sp_s, sp_attr
-                    )  # Right-align in Speed column
-                    stdscr.addstr(
-                        row, cad_col + cad_w - len(cad_s), cad_s, cad_attr
-                    )  # Right-align in Cadence column
-                    stdscr.addstr(
-                        row, pw_col + pw_w - len(pw_s), pw_s, pw_attr
-                    )  # Right-align in Power column
-                    row += 1
-
-            stdscr.refresh()
-            time.sleep(0.5)
+            # Redraw when sensor data arrived or the frame interval elapsed
+            now = time.monotonic()
+            if self._dirty.is_set() or now >= next_frame:
+                self._dirty.clear()
+                next_frame = now + _FRAME_SECS
+                self._draw_frame(stdscr)
+                # Stage the window and push only the changed cells
+                stdscr.noutrefresh()
+                curses.doupdate()
+            self._dirty.wait(_KEY_POLL_SECS)
 
     def run(self):
         self.start()
@@ -25,11 +25,46 @@ SOFTWARE.
 Manages the interactive menu system and device scanning.
 """
 
+import sys
+
 from colorama import Back, Fore, Style
 
-from ..services.device_scan import DeviceScanService
 from ..services.device_list import DeviceListService
-from ..ui.data_display import DataDisplayService
+
+# Colour codes bound once so the menu loop skips the colorama attribute lookups
+_CYAN = Fore.CYAN
+_GREEN = Fore.GREEN
+_RED = Fore.RED
+_YELLOW = Fore.YELLOW
+_WHITE = Fore.WHITE
+_BLUE_BG = Back.BLUE
+_RESET = Style.RESET_ALL
+
+_MENU_HEADER = f"\n{_BLUE_BG}{_WHITE} ANT+ Device Manager {_RESET}\n"
+_MENU_FOOTER = "5. Show USB setup instructions\n6. Exit\n"
+_MENU_PROMPT = f"\n{_YELLOW}Select option (1-6): {_RESET}"
+
+# The whole menu block for each USB state, written with a single call
+_MENU_AVAILABLE = (
+    _MENU_HEADER
+    + f"USB Status: {_GREEN}✓ ANT+ USB stick connected{_RESET}\n"
+    + f"\n{_CYAN}Available options:{_RESET}\n"
+    + "1. Scan for ANT+ devices\n"
+    + "2. List found devices\n"
+    + "3. Configure devices\n"
+    + "4. Start data display\n"
+    + _MENU_FOOTER
+)
+_MENU_UNAVAILABLE = (
+    _MENU_HEADER
+    + f"USB Status: {_YELLOW}❌ No ANT+ USB stick detected{_RESET}\n"
+    + f"\n{_CYAN}Available options:{_RESET}\n"
+    + f"1. {_YELLOW}Scan for ANT+ devices (USB stick required){_RESET}\n"
+    + f"2. {_YELLOW}List found devices{_RESET}\n"
+    + f"3. {_YELLOW}Configure devices (USB stick required){_RESET}\n"
+    + f"4. {_YELLOW}Start data display (USB stick required){_RESET}\n"
+    + _MENU_FOOTER
+)
 
 
 class MenuManager:
@@ -46,36 +81,48 @@ class MenuManager:
         self._list_service = None
         self._display_service = None
 
+        # Menu choice -> handler; a handler returning True ends the menu loop
+        self._handlers = {
+            "1": self._handle_device_scan,
+            "2": self._handle_list_devices,
+            "3": self._handle_configure_devices,
+            "4": self._handle_start_display,
+            "5": self._handle_setup_instructions,
+            "6": self._handle_exit,
+        }
+
     def check_usb_on_startup(self) -> bool:
         """Check for ANT+ USB stick on application startup."""
-        print(f"{Fore.CYAN}ANT+ Device Data Display{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Checking for ANT+ USB stick...{Style.RESET_ALL}")
+        print(f"{_CYAN}ANT+ Device Data Display{_RESET}")
+        print(f"{_CYAN}Checking for ANT+ USB stick...{_RESET}")
 
         # Check USB permissions first
         if not self.usb_detector.check_usb_permissions():
-            print(f"{Fore.RED}❌ USB permission error{Style.RESET_ALL}")
+            print(f"{_RED}❌ USB permission error{_RESET}")
             return False
 
         # Detect ANT+ devices
         devices = self.usb_detector.detect_ant_sticks()
 
         if devices:
-            print(f"{Fore.GREEN}✓ ANT+ USB stick detected and ready!{Style.RESET_ALL}")
+            print(f"{_GREEN}✓ ANT+ USB stick detected and ready!{_RESET}")
             for device in devices:
                 print(f"  📡 {device['name']}")
             self.usb_stick_available = True
             self._initialize_services()
             return True
         else:
-            print(f"{Fore.YELLOW}❌ No ANT+ USB stick found{Style.RESET_ALL}")
+            print(f"{_YELLOW}❌ No ANT+ USB stick found{_RESET}")
             print(
-                f"{Fore.YELLOW}   Connect your ANT+ USB stick to enable device scanning{Style.RESET_ALL}"
+                f"{_YELLOW}   Connect your ANT+ USB stick to enable device scanning{_RESET}"
             )
             self.usb_stick_available = False
             return False
 
     def _initialize_services(self):
         """Initialize services when USB stick is available."""
+        from ..services.device_scan import DeviceScanService
+
         config = self.config_manager.config
         self._scan_service = DeviceScanService(config)
         self._list_service = DeviceListService(config)
@@ -83,11 +130,9 @@ class MenuManager:
     def _handle_device_scan(self):
         """Handle device scanning menu option."""
         if not self.usb_stick_available:
+            print(f"{_RED}Cannot scan for devices: No ANT+ USB stick detected.{_RESET}")
             print(
-                f"{Fore.RED}Cannot scan for devices: No ANT+ USB stick detected.{Style.RESET_ALL}"
-            )
-            print(
-                f"{Fore.YELLOW}Please connect your ANT+ USB stick and restart the application.{Style.RESET_ALL}"
+                f"{_YELLOW}Please connect your ANT+ USB stick and restart the application.{_RESET}"
             )
             return
 
@@ -103,7 +148,7 @@ class MenuManager:
         """Handle configure devices menu option."""
         if not self.usb_stick_available:
             print(
-                f"{Fore.YELLOW}Please connect an ANT+ USB stick and restart the application.{Style.RESET_ALL}"
+                f"{_YELLOW}Please connect an ANT+ USB stick and restart the application.{_RESET}"
             )
             return
 
@@ -115,93 +160,52 @@ class MenuManager:
         """Handle start data display menu option."""
         if not self.usb_stick_available:
             print(
-                f"{Fore.YELLOW}Please connect an ANT+ USB stick and restart the application.{Style.RESET_ALL}"
+                f"{_YELLOW}Please connect an ANT+ USB stick and restart the application.{_RESET}"
             )
             return
 
         self.device_manager.connect_devices()
         if self.device_manager.has_connected_devices():
             if not self._display_service:
+                from ..ui.data_display import DataDisplayService
+
                 self._display_service = DataDisplayService(
                     self.device_manager, self.device_manager.config
                 )
             self._display_service.display_data()
         else:
             print(
-                f"{Fore.YELLOW}No ANT+ devices connected. Connect devices first using scan/configure options.{Style.RESET_ALL}"
+                f"{_YELLOW}No ANT+ devices connected. Connect devices first using scan/configure options.{_RESET}"
             )
 
+    def _handle_setup_instructions(self):
+        """Handle USB setup instructions menu option."""
+        self.usb_detector.print_setup_instructions()
+
+    def _handle_exit(self) -> bool:
+        """Handle exit menu option."""
+        print(f"{_GREEN}Goodbye!{_RESET}")
+        return True
+
     def show_menu(self):
         """Show the main menu and handle user interactions."""
         while True:
-            print(f"\n{Back.BLUE}{Fore.WHITE} ANT+ Device Manager {Style.RESET_ALL}")
-
-            # Show USB stick status
-            if self.usb_stick_available:
-                print(
-                    f"USB Status: {Fore.GREEN}✓ ANT+ USB stick connected{Style.RESET_ALL}"
-                )
-            else:
-                print(
-                    f"USB Status: {Fore.YELLOW}❌ No ANT+ USB stick detected{Style.RESET_ALL}"
-                )
-
-            print(f"\n{Fore.CYAN}Available options:{Style.RESET_ALL}")
-
-            if self.usb_stick_available:
-                print("1. Scan for ANT+ devices")
-                print("2. List found devices")
-                print("3. Configure devices")
-                print("4. Start data display")
-            else:
-                print(
-                    f"1. {Fore.YELLOW}Scan for ANT+ devices (USB stick required){Style.RESET_ALL}"
-                )
-                print(f"2. {Fore.YELLOW}List found devices{Style.RESET_ALL}")
-                print(
-                    f"3. {Fore.YELLOW}Configure devices (USB stick required){Style.RESET_ALL}"
-                )
-                print(
-                    f"4. {Fore.YELLOW}Start data display (USB stick required){Style.RESET_ALL}"
-                )
-
-            print("5. Show USB setup instructions")
-            print("6. Exit")
+            sys.stdout.write(
+                _MENU_AVAILABLE if self.usb_stick_available else _MENU_UNAVAILABLE
+            )
+            sys.stdout.flush()
 
             try:
-                choice = input(f"\n{Fore.YELLOW}Select option (1-6): {Style.RESET_ALL}")
+                choice = input(_MENU_PROMPT)
 
-                if choice == "1":
-                    if self.usb_stick_available:
-                        self._handle_device_scan()
-                    else:
-                        print(
-                            f"{Fore.YELLOW}Please connect an ANT+ USB stick and restart the application.{Style.RESET_ALL}"
-                        )
-
-                elif choice == "2":
-                    self._handle_list_devices()
-
-                elif choice == "3":
-                    self._handle_configure_devices()
-
-                elif choice == "4":
-                    self._handle_start_display()
-
-                elif choice == "5":
-                    self.usb_detector.print_setup_instructions()
-
-                elif choice == "6":
-                    print(f"{Fore.GREEN}Goodbye!{Style.RESET_ALL}")
+                handler = self._handlers.get(choice)
+                if handler is None:
+                    print(f"{_RED}Invalid option. Please choose 1-6.{_RESET}")
+                elif handler():
                     break
 
-                else:
-                    print(
-                        f"{Fore.RED}Invalid option. Please choose 1-6.{Style.RESET_ALL}"
-                    )
-
             except KeyboardInterrupt:
-                print(f"\n{Fore.GREEN}Goodbye!{Style.RESET_ALL}")
+                print(f"\n{_GREEN}Goodbye!{_RESET}")
                 break
             except Exception as e:
-                print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+                print(f"{_RED}Error: {e}{_RESET}")
@@ -1,6 +1,14 @@
 """Utility functions and helpers."""
 
-from .config_loader import ConfigLoader
-from .usb_detector import ANTUSBDetector
+from .lazy import lazy_exports
 
-__all__ = ["ConfigLoader", "ANTUSBDetector"]
+# Resolved on first access (PEP 562) so that importing utils.common does not
+# also load pyusb through the USB detector.
+_LAZY_EXPORTS = {
+    "ConfigLoader": ".config_loader",
+    "ANTUSBDetector": ".usb_detector",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
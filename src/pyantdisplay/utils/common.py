@@ -27,13 +27,26 @@ Shared utilities:
 - Manufacturer name lookup (config/manufacturers.yaml)
 - Parse ANT+ common pages (80/81)
 - Deep-merge persistence of found devices with optional rate limiting
+- Cached loading of the found devices file
+- Coloured console output and bulk block writes
+- Memoized last-seen timestamp formatting
 """
 
 import json
+import os
+import sys
+import threading
 import time
-from typing import Dict, Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
-import yaml
+from colorama import Style
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 TYPE_NAMES: Dict[int, str] = {
     120: "Heart Rate Monitor",
@@ -45,10 +58,21 @@ TYPE_NAMES: Dict[int, str] = {
     17: "Environment Sensor",
 }
 
+# ANT+ channel periods (1/32768 s units) per device profile
+CHANNEL_PERIODS: Dict[int, int] = {
+    120: 8070,  # Heart rate, ~4.06 Hz
+    121: 8086,  # Combined speed and cadence, ~4.05 Hz
+    122: 8102,  # Cadence only, ~4.04 Hz
+    123: 8118,  # Speed only, ~4.03 Hz
+    11: 8182,  # Power, ~4.00 Hz
+}
+
 
 def load_manufacturers(path: str = "config/manufacturers.yaml") -> Dict[int, str]:
     default = {1: "Garmin/Dynastream"}
     try:
+        import yaml
+
         with open(path, "r") as f:
             data = yaml.safe_load(f) or {}
         custom = {
@@ -90,6 +114,122 @@ def parse_common_pages(data: bytes) -> Dict[str, object]:
     return info
 
 
+# Common pages a sensor interleaves with its data pages
+_COMMON_PAGES = frozenset((80, 81))
+
+
+@lru_cache(maxsize=512)
+def _common_page_items(payload: bytes) -> Tuple[Tuple[str, object], ...]:
+    return tuple(parse_common_pages(payload).items())
+
+
+def parse_common_pages_cached(data) -> Dict[str, object]:
+    """
+    parse_common_pages for per-packet callers. Data pages are rejected on the
+    page number alone; common pages repeat the same 8-byte payload for long
+    stretches, so their parse is memoized on it (extended message bytes that
+    follow the payload are ignored).
+    """
+    try:
+        if data[0] not in _COMMON_PAGES:
+            return {}
+    except Exception:
+        return {}
+    return dict(_common_page_items(bytes(data[:8])))
+
+
+_RESET = Style.RESET_ALL
+
+
+def cprint(color: str, msg: str) -> None:
+    """Write msg in the given colorama colour, reset, and end the line."""
+    sys.stdout.write("".join((color, msg, _RESET, "\n")))
+
+
+def write_block(text: str) -> None:
+    """
+    Write a pre-assembled block of output and flush it. When stdout is the
+    interpreter's own stream (colorama has not wrapped it to convert or strip
+    ANSI codes) the encoded block goes straight to the binary buffer.
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if stream is sys.__stdout__ and buffer is not None:
+        stream.flush()
+        buffer.write(text.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+        buffer.flush()
+        return
+    stream.write(text)
+    stream.flush()
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+# path -> ((st_mtime_ns, st_size, st_ino), parsed devices)
+_FOUND_DEVICES_CACHE: Dict[str, Tuple[Tuple[int, int, int], dict]] = {}
+_FOUND_DEVICES_LOCK = threading.Lock()
+
+
+def load_found_devices(path: str) -> dict:
+    """
+    Load the found devices JSON file, reusing the last parse while the file's
+    (mtime, size, inode) signature is unchanged. The returned dict is shared;
+    treat it as read-only. Raises FileNotFoundError / JSONDecodeError like
+    json.load.
+    """
+    try:
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    except OSError:
+        signature = None
+    if signature is not None:
+        with _FOUND_DEVICES_LOCK:
+            cached = _FOUND_DEVICES_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    with open(path, "rb") as f:
+        devices = _json_loads(f.read())
+    if signature is not None:
+        with _FOUND_DEVICES_LOCK:
+            _FOUND_DEVICES_CACHE[path] = (signature, devices)
+    return devices
+
+
+def write_found_devices(path: str, devices: dict) -> None:
+    """
+    Write the found devices dict as indented JSON. The file is replaced
+    atomically so concurrent readers never parse a partial write.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_json_dumps(devices))
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=256)
+def _format_epoch_second(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds).isoformat(" ", "seconds")
+
+
+def format_timestamp(ts: float) -> str:
+    """
+    Format an epoch timestamp as local 'YYYY-MM-DD HH:MM:SS'. Results are
+    memoized per whole second, so repeated stamps in a table format once.
+    """
+    return _format_epoch_second(int(ts))
+
+
 def record_key(device_type: int, device_id: int) -> str:
     return f"{device_type}_{device_id}"
 
@@ -25,7 +25,9 @@ SOFTWARE.
 Handles configuration file loading and merging.
 """
 
-from typing import Any, Dict, Optional
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 try:
     import yaml  # type: ignore
@@ -38,6 +40,11 @@ from colorama import Fore, Style
 class ConfigLoader:
     """Handles configuration file loading and merging."""
 
+    def __init__(self):
+        # (app_config, local_config) -> (file signatures, merged config)
+        self._cache: Dict[Tuple[str, Optional[str]], Tuple[tuple, Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+
     def load_app_config(
         self, app_config: str, local_config: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -48,6 +55,20 @@ class ConfigLoader:
             )
             return {}
 
+        # Reuse the merged config while neither file has changed on disk;
+        # callers only read the returned dict
+        key = (app_config, local_config)
+        signature = (
+            self._file_signature(app_config),
+            self._file_signature(local_config) if local_config else None,
+        )
+        cacheable = signature[0] is not None
+        if cacheable:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
         # Load base config
         try:
             with open(app_config, "r") as f:
@@ -64,8 +85,19 @@ class ConfigLoader:
             except Exception:
                 pass
 
+        if cacheable:
+            with self._cache_lock:
+                self._cache[key] = (signature, base)
         return base
 
+    def _file_signature(self, path: str) -> Optional[Tuple[int, int, int]]:
+        """Return (mtime, size, inode) for path, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
     def _deep_merge(self, a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
         """Deep merge two dictionaries."""
         out = dict(a)
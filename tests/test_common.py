@@ -2,16 +2,25 @@
 Tests for common utility functions.
 """
 
+import os
+from datetime import datetime
 from unittest.mock import patch, mock_open
 
+import pytest
 import yaml
 
 from pyantdisplay.utils.common import (
     TYPE_NAMES,
     load_manufacturers,
     parse_common_pages,
+    parse_common_pages_cached,
     record_key,
     deep_merge_save,
+    load_found_devices,
+    write_found_devices,
+    cprint,
+    format_timestamp,
+    write_block,
 )
 
 
@@ -143,6 +152,26 @@ class TestCommonUtilities:
 
         assert result == {}
 
+    def test_parse_common_pages_cached(self):
+        """Test the memoized parse matches parse_common_pages."""
+        from pyantdisplay.utils import common
+
+        common._common_page_items.cache_clear()
+        page_80 = bytearray([80, 0x34, 0x12, 0x78, 0x56, 0x34, 0x12, 0x00])
+
+        first = parse_common_pages_cached(page_80 + b"\x01\x02")
+        first["extra"] = True
+        # Trailing extended-message bytes do not affect the cache key
+        second = parse_common_pages_cached(page_80 + b"\x03")
+
+        assert second == parse_common_pages(bytes(page_80))
+        assert common._common_page_items.cache_info().hits == 1
+        # Data pages and short payloads never reach the cache
+        assert parse_common_pages_cached(bytes([4, 1, 2, 3, 4, 5, 6, 7])) == {}
+        assert parse_common_pages_cached(bytes([80, 1])) == {}
+        assert parse_common_pages_cached(b"") == {}
+        assert common._common_page_items.cache_info().currsize == 2
+
     def test_record_key(self):
         """Test record key generation."""
         assert record_key(120, 12345) == "120_12345"
@@ -339,3 +368,81 @@ class TestCommonUtilities:
             mock_json_dump.assert_called_once()
             call_args = mock_json_dump.call_args[0]
             assert call_args[0] == expected_data
+
+    def test_load_found_devices_reuses_parse_while_unchanged(self, tmp_path):
+        """Test found devices are re-parsed only when the file changes."""
+        path = tmp_path / "found_devices.json"
+        path.write_text('{"120_1": {"device_id": 1}}')
+
+        first = load_found_devices(str(path))
+        assert load_found_devices(str(path)) is first
+
+        path.write_text('{"120_1": {"device_id": 1}, "121_2": {"device_id": 2}}')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = load_found_devices(str(path))
+        assert second is not first
+        assert set(second) == {"120_1", "121_2"}
+
+    def test_load_found_devices_detects_size_change(self, tmp_path):
+        """Test a rewrite that keeps the mtime but changes size is re-parsed."""
+        path = tmp_path / "found_devices.json"
+        path.write_text('{"120_1": {"device_id": 1}}')
+        mtime_ns = path.stat().st_mtime_ns
+
+        first = load_found_devices(str(path))
+
+        path.write_text('{"120_1": {"device_id": 1}, "121_2": {"device_id": 2}}')
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        assert set(load_found_devices(str(path))) == {"120_1", "121_2"}
+        assert first is not load_found_devices(str(path))
+
+    def test_load_found_devices_missing_file(self, tmp_path):
+        """Test a missing found devices file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_found_devices(str(tmp_path / "missing.json"))
+
+    def test_write_found_devices_replaces_atomically(self, tmp_path):
+        """Test the devices file is written via a temp file and os.replace."""
+        path = tmp_path / "found.json"
+        path.write_text('{"old": {}}')
+
+        write_found_devices(str(path), {"120_1": {"device_id": 1}})
+
+        assert load_found_devices(str(path)) == {"120_1": {"device_id": 1}}
+        assert not (tmp_path / "found.json.tmp").exists()
+
+    def test_format_timestamp_memoized_per_second(self):
+        """Test timestamps format as local time and share the per-second cache."""
+        ts = 1_700_000_000
+        expected = datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+        assert format_timestamp(ts) == expected
+        assert format_timestamp(ts + 0.75) is format_timestamp(ts)
+
+    def test_write_block_uses_wrapped_stream(self):
+        """Test a replaced stdout (e.g. colorama's wrapper) gets a text write."""
+        with patch("sys.stdout") as mock_stdout:
+            write_block("table\n")
+
+        mock_stdout.write.assert_called_once_with("table\n")
+        mock_stdout.flush.assert_called_once()
+
+    def test_write_block_writes_bytes_to_raw_stdout(self):
+        """Test the unwrapped interpreter stdout receives one encoded write."""
+        with patch("sys.stdout") as mock_stdout, patch("sys.__stdout__", mock_stdout):
+            mock_stdout.encoding = "utf-8"
+            mock_stdout.errors = "strict"
+            write_block("séance\n")
+
+        mock_stdout.buffer.write.assert_called_once_with("séance\n".encode())
+        mock_stdout.write.assert_not_called()
+
+    def test_cprint_writes_coloured_line(self):
+        """Test cprint wraps the message in colour and reset codes."""
+        with patch("sys.stdout") as mock_stdout:
+            cprint("\x1b[32m", "hello")
+
+        mock_stdout.write.assert_called_once_with("\x1b[32mhello\x1b[0m\n")
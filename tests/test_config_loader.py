@@ -4,6 +4,8 @@ Tests for configuration loader functionality.
 
 from unittest.mock import patch, mock_open
 
+import yaml
+
 from pyantdisplay.utils.config_loader import ConfigLoader
 
 
@@ -73,6 +75,23 @@ class TestConfigLoader:
 
         assert result == {"base": "value"}
 
+    def test_load_app_config_cached_until_file_changes(self, tmp_path):
+        """Test the parsed config is reused until a config file changes."""
+        app_config = tmp_path / "config.yaml"
+        app_config.write_text("app:\n  interval: 1\n")
+        loader = ConfigLoader()
+
+        with patch("yaml.safe_load", wraps=yaml.safe_load) as mock_yaml_load:
+            first = loader.load_app_config(str(app_config))
+            assert loader.load_app_config(str(app_config)) is first
+            assert mock_yaml_load.call_count == 1
+
+            app_config.write_text("app:\n  interval: 25\n")
+            second = loader.load_app_config(str(app_config))
+
+        assert mock_yaml_load.call_count == 2
+        assert second == {"app": {"interval": 25}}
+
     @patch("pyantdisplay.utils.config_loader.yaml", None)
     def test_load_app_config_no_yaml_module(self):
         """Test app config loading when PyYAML is not available."""
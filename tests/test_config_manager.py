@@ -2,6 +2,7 @@
 Tests for configuration manager functionality.
 """
 
+import os
 from unittest.mock import Mock, patch, mock_open
 
 import pytest
@@ -17,7 +18,7 @@ class TestConfigManager:
         "builtins.open",
         mock_open(read_data="devices:\n  heart_rate:\n    device_id: 12345"),
     )
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_init_loads_config(self, mock_yaml_load):
         """Test that initialization loads configuration."""
         mock_config = {"devices": {"heart_rate": {"device_id": 12345}}}
@@ -30,7 +31,7 @@ class TestConfigManager:
         mock_yaml_load.assert_called_once()
 
     @patch("builtins.open", mock_open(read_data="test: value"))
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_load_config_success(self, mock_yaml_load):
         """Test successful configuration loading."""
         mock_config = {"test": "value"}
@@ -48,7 +49,7 @@ class TestConfigManager:
             ConfigManager("nonexistent.yaml")
 
     @patch("builtins.open", mock_open(read_data="invalid: yaml: content: ["))
-    @patch("yaml.safe_load", side_effect=yaml.YAMLError("Invalid YAML"))
+    @patch("yaml.load", side_effect=yaml.YAMLError("Invalid YAML"))
     def test_load_config_yaml_error(self, mock_yaml_load):
         """Test configuration loading with YAML parsing error."""
         with pytest.raises(SystemExit):
@@ -59,27 +60,40 @@ class TestConfigManager:
     def test_save_config_success(self, mock_yaml_dump):
         """Test successful configuration saving."""
         with patch("builtins.open", mock_open(read_data="test: value")), patch(
-            "yaml.safe_load", return_value={"test": "value"}
+            "yaml.load", return_value={"test": "value"}
         ):
             config_manager = ConfigManager("test_config.yaml")
+            config_manager.config["test"] = "changed"
             config_manager.save_config()
 
             # Just verify yaml.dump was called with the right config data
             mock_yaml_dump.assert_called_once()
             call_args = mock_yaml_dump.call_args
             assert call_args[0][0] == {
-                "test": "value"
+                "test": "changed"
             }  # First positional arg should be the config
             assert call_args[1]["default_flow_style"] is False
             assert call_args[1]["indent"] == 2
 
+    @patch("yaml.dump")
+    def test_save_config_skips_dump_when_unchanged(self, mock_yaml_dump):
+        """Test saving an unmodified configuration skips serialization."""
+        with patch("builtins.open", mock_open(read_data="test: value")), patch(
+            "yaml.load", return_value={"test": "value"}
+        ):
+            config_manager = ConfigManager("test_config.yaml")
+            config_manager.save_config()
+
+        mock_yaml_dump.assert_not_called()
+
     @patch("builtins.open", side_effect=OSError("Permission denied"))
     def test_save_config_error(self, mock_open_error):
         """Test configuration saving with file write error."""
         with patch("builtins.open", mock_open(read_data="test: value")), patch(
-            "yaml.safe_load", return_value={"test": "value"}
+            "yaml.load", return_value={"test": "value"}
         ):
             config_manager = ConfigManager("test_config.yaml")
+            config_manager.config["test"] = "changed"
 
             # Override open for the save operation
             with patch("builtins.open", mock_open_error):
@@ -90,7 +104,7 @@ class TestConfigManager:
     def test_configure_devices_interactive_success(self, mock_device_config_service):
         """Test interactive device configuration success."""
         with patch("builtins.open", mock_open(read_data="test: value")), patch(
-            "yaml.safe_load", return_value={"test": "value"}
+            "yaml.load", return_value={"test": "value"}
         ):
             config_manager = ConfigManager("test_config.yaml")
 
@@ -110,7 +124,7 @@ class TestConfigManager:
     def test_configure_devices_interactive_failure(self, mock_device_config_service):
         """Test interactive device configuration failure."""
         with patch("builtins.open", mock_open(read_data="test: value")), patch(
-            "yaml.safe_load", return_value={"test": "value"}
+            "yaml.load", return_value={"test": "value"}
         ):
             config_manager = ConfigManager("test_config.yaml")
 
@@ -125,3 +139,53 @@ class TestConfigManager:
                 mock_device_config_service.assert_called_once_with({"test": "value"})
                 mock_service_instance.configure_devices_interactive.assert_called_once()
                 mock_save.assert_not_called()
+
+    def test_save_config_atomic_and_skips_unchanged(self, tmp_path):
+        """Test saving writes atomically and skips no-op rewrites."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("devices:\n  heart_rate:\n    device_id: 1\n")
+
+        config_manager = ConfigManager(str(config_file))
+        config_manager.config["devices"]["heart_rate"]["device_id"] = 2
+        config_manager.save_config()
+
+        assert yaml.safe_load(config_file.read_text()) == {
+            "devices": {"heart_rate": {"device_id": 2}}
+        }
+        assert not (tmp_path / "config.yaml.tmp").exists()
+
+        with patch("pyantdisplay.services.config_manager.os.replace") as mock_replace:
+            config_manager.save_config()
+            mock_replace.assert_not_called()
+
+    def test_load_config_uses_json_cache_when_fresh(self, tmp_path):
+        """Test the JSON sidecar cache short-circuits YAML parsing."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("app:\n  scan_timeout: 30\n")
+
+        first = ConfigManager(str(config_file))
+        assert (tmp_path / "config.yaml.cache.json").exists()
+
+        with patch("yaml.load") as mock_yaml_load:
+            second = ConfigManager(str(config_file))
+            mock_yaml_load.assert_not_called()
+        assert second.config == first.config == {"app": {"scan_timeout": 30}}
+
+        # Content change (different size) invalidates the cache
+        config_file.write_text("app:\n  scan_timeout: 120\n")
+        third = ConfigManager(str(config_file))
+        assert third.config == {"app": {"scan_timeout": 120}}
+
+    def test_load_config_cache_invalidated_by_rename_over(self, tmp_path):
+        """Test a same-size, same-mtime file renamed over the config is reparsed."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("app:\n  scan_timeout: 30\n")
+        ConfigManager(str(config_file))
+
+        st = os.stat(config_file)
+        replacement = tmp_path / "config.yaml.new"
+        replacement.write_text("app:\n  scan_timeout: 45\n")
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(replacement, config_file)
+
+        assert ConfigManager(str(config_file)).config == {"app": {"scan_timeout": 45}}
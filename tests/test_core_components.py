@@ -2,7 +2,7 @@
 Simple working tests for core components to increase coverage.
 """
 
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import MagicMock, Mock, patch, mock_open
 
 # Mock all openant imports to prevent USB device interaction
 openant_mock = Mock()
@@ -122,6 +122,61 @@ class TestCoreComponents:
         assert manager.device_manager == mock_device_manager
         assert manager.usb_detector == mock_usb_detector
 
+    @patch.dict(
+        "sys.modules",
+        {
+            "openant": openant_mock,
+            "openant.easy": openant_mock.easy,
+            "openant.easy.node": openant_mock.easy.node,
+            "openant.easy.channel": openant_mock.easy.channel,
+        },
+    )
+    def test_menu_manager_show_menu_single_write(self):
+        """Test the menu block is written once per loop for the USB state."""
+        from src.pyantdisplay.ui.menu_manager import MenuManager
+
+        manager = MenuManager(Mock(), Mock(), Mock())
+        manager.usb_stick_available = False
+
+        with patch("sys.stdout") as mock_stdout, patch(
+            "builtins.input", return_value="6"
+        ), patch("builtins.print"):
+            manager.show_menu()
+
+        mock_stdout.write.assert_called_once()
+        menu = mock_stdout.write.call_args[0][0]
+        assert "No ANT+ USB stick detected" in menu
+        assert "Scan for ANT+ devices (USB stick required)" in menu
+        assert "6. Exit" in menu
+
+    @patch.dict(
+        "sys.modules",
+        {
+            "openant": openant_mock,
+            "openant.easy": openant_mock.easy,
+            "openant.easy.node": openant_mock.easy.node,
+            "openant.easy.channel": openant_mock.easy.channel,
+        },
+    )
+    def test_menu_manager_dispatches_choices(self):
+        """Test menu choices are routed through the handler table."""
+        from src.pyantdisplay.ui.menu_manager import MenuManager
+
+        mock_usb_detector = Mock()
+        manager = MenuManager(Mock(), Mock(), mock_usb_detector)
+        manager._list_service = Mock()
+
+        with patch("sys.stdout"), patch(
+            "builtins.input", side_effect=["2", "9", "5", "6"]
+        ), patch("builtins.print") as mock_print:
+            manager.show_menu()
+
+        manager._list_service.list_found_devices.assert_called_once()
+        mock_usb_detector.print_setup_instructions.assert_called_once()
+        printed = " ".join(str(c.args[0]) for c in mock_print.call_args_list)
+        assert "Invalid option" in printed
+        assert "Goodbye!" in printed
+
     @patch.dict(
         "sys.modules",
         {
@@ -158,9 +213,10 @@ class TestCoreComponents:
 
         service = AppModeService()
 
-        with patch("builtins.print") as mock_print:
+        with patch("sys.stdout") as mock_stdout:
             service._display_device_list({})
-            mock_print.assert_called()
+            mock_stdout.write.assert_called_once()
+            assert "Found ANT+ Devices (0)" in mock_stdout.write.call_args[0][0]
 
     @patch.dict(
         "sys.modules",
@@ -179,6 +235,52 @@ class TestCoreComponents:
         service = DeviceListService(config)
         assert service.config == config
 
+    def test_device_list_table_single_write(self):
+        """Test the found-devices table is emitted with one write."""
+        from src.pyantdisplay.services.device_list import DeviceListService
+
+        service = DeviceListService({"app": {"found_devices_file": "test.json"}})
+        devices = {
+            "120_1": {
+                "device_id": 1,
+                "device_type": 120,
+                "device_name": "HR",
+                "last_seen": 0,
+            },
+            "121_2": {
+                "device_id": 2,
+                "device_type": 121,
+                "device_name": "Bike",
+                "last_seen": 0,
+            },
+        }
+
+        with patch("sys.stdout") as mock_stdout:
+            service._display_devices_table(devices)
+
+        mock_stdout.write.assert_called_once()
+        output = mock_stdout.write.call_args[0][0]
+        assert "=== Found ANT+ Devices ===" in output
+        assert "HR" in output and "Bike" in output
+
+    def test_device_list_count_uses_cached_devices(self, tmp_path):
+        """Test the device count reads through the shared found-devices cache."""
+        from src.pyantdisplay.services.device_list import DeviceListService
+
+        devices_file = tmp_path / "found.json"
+        devices_file.write_text('{"120_1": {}, "121_2": {}}')
+        service = DeviceListService({"app": {"found_devices_file": str(devices_file)}})
+
+        assert service.get_device_count() == 2
+        with patch("src.pyantdisplay.utils.common._json_loads") as mock_loads:
+            assert service.get_device_count() == 2
+        mock_loads.assert_not_called()
+
+        devices_file.write_text("{not json")
+        assert service.get_device_count() == 0
+        devices_file.unlink()
+        assert service.get_device_count() == 0
+
     @patch.dict(
         "sys.modules",
         {
@@ -192,9 +294,44 @@ class TestCoreComponents:
         """Test DeviceScanService initialization."""
         from src.pyantdisplay.services.device_scan import DeviceScanService
 
-        config = {"scan": {"timeout": 10}}
+        config = {
+            "ant_network": {"key": [1, 2, 3, 4, 5, 6, 7, 8]},
+            "app": {"scan_timeout": 10, "found_devices_file": "found.json"},
+        }
         service = DeviceScanService(config)
         assert service.config == config
+        assert service._scan_timeout == 10
+        assert service._devices_file == "found.json"
+
+    @patch.dict(
+        "sys.modules",
+        {
+            "openant": openant_mock,
+            "openant.easy": openant_mock.easy,
+            "openant.easy.node": openant_mock.easy.node,
+            "openant.easy.channel": openant_mock.easy.channel,
+        },
+    )
+    def test_device_scan_service_reuses_scanner(self):
+        """Test repeated scans reuse one scanner."""
+        from src.pyantdisplay.services.device_scan import DeviceScanService
+
+        config = {
+            "ant_network": {"key": [1, 2, 3, 4, 5, 6, 7, 8]},
+            "app": {"scan_timeout": 10, "found_devices_file": "found.json"},
+        }
+        service = DeviceScanService(config)
+
+        with patch(
+            "src.pyantdisplay.services.device_scan.DeviceScanner"
+        ) as mock_scanner_class, patch("builtins.print"):
+            service.scan_for_devices()
+            service.scan_for_devices()
+            assert mock_scanner_class.call_count == 1
+            mock_scanner_class.return_value.reset_results.assert_called_once()
+            mock_scanner_class.return_value.save_found_devices.assert_called_with(
+                "found.json"
+            )
 
     @patch.dict(
         "sys.modules",
@@ -2,8 +2,13 @@
 Tests for data display functionality.
 """
 
+import os
+import time
 from unittest.mock import Mock, patch
 
+import pytest
+
+from src.pyantdisplay.ui import data_display
 from src.pyantdisplay.ui.data_display import DataDisplayService
 
 
@@ -40,13 +45,16 @@ class TestDataDisplayService:
         display = DataDisplayService(self.mock_device_manager, self.config)
 
         # Simulate 'q' key press available
-        mock_select.return_value = ([mock_stdin], [], [])
-        mock_stdin.read.return_value = "q"
+        mock_stdin.fileno.return_value = 0
+        mock_select.return_value = ([0], [], [])
 
-        with patch("os.name", "posix"):
+        with patch("os.name", "posix"), patch(
+            "os.read", return_value=b"Q"
+        ) as mock_read:
             result = display._check_for_quit()
 
         assert result is True
+        mock_read.assert_called_once_with(0, 1)
 
     @patch("sys.stdin")
     @patch("select.select")
@@ -55,10 +63,15 @@ class TestDataDisplayService:
         display = DataDisplayService(self.mock_device_manager, self.config)
 
         # Simulate no input available
+        mock_stdin.fileno.return_value = 0
         mock_select.return_value = ([], [], [])
 
         with patch("os.name", "posix"):
             result = display._check_for_quit()
+            display._check_for_quit()
+
+        mock_select.assert_called_with([0], [], [], 0)
+        mock_stdin.fileno.assert_called_once()
 
         assert result is False
 
@@ -149,3 +162,309 @@ class TestDataDisplayService:
                 display.display_data()
 
         assert display.running is True
+
+    def test_hr_display_uses_frame_snapshot(self):
+        """Test HR box renders from the data passed in for the frame."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+
+        buf = []
+        display._hr_display_func(buf, 60, None)
+        assert "Waiting for data" in buf[-1]
+
+        buf = []
+        display._hr_display_func(buf, 60, {"heart_rate": 120, "rr_intervals": []})
+        assert "120 BPM" in buf[-1]
+        self.mock_device_manager.hr_monitor.is_data_fresh.assert_not_called()
+
+    def test_frame_written_in_single_write(self):
+        """Test a refresh frame is emitted with one stdout write."""
+        config = {"app": {"data_display_interval": 1}}
+        display = DataDisplayService(self.mock_device_manager, config)
+        self.mock_device_manager.devices = [Mock(connected=True)]
+        self.mock_device_manager.hr_monitor = None
+        self.mock_device_manager.bike_sensor = None
+
+        with patch("builtins.print"), patch("time.sleep"), patch(
+            "sys.stdout"
+        ) as mock_stdout, patch.object(
+            display, "_check_for_quit", side_effect=[False, True]
+        ):
+            display.display_data()
+
+        frames = [
+            c.args[0]
+            for c in mock_stdout.write.call_args_list
+            if "ANT+ Device Data Display" in c.args[0]
+        ]
+        assert len(frames) == 1
+        self.mock_device_manager.data_event.wait.assert_called_once_with(timeout=1)
+        self.mock_device_manager.data_event.clear.assert_called_once()
+        assert "Heart Rate Monitor" in frames[0]
+        assert "Bike Sensor" in frames[0]
+        assert "Press 'q'" in frames[0]
+        # The screen clear leads the same write, so each frame is one syscall
+        assert frames[0].startswith("\x1b[H\x1b[2J\x1b[3J")
+        mock_stdout.flush.assert_called_once()
+
+    def test_frames_go_to_raw_stdout_buffer_in_one_write(self):
+        """Test each frame, newlines included, is one binary buffer write."""
+        config = {"app": {"data_display_interval": 1}}
+        display = DataDisplayService(self.mock_device_manager, config)
+        self.mock_device_manager.devices = [Mock(connected=True)]
+        self.mock_device_manager.hr_monitor = None
+        self.mock_device_manager.bike_sensor = None
+
+        with patch("builtins.print"), patch("time.sleep"), patch(
+            "sys.stdout"
+        ) as mock_stdout, patch("sys.__stdout__", mock_stdout), patch.object(
+            display, "_check_for_quit", side_effect=[False, True]
+        ):
+            mock_stdout.encoding = "utf-8"
+            mock_stdout.errors = "strict"
+            display.display_data()
+
+        frames = [
+            c.args[0]
+            for c in mock_stdout.buffer.write.call_args_list
+            if "ANT+ Device Data Display".encode() in c.args[0]
+        ]
+        assert len(frames) == 1
+        assert frames[0].count(b"\n") > 10
+        mock_stdout.buffer.flush.assert_called_once()
+
+    def test_unchanged_values_skip_rendering_and_writes(self):
+        """Test frames with unchanged values neither rebuild nor write."""
+        config = {"app": {"data_display_interval": 1}}
+        display = DataDisplayService(self.mock_device_manager, config)
+        self.mock_device_manager.devices = [Mock(connected=True)]
+        self.mock_device_manager.hr_monitor = Mock(connected=True)
+        self.mock_device_manager.hr_monitor.is_data_fresh.return_value = True
+        self.mock_device_manager.hr_data = {"heart_rate": 120, "rr_intervals": []}
+        self.mock_device_manager.bike_sensor = None
+
+        with patch("builtins.print"), patch("time.sleep"), patch(
+            "time.time", return_value=1000.0
+        ), patch("sys.stdout") as mock_stdout, patch.object(
+            display, "_hr_display_func", wraps=display._hr_display_func
+        ) as hr_func, patch.object(
+            display, "_check_for_quit", side_effect=[False, False, False, True]
+        ):
+            display.display_data()
+
+        hr_func.assert_called_once()
+        frames = [
+            c.args[0]
+            for c in mock_stdout.write.call_args_list
+            if "\x1b[2J" in c.args[0] or ";1H" in c.args[0]
+        ]
+        assert len(frames) == 1
+
+    def test_terminal_width_measured_once_and_on_resize(self):
+        """Test the width is cached across frames and refreshed by SIGWINCH."""
+        config = {"app": {"data_display_interval": 1}}
+        display = DataDisplayService(self.mock_device_manager, config)
+        self.mock_device_manager.devices = [Mock(connected=True)]
+        self.mock_device_manager.hr_monitor = None
+        self.mock_device_manager.bike_sensor = None
+
+        with patch("builtins.print"), patch("time.sleep"), patch("sys.stdout"), patch(
+            "shutil.get_terminal_size", return_value=os.terminal_size((120, 40))
+        ) as mock_size, patch.dict("os.environ", clear=True), patch.object(
+            display, "_check_for_quit", side_effect=[False, False, False, True]
+        ):
+            display.display_data()
+
+        mock_size.assert_called_once()
+        assert display._cols == 80
+
+        with patch(
+            "shutil.get_terminal_size", return_value=os.terminal_size((60, 30))
+        ), patch.dict("os.environ", clear=True):
+            display._on_resize(None, None)
+        assert display._cols == 60
+        assert display._rows == 30
+
+    def test_columns_env_skips_terminal_query(self):
+        """Test $COLUMNS and $LINES are used without querying the terminal."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+
+        with patch("os.get_terminal_size") as mock_size, patch.dict(
+            "os.environ", {"COLUMNS": "50", "LINES": "20"}
+        ):
+            display._update_size()
+        assert (display._cols, display._rows) == (50, 20)
+        mock_size.assert_not_called()
+
+        with patch("shutil.get_terminal_size", side_effect=OSError), patch.dict(
+            "os.environ", {"COLUMNS": "wide"}
+        ):
+            display._update_size()
+        assert (display._cols, display._rows) == (80, 24)
+
+    def test_device_box_borders_cached_per_width(self):
+        """Test box borders are built once per width and padded to the edge."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+
+        first, second = [], []
+        display._print_device_box(first, "Bike Sensor", "🚴", False, None, 40, None)
+        display._print_device_box(second, "Bike Sensor", "🚴", False, None, 40, None)
+
+        assert list(display._box_cache) == [("Bike Sensor", "🚴", 36)]
+        assert first == second
+        assert first[0] is second[0]
+        assert display._calculate_display_width(first[1]) == 37
+        assert first[1].endswith("│")
+
+    def test_frame_update_repaints_only_changed_lines(self):
+        """Test frames after the first rewrite only the lines that changed."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+
+        first = display._frame_update(["head", "hr 100", "\nfoot", ""])
+        assert first == "\x1b[H\x1b[2J\x1b[3J" + "head\nhr 100\n\nfoot\n"
+
+        assert display._frame_update(["head", "hr 100", "\nfoot", ""]) == ""
+
+        update = display._frame_update(["head", "hr 101", "\nfoot", ""])
+        assert update == "\x1b[2;1H\x1b[2Khr 101\x1b[5;1H"
+
+        # A different line count (or a resize) falls back to a full redraw
+        assert display._frame_update(["head", ""]).startswith("\x1b[H")
+        display._on_resize(None, None)
+        assert display._frame_update(["head", ""]).startswith("\x1b[H")
+
+    def test_frame_update_redraws_frames_taller_than_terminal(self):
+        """Test a frame that would scroll is never patched by row number."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+        display._rows = 4
+
+        frame = ["head", "hr 100", "\nfoot", ""]
+        assert display._frame_update(frame).startswith("\x1b[H")
+        frame[1] = "hr 101"
+        assert display._frame_update(frame) == (
+            "\x1b[H\x1b[2J\x1b[3J" + "head\nhr 101\n\nfoot\n"
+        )
+
+    @pytest.mark.skipif(os.name != "posix", reason="selects on a pipe")
+    def test_input_watcher_sets_quit_flag(self):
+        """Test the stdin thread flags quit and wakes the frame loop."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+        read_fd, write_fd = os.pipe()
+        try:
+            with patch("sys.stdin") as mock_stdin:
+                mock_stdin.fileno.return_value = read_fd
+                thread, stop_w = display._start_input_watcher()
+            os.write(write_fd, b"xQ")
+            thread.join(timeout=2)
+
+            assert not thread.is_alive()
+            assert display.quit_requested is True
+            self.mock_device_manager.data_event.set.assert_called_once()
+            display._stop_input_watcher(thread, stop_w)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    @pytest.mark.skipif(os.name != "posix", reason="selects on a pipe")
+    def test_input_watcher_stops_on_request(self):
+        """Test the stdin thread exits through its stop pipe."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+        read_fd, write_fd = os.pipe()
+        try:
+            with patch("sys.stdin") as mock_stdin:
+                mock_stdin.fileno.return_value = read_fd
+                thread, stop_w = display._start_input_watcher()
+            display._stop_input_watcher(thread, stop_w)
+
+            assert not thread.is_alive()
+            assert display.quit_requested is False
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_check_for_quit_windows_uses_module_msvcrt(self):
+        """Test the Windows quit check uses the msvcrt imported at load time."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+        console = Mock()
+        console.kbhit.return_value = True
+        console.getch.return_value = b"Q"
+
+        with patch("os.name", "nt"), patch.object(data_display, "msvcrt", console):
+            assert display._check_for_quit() is True
+        with patch("os.name", "nt"), patch.object(data_display, "msvcrt", None):
+            assert display._check_for_quit() is False
+
+    def test_hr_zone_boundaries(self):
+        """Test each zone starts at its lower bound."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+        expected = {
+            99: "Rest",
+            100: "Aerobic",
+            139: "Aerobic",
+            140: "Threshold",
+            169: "Threshold",
+            170: "Anaerobic",
+        }
+        for hr, zone in expected.items():
+            buf = []
+            display._hr_display_func(buf, 60, {"heart_rate": hr})
+            assert f"({zone})" in buf[0]
+
+    def test_bike_display_formats_templates(self):
+        """Test bike box lines are formatted from the precomputed templates."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+        bike_data = {"speed": 25.5, "cadence": 90, "distance": 1.234}
+
+        buf = []
+        display._bike_display_func(buf, 60, bike_data)
+
+        assert "Speed:  25.5 km/h" in buf[0]
+        assert "Cadence:  90 RPM" in buf[1]
+        assert "Distance:   1.23 km" in buf[2]
+        assert all(line.endswith("│") for line in buf)
+
+    def test_header_timestamp_formatted_once_per_second(self):
+        """Test the header clock is only reformatted when the second changes."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+
+        with patch("time.time", side_effect=[1000.1, 1000.6, 1001.2]), patch(
+            "time.localtime", wraps=time.localtime
+        ) as mock_localtime:
+            frames = []
+            for _ in range(3):
+                buf = []
+                display._display_header(buf, 80)
+                frames.append(buf)
+
+        assert mock_localtime.call_count == 2
+        first = time.strftime("%H:%M:%S • %Y-%m-%d", time.localtime(1000))
+        second = time.strftime("%H:%M:%S • %Y-%m-%d", time.localtime(1001))
+        assert first in frames[0][3] and first in frames[1][3]
+        assert second in frames[2][3]
+
+    def test_header_date_formatted_once_per_day(self):
+        """Test the date part of the clock is only reformatted on a new day."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+
+        with patch("time.time", side_effect=[1000.0, 1001.0, 1000.0 + 86400]), patch(
+            "time.strftime", wraps=time.strftime
+        ) as mock_strftime:
+            for _ in range(3):
+                display._display_header([], 80)
+
+        assert mock_strftime.call_count == 2
+
+    def test_header_banner_cached_per_width(self):
+        """Test the banner lines are built once per width and reused."""
+        display = DataDisplayService(self.mock_device_manager, self.config)
+
+        first, second, narrow = [], [], []
+        display._display_header(first, 80)
+        display._display_header(second, 80)
+        display._display_header(narrow, 40)
+
+        assert first[:3] == second[:3]
+        assert first[1] is second[1]
+        assert first[0] == first[2]
+        assert "ANT+ Device Data Display" in first[1]
+        assert set(display._header_cache) == {80, 40}
+        assert display._calculate_display_width(narrow[0]) == 40
@@ -19,6 +19,21 @@ class TestDeviceConfigurationService:
 
         assert service.config == config
 
+    def test_split_devices_single_pass(self):
+        """Test found devices are split into HR and bike lists."""
+        service = DeviceConfigurationService({})
+        found_devices = {
+            "120_1": {"device_id": 1, "device_type": 120},
+            "121_2": {"device_id": 2, "device_type": 121},
+            "11_3": {"device_id": 3, "device_type": 11},
+            "123_4": {"device_id": 4, "device_type": 123},
+        }
+
+        hr_devices, bike_devices = service._split_devices(found_devices)
+
+        assert [d["device_id"] for d in hr_devices] == [1]
+        assert [d["device_id"] for d in bike_devices] == [2, 4]
+
     @patch(
         "builtins.open",
         mock_open(
@@ -150,6 +165,36 @@ class TestDeviceConfigurationService:
         # Should return True (configuration completed successfully)
         assert result is True
 
+    @patch(
+        "builtins.open",
+        mock_open(
+            read_data='{"120_12345": {"device_id": 12345, "device_type": 120, '
+            '"device_name": "HR Monitor"}, "121_67890": {"device_id": 67890, '
+            '"device_type": 121, "device_name": "Bike Sensor"}}'
+        ),
+    )
+    @patch("builtins.input")
+    def test_configure_devices_out_of_range_choice(self, mock_input):
+        """Test an out-of-range choice leaves the device unselected."""
+        config = {
+            "app": {"found_devices_file": "test_devices.json"},
+            "devices": {
+                "heart_rate": {"enabled": False, "device_id": None},
+                "bike_data": {"enabled": False, "device_id": None},
+            },
+        }
+
+        # HR choice out of range, bike choice valid
+        mock_input.side_effect = ["2", "1"]
+
+        service = DeviceConfigurationService(config)
+        with patch("builtins.print"):
+            result = service.configure_devices_interactive()
+
+        assert result is True
+        assert config["devices"]["heart_rate"]["device_id"] is None
+        assert config["devices"]["bike_data"]["device_id"] == 67890
+
     @patch("builtins.open", mock_open(read_data="invalid json"))
     def test_configure_devices_json_error(self):
         """Test device configuration with malformed JSON file."""
@@ -3,6 +3,7 @@ Tests for device manager functionality.
 """
 
 import sys
+import threading
 from unittest.mock import Mock, MagicMock, patch
 
 # Mock openant modules at import time to prevent USB device access
@@ -43,8 +44,8 @@ class TestDeviceManager:
         assert device_manager.hr_data == {}
         assert device_manager.bike_data == {}
 
-    @patch("pyantdisplay.managers.device_manager.HeartRateMonitor")
-    @patch("pyantdisplay.managers.device_manager.BikeSensor")
+    @patch("pyantdisplay.devices.heart_rate_monitor.HeartRateMonitor")
+    @patch("pyantdisplay.devices.bike_sensor.BikeSensor")
     def test_connect_devices_both_enabled_success(
         self, mock_bike_sensor_class, mock_hr_monitor_class
     ):
@@ -90,8 +91,8 @@ class TestDeviceManager:
         assert mock_hr_monitor in device_manager.devices
         assert mock_bike_sensor in device_manager.devices
 
-    @patch("pyantdisplay.managers.device_manager.HeartRateMonitor")
-    @patch("pyantdisplay.managers.device_manager.BikeSensor")
+    @patch("pyantdisplay.devices.heart_rate_monitor.HeartRateMonitor")
+    @patch("pyantdisplay.devices.bike_sensor.BikeSensor")
     def test_connect_devices_connection_failures(
         self, mock_bike_sensor_class, mock_hr_monitor_class
     ):
@@ -119,6 +120,43 @@ class TestDeviceManager:
         # Verify devices not added to list
         assert len(device_manager.devices) == 0
 
+    def test_connect_devices_opens_nodes_one_at_a_time(self):
+        """Test the sensors never open the shared USB stick concurrently."""
+        config = {
+            "ant_network": {"key": [0xB9, 0xA5, 0x21, 0xFB, 0xBD, 0x72, 0xC3, 0x45]},
+            "devices": {
+                "heart_rate": {"enabled": True, "device_id": 12345},
+                "bike_data": {"enabled": True, "device_id": 67890},
+            },
+        }
+
+        lock = threading.Lock()
+        active = []
+        overlaps = []
+
+        def open_node():
+            with lock:
+                if active:
+                    overlaps.append(True)
+                active.append(True)
+            # Hold the "USB claim" long enough for a concurrent connect to land
+            threading.Event().wait(0.05)
+            with lock:
+                active.pop()
+            return MagicMock()
+
+        with patch(
+            "pyantdisplay.devices.heart_rate_monitor.Node", side_effect=open_node
+        ), patch("pyantdisplay.devices.bike_sensor.Node", side_effect=open_node):
+            device_manager = DeviceManager(config)
+            device_manager.connect_devices()
+
+        assert overlaps == []
+        assert device_manager.devices == [
+            device_manager.hr_monitor,
+            device_manager.bike_sensor,
+        ]
+
     def test_connect_devices_hr_disabled(self):
         """Test connecting devices when heart rate is disabled."""
         config = {
@@ -130,7 +168,7 @@ class TestDeviceManager:
         }
 
         with patch(
-            "pyantdisplay.managers.device_manager.BikeSensor"
+            "pyantdisplay.devices.bike_sensor.BikeSensor"
         ) as mock_bike_sensor_class:
             mock_bike_sensor = Mock()
             mock_bike_sensor.connect.return_value = True
@@ -155,7 +193,7 @@ class TestDeviceManager:
         }
 
         with patch(
-            "pyantdisplay.managers.device_manager.BikeSensor"
+            "pyantdisplay.devices.bike_sensor.BikeSensor"
         ) as mock_bike_sensor_class:
             mock_bike_sensor = Mock()
             mock_bike_sensor.connect.return_value = True
@@ -182,9 +220,13 @@ class TestDeviceManager:
         device_manager = DeviceManager(config)
         test_data = {"heart_rate": 75, "beat_count": 100}
 
+        assert not device_manager.data_event.is_set()
+        hr_data = device_manager.hr_data
         device_manager._on_hr_data(test_data)
 
         assert device_manager.hr_data == test_data
+        assert device_manager.hr_data is hr_data
+        assert device_manager.data_event.is_set()
 
     def test_on_bike_data_callback(self):
         """Test bike sensor data callback."""
@@ -199,9 +241,12 @@ class TestDeviceManager:
         device_manager = DeviceManager(config)
         test_data = {"speed": 25.5, "cadence": 85, "distance": 10.2}
 
+        bike_data = device_manager.bike_data
         device_manager._on_bike_data(test_data)
 
         assert device_manager.bike_data == test_data
+        assert device_manager.bike_data is bike_data
+        assert device_manager.data_event.is_set()
 
     def test_get_connected_devices(self):
         """Test getting connected devices."""
@@ -241,11 +286,8 @@ class TestDeviceManager:
 
         device_manager = DeviceManager(config)
 
-        # Mock get_connected_devices to return non-empty list
-        with patch.object(
-            device_manager, "get_connected_devices", return_value=[Mock()]
-        ):
-            assert device_manager.has_connected_devices() is True
+        device_manager.devices = [Mock(connected=False), Mock(connected=True)]
+        assert device_manager.has_connected_devices() is True
 
     def test_has_connected_devices_false(self):
         """Test has_connected_devices returns False when no devices are connected."""
@@ -259,9 +301,8 @@ class TestDeviceManager:
 
         device_manager = DeviceManager(config)
 
-        # Mock get_connected_devices to return empty list
-        with patch.object(device_manager, "get_connected_devices", return_value=[]):
-            assert device_manager.has_connected_devices() is False
+        device_manager.devices = [Mock(connected=False), Mock(connected=False)]
+        assert device_manager.has_connected_devices() is False
 
     def test_stop(self):
         """Test stopping device manager."""
@@ -281,12 +322,15 @@ class TestDeviceManager:
         mock_bike_sensor = Mock()
         device_manager.hr_monitor = mock_hr_monitor
         device_manager.bike_sensor = mock_bike_sensor
+        device_manager.devices = [mock_hr_monitor, mock_bike_sensor]
 
         device_manager.stop()
 
         assert device_manager.running is False
         mock_hr_monitor.disconnect.assert_called_once()
         mock_bike_sensor.disconnect.assert_called_once()
+        assert device_manager.devices == []
+        assert device_manager.has_connected_devices() is False
 
     def test_stop_no_devices(self):
         """Test stopping device manager when no devices are connected."""
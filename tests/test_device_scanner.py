@@ -2,6 +2,7 @@
 Tests for device scanner functionality.
 """
 
+import json
 from unittest.mock import MagicMock, Mock, patch
 
 from pyantdisplay.services.device_scanner import DeviceScanner
@@ -97,25 +98,14 @@ class TestDeviceScanner:
 
     @patch("pyantdisplay.services.device_scanner.AntBackend")
     @patch("pyantdisplay.services.device_scanner.load_manufacturers")
-    @patch("builtins.open", create=True)
-    @patch("json.load")
-    @patch("json.dump")
     def test_save_found_devices(
-        self,
-        mock_json_dump,
-        mock_json_load,
-        mock_open,
-        mock_load_manufacturers,
-        mock_backend_class,
+        self, mock_load_manufacturers, mock_backend_class, tmp_path
     ):
         """Test saving found devices to file."""
         mock_backend = Mock()
         mock_backend_class.return_value = mock_backend
         mock_load_manufacturers.return_value = {}
 
-        # Mock the file reading to return empty dict (simulating no existing file)
-        mock_json_load.side_effect = FileNotFoundError()
-
         network_key = [0xB9, 0xA5, 0x21, 0xFB, 0xBD, 0x72, 0xC3, 0x45]
         scanner = DeviceScanner(network_key)
 
@@ -128,20 +118,57 @@ class TestDeviceScanner:
             }
         }
 
-        scanner.save_found_devices("test_devices.json")
+        # No existing file: the save creates it
+        path = tmp_path / "test_devices.json"
+        scanner.save_found_devices(str(path))
+
+        assert json.loads(path.read_text()) == scanner.found_devices
+
+    @patch("pyantdisplay.services.device_scanner.AntBackend")
+    @patch("pyantdisplay.services.device_scanner.load_manufacturers")
+    def test_save_found_devices_merges_existing(
+        self, mock_load_manufacturers, mock_backend_class, tmp_path
+    ):
+        """Test saving merges new devices into the existing file."""
+        mock_backend_class.return_value = Mock()
+        mock_load_manufacturers.return_value = {}
+
+        path = tmp_path / "test_devices.json"
+        path.write_text('{"121_1": {"device_id": 1, "device_type": 121}}')
+
+        scanner = DeviceScanner([0xB9, 0xA5, 0x21, 0xFB, 0xBD, 0x72, 0xC3, 0x45])
+        scanner.found_devices = {"120_2": {"device_id": 2, "device_type": 120}}
+        merged = scanner.save_found_devices(str(path))
+
+        assert set(json.loads(path.read_text())) == {"121_1", "120_2"}
+        assert merged == json.loads(path.read_text())
+
+    @patch("pyantdisplay.services.device_scanner.AntBackend")
+    @patch("pyantdisplay.services.device_scanner.load_manufacturers")
+    def test_save_found_devices_skips_unchanged_file(
+        self, mock_load_manufacturers, mock_backend_class, tmp_path
+    ):
+        """Test a save that adds nothing leaves the existing file alone."""
+        mock_backend_class.return_value = Mock()
+        mock_load_manufacturers.return_value = {}
+
+        path = tmp_path / "test_devices.json"
+        path.write_text('{"121_1": {"device_id": 1, "device_type": 121}}')
+
+        scanner = DeviceScanner([0xB9, 0xA5, 0x21, 0xFB, 0xBD, 0x72, 0xC3, 0x45])
+        scanner.found_devices = {"121_1": {"device_id": 1, "device_type": 121}}
+        with patch(
+            "pyantdisplay.services.device_scanner.write_found_devices"
+        ) as mock_write:
+            merged = scanner.save_found_devices(str(path))
 
-        # Should be called twice: once for read attempt, once for write
-        assert mock_open.call_count == 2
-        mock_open.assert_any_call("test_devices.json", "r")
-        mock_open.assert_any_call("test_devices.json", "w")
-        mock_json_dump.assert_called_once()
+        mock_write.assert_not_called()
+        assert merged == {"121_1": {"device_id": 1, "device_type": 121}}
 
     @patch("pyantdisplay.services.device_scanner.AntBackend")
     @patch("pyantdisplay.services.device_scanner.load_manufacturers")
-    @patch("builtins.open", create=True)
-    @patch("json.load")
     def test_load_found_devices_success(
-        self, mock_json_load, mock_open, mock_load_manufacturers, mock_backend_class
+        self, mock_load_manufacturers, mock_backend_class, tmp_path
     ):
         """Test loading found devices from file."""
         mock_backend = Mock()
@@ -158,12 +185,12 @@ class TestDeviceScanner:
                 "device_name": "Test HR Monitor",
             }
         }
-        mock_json_load.return_value = mock_devices
+        path = tmp_path / "test_devices.json"
+        path.write_text(json.dumps(mock_devices))
 
-        devices = scanner.load_found_devices("test_devices.json")
+        devices = scanner.load_found_devices(str(path))
 
         assert devices == mock_devices
-        mock_open.assert_called_once_with("test_devices.json", "r")
 
     @patch("pyantdisplay.services.device_scanner.AntBackend")
     @patch("pyantdisplay.services.device_scanner.load_manufacturers")
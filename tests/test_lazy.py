@@ -0,0 +1,38 @@
+"""
+Tests for the lazy package export helper.
+"""
+
+import pytest
+
+from pyantdisplay.utils.lazy import lazy_exports
+
+
+class TestLazyExports:
+    """Test cases for lazy_exports."""
+
+    def _namespace(self):
+        return {"__name__": "pyantdisplay.utils"}
+
+    def test_resolves_and_caches_export(self):
+        """Test a listed name is imported on access and cached."""
+        namespace = self._namespace()
+        getattr_, _ = lazy_exports(namespace, {"record_key": ".common"})
+
+        from pyantdisplay.utils.common import record_key
+
+        assert getattr_("record_key") is record_key
+        assert namespace["record_key"] is record_key
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test an unlisted name raises AttributeError naming the package."""
+        getattr_, _ = lazy_exports(self._namespace(), {"record_key": ".common"})
+
+        with pytest.raises(AttributeError, match="pyantdisplay.utils"):
+            getattr_("missing")
+
+    def test_dir_includes_unresolved_exports(self):
+        """Test __dir__ lists exports before they are resolved."""
+        namespace = self._namespace()
+        _, dir_ = lazy_exports(namespace, {"record_key": ".common"})
+
+        assert dir_() == ["__name__", "record_key"]
@@ -3,6 +3,7 @@ Tests for live monitor functionality - focusing on core functionality.
 """
 
 from unittest.mock import Mock, patch, MagicMock, mock_open
+import array
 import threading
 import time
 
@@ -18,6 +19,7 @@ with patch.dict(
         "openant.easy.channel": Mock(),
     },
 ):
+    from src.pyantdisplay.ui import live_monitor
     from src.pyantdisplay.ui.live_monitor import LiveMonitor
 
 
@@ -297,3 +299,469 @@ class TestLiveMonitor:
         for path in paths_to_test:
             monitor = LiveMonitor(self.sensor_config, path)
             assert monitor.save_path == path
+
+    @patch("yaml.safe_load")
+    @patch("builtins.open", mock_open())
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_calculate_display_width(self, mock_node, mock_yaml):
+        """Test display width handles ASCII, ANSI codes and wide characters."""
+        mock_yaml.return_value = self.config_data
+
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+
+        assert monitor._calculate_display_width("Alice") == 5
+        assert monitor._calculate_display_width("\x1b[32m120\x1b[0m") == 3
+        assert monitor._calculate_display_width("🚴 Speed") == 8
+        assert monitor._calculate_display_width("漢字") == 4
+        assert live_monitor._WIDTH_CACHE[ord("漢")] == 2
+        assert monitor._rjust_display_width("🚴", 4) == "  🚴"
+
+    @patch("yaml.safe_load")
+    @patch("builtins.open", mock_open())
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    @patch.object(live_monitor, "_KEY_POLL_SECS", 0)
+    def test_run_curses_redraws_only_changed_cells(self, mock_node, mock_yaml):
+        """Test the header is drawn once and unchanged row cells are skipped."""
+        mock_yaml.return_value = {"sensor_map": {"users": []}}
+
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        monitor.user_values["Alice"] = {
+            "hr": 120,
+            "speed": None,
+            "cadence": None,
+            "power": None,
+        }
+        stdscr = Mock()
+        stdscr.getmaxyx.return_value = (24, 80)
+        keys = iter([-1, -1, -1, ord("q")])
+
+        def getch():
+            key = next(keys)
+            if key == -1 and stdscr.getch.call_count == 2:
+                monitor.user_values["Alice"]["hr"] = 95
+                monitor._dirty.set()
+            return key
+
+        stdscr.getch.side_effect = getch
+
+        with patch.object(live_monitor, "curses"):
+            monitor.run_curses(stdscr)
+
+        calls = [c.args for c in stdscr.addstr.call_args_list]
+        header = [c for c in calls if c[0] == 3]
+        separators = [c for c in calls if c[0] == 4]
+        rows = [c for c in calls if c[0] == 5]
+        assert len(header) == 5
+        assert len(separators) == 1
+        # First frame draws all five cells, the second only the changed HR
+        assert len(rows) == 6
+        assert rows[-1][1:3] == (live_monitor._HR_VALUE_COL, "95     ")
+        assert monitor.stop_event.is_set()
+
+    @patch("yaml.safe_load")
+    @patch("builtins.open", mock_open())
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    @patch.object(live_monitor, "_KEY_POLL_SECS", 0)
+    def test_run_curses_waits_for_data_between_frames(self, mock_node, mock_yaml):
+        """Test idle polls skip redraws until data arrives or the frame is due."""
+        mock_yaml.return_value = {"sensor_map": {"users": []}}
+
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        stdscr = Mock()
+        stdscr.getmaxyx.return_value = (24, 80)
+        stdscr.getch.side_effect = [-1, -1, -1, ord("q")]
+
+        with patch.object(monitor, "_draw_frame") as mock_draw:
+            with patch.object(live_monitor.time, "monotonic", return_value=100.0):
+                with patch.object(live_monitor, "curses"):
+                    monitor.run_curses(stdscr)
+
+        # Only the first poll draws; the clock never reaches the next frame
+        assert mock_draw.call_count == 1
+        stdscr.nodelay.assert_called_once_with(True)
+        stdscr.timeout.assert_not_called()
+        stdscr.noutrefresh.assert_called_once()
+        stdscr.refresh.assert_not_called()
+
+    @patch.object(
+        LiveMonitor,
+        "_load_config",
+        return_value={
+            "sensor_map": {"users": [{"name": "Alice", "hr_device_ids": [111]}]}
+        },
+    )
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_broadcast_is_queued_until_drained(self, mock_node, mock_config):
+        """Test channel callbacks only enqueue; the curses thread applies them."""
+
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        monitor.node = Mock()
+        with patch.object(live_monitor.time, "monotonic", return_value=42.0):
+            monitor._open_channel(111, 120, "Alice-HR")
+            ch = monitor.node.new_channel.return_value
+
+            with monitor.lock:
+                # The ANT thread never needs the lock
+                ch.on_broadcast_data(array.array("B", [0, 0, 0, 0, 0x00, 0x04, 7, 130]))
+
+        assert monitor.device_values == {}
+        assert monitor._dirty.is_set()
+        assert len(monitor._events) == 1
+
+        monitor._drain_events()
+
+        assert not monitor._events
+        dv = monitor.device_values[111]
+        assert dv["hr"] == 130
+        assert dv["beat_time"] == 1.0
+        assert dv["label"] == "Alice-HR"
+        assert dv["ts"] == 42.0
+        assert monitor.last_hr_active_user == "Alice"
+
+    @patch.object(
+        LiveMonitor, "_load_config", return_value={"wheel_circumference_m": 2.0}
+    )
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_bike_speed_uses_configured_circumference(self, mock_node, mock_config):
+        """Test speed is derived from the wheel circumference read at startup."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        monitor._make_apply(5, 123, "Speed")(bytes([0, 0, 0, 0, 0, 0, 0, 0]), 1.0)
+        # One second later (1024 ticks) the wheel turned five times
+        monitor._make_apply(5, 123, "Speed")(bytes([0, 0, 0, 0, 0, 4, 5, 0]), 2.0)
+
+        dv = monitor.device_values[5]
+        assert dv["speed"] == pytest.approx(36.0)
+        assert dv["cadence"] is None
+        assert dv["ts"] == 2.0
+
+    @patch.object(LiveMonitor, "_load_config", return_value={})
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_channel_id_requested_once(self, mock_node, mock_config):
+        """Test the channel ID is cached and idle saves are rate limited."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        monitor.node = Mock()
+        monitor._open_channel(111, 120, "HR")
+        ch = monitor.node.new_channel.return_value
+        ch.request_message.return_value = (0, 0, [0x6F, 0x00, 120, 1])
+        hr_page = [4, 0, 0, 0, 0, 4, 7, 130]
+        # Common page 80: manufacturer 1, hardware revision 3
+        common_page = [80, 0xFF, 0xFF, 3, 1, 0, 5, 0]
+
+        with patch.object(monitor, "_save_found") as mock_save:
+            ch.on_broadcast_data(hr_page)
+            monitor.last_save_times["120_111"] = time.time()
+            ch.on_broadcast_data(hr_page)
+            ch.on_broadcast_data(common_page)
+
+        ch.request_message.assert_called_once()
+        assert mock_save.call_count == 2
+        assert mock_save.call_args_list[0].args == (111, 120, 1)
+        assert mock_save.call_args_list[1].kwargs["extra"]
+
+    @patch.object(LiveMonitor, "_load_config", return_value={})
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_power_broadcast_decoding(self, mock_node, mock_config):
+        """Test power is read from bytes 7-8 only when the payload has them."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        monitor._make_apply(9, 11, "Power")(
+            bytes([0x10, 0, 0, 0, 0, 0, 0, 0x2C, 0x01]), 1.0
+        )
+        assert monitor.device_values[9]["power"] == 300
+
+        monitor._make_apply(9, 11, "Power")(bytes(8), 2.0)
+        assert monitor.device_values[9]["power"] is None
+
+    @pytest.mark.parametrize(
+        "device_type,period",
+        [(120, 8070), (121, 8086), (122, 8102), (123, 8118), (11, 8182), (17, 8086)],
+    )
+    @patch.object(LiveMonitor, "_load_config", return_value={})
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_channel_period_per_profile(
+        self, mock_node, mock_config, device_type, period
+    ):
+        """Test each ANT+ profile opens its channel at the profile's period."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        monitor.node = Mock()
+
+        monitor._open_channel(1, device_type, "Sensor")
+
+        ch = monitor.node.new_channel.return_value
+        ch.set_period.assert_called_once_with(period)
+
+    @patch.object(
+        LiveMonitor,
+        "_load_config",
+        return_value={
+            "sensor_map": {
+                "users": [
+                    {"name": "Alice", "hr_device_ids": [111, 112]},
+                    {"name": "Bob", "hr_device_id": 222},
+                    {"name": "Carol", "hr_device_ids": [111]},
+                ]
+            }
+        },
+    )
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_hr_indexes(self, mock_node, mock_config):
+        """Test HR straps are indexed by user and owner at startup."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+
+        assert monitor._user_to_hr_ids == {
+            "Alice": (111, 112),
+            "Bob": (222,),
+            "Carol": (111,),
+        }
+        assert monitor._user_for_hr(112) == "Alice"
+        assert monitor._user_for_hr(222) == "Bob"
+        # The first user listing a shared strap owns it
+        assert monitor._user_for_hr(111) == "Alice"
+        assert monitor._user_for_hr(999) is None
+
+        # The render pass takes the first strap with data for each user
+        monitor.device_values[112] = {"hr": 140}
+        monitor.device_values[222] = {"hr": 0}
+        monitor._update_user_hr()
+        assert monitor.user_values["Alice"]["hr"] == 140
+        assert monitor.user_values["Bob"]["hr"] is None
+        assert monitor.last_hr_active_user == "Alice"
+
+    @patch.object(
+        LiveMonitor,
+        "_load_config",
+        return_value={
+            "sensor_map": {
+                "users": [{"name": "Alice", "hr_device_ids": [111]}],
+                "wattbike": {"power_device_id": 9},
+            }
+        },
+    )
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_state_entries_are_replaced_not_mutated(self, mock_node, mock_config):
+        """Test readers holding an entry never see it change underneath them."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        power = bytes([0x10, 0, 0, 0, 0, 0, 0, 0x2C, 0x01])
+        monitor._make_apply(9, 11, "Power")(power, 1.0)
+        monitor._make_apply(111, 120, "HR")(bytes([0, 0, 0, 0, 0, 4, 1, 120]), 1.0)
+        monitor._update_user_hr()
+        monitor._assign_shared_sensors()
+        device_snapshot = monitor.device_values[9]
+        user_snapshot = monitor.user_values["Alice"]
+
+        monitor._make_apply(9, 11, "Power")(bytes(9), 2.0)
+        monitor._assign_shared_sensors()
+
+        assert device_snapshot["power"] == 300
+        assert device_snapshot["ts"] == 1.0
+        assert monitor.device_values[9]["power"] == 0
+        assert user_snapshot["power"] == 300
+        assert user_snapshot["hr"] == 120
+        assert monitor.user_values["Alice"]["power"] == 0
+
+    @patch.object(LiveMonitor, "_load_config", return_value={})
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_saves_are_written_by_save_thread(self, mock_node, mock_config):
+        """Test found devices are queued and merged into the file off-thread."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+
+        with patch.object(live_monitor, "deep_merge_save") as mock_save:
+            monitor._save_found(111, 120, 1)
+            # Nothing touches the file from the calling thread
+            mock_save.assert_not_called()
+
+            monitor.start()
+            monitor._save_found(222, 11, 5, extra={"manufacturer_id": 1})
+            monitor.stop()
+
+        assert monitor._save_thread is None
+        assert [c.args for c in mock_save.call_args_list] == [
+            (self.save_path, 111, 120, 1),
+            (self.save_path, 222, 11, 5),
+        ]
+        assert mock_save.call_args_list[1].kwargs["base_extra"] == {
+            "manufacturer_id": 1
+        }
+        assert mock_save.call_args_list[0].kwargs["rate_limit_secs"] == 30
+
+    @patch.object(LiveMonitor, "_load_config", return_value={})
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_decoder_per_device_type(self, mock_node, mock_config):
+        """Test each device type gets a decoder for only its own metrics."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        first = bytes(8)
+        # 1024 ticks (one second) and two revolutions later
+        second = bytes([0, 0, 0, 0, 0, 4, 2, 0])
+        for device_id, device_type in ((1, 121), (2, 122), (3, 123)):
+            apply = monitor._make_apply(device_id, device_type, "Bike")
+            apply(first, 1.0)
+            apply(second, 2.0)
+        monitor._make_apply(4, 17, "Env")(first, 3.0)
+
+        combined = monitor.device_values[1]
+        assert combined["speed"] == pytest.approx(2 * 2.105 * 3.6)
+        assert combined["cadence"] == pytest.approx(120.0)
+        assert monitor.device_values[2]["speed"] is None
+        assert monitor.device_values[2]["cadence"] == pytest.approx(120.0)
+        assert monitor.device_values[3]["cadence"] is None
+        assert monitor.device_values[4] == {
+            "label": "Env",
+            "device_type": 17,
+            "device_id": 4,
+            "type": "unknown",
+            "ts": 3.0,
+        }
+
+    @patch.object(LiveMonitor, "_load_config", return_value={})
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    @patch.object(live_monitor, "_KEY_POLL_SECS", 0)
+    def test_run_curses_redraws_everything_after_resize(self, mock_node, mock_config):
+        """Test a resize clears the window and redraws header and rows."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        monitor.user_values["Alice"] = {"hr": 120}
+        stdscr = Mock()
+        stdscr.getmaxyx.return_value = (24, 80)
+
+        with patch.object(live_monitor, "curses") as mock_curses:
+            mock_curses.KEY_RESIZE = 410
+            stdscr.getch.side_effect = [-1, 410, ord("q")]
+            monitor.run_curses(stdscr)
+
+        assert stdscr.erase.call_count == 2
+        rows = [c.args for c in stdscr.addstr.call_args_list if c.args[0] == 5]
+        # Both frames draw the full row: the resize dropped the diff state
+        assert len(rows) == 10
+        mock_curses.doupdate.assert_called()
+
+    @patch.object(LiveMonitor, "_load_config", return_value={})
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_display_width_ascii_fast_path(self, mock_node, mock_config):
+        """Test plain ASCII text is measured without per-character lookups."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+
+        with patch.object(live_monitor, "_char_width") as mock_width:
+            assert monitor._calculate_display_width("Alice 123.4 -") == 13
+            mock_width.assert_not_called()
+
+        # Escape sequences still go through the ANSI stripping path
+        assert monitor._calculate_display_width("\x1b[1mBob\x1b[0m") == 3
+
+    @patch.object(
+        LiveMonitor,
+        "_load_config",
+        return_value={
+            "sensor_map": {
+                "users": [
+                    {"name": "Alice", "hr_device_ids": [111]},
+                    {"name": "Bartholomew Longname-Smith", "hr_device_id": 222},
+                ]
+            }
+        },
+    )
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    @patch.object(live_monitor, "_KEY_POLL_SECS", 0)
+    def test_rows_formatted_only_when_values_change(self, mock_node, mock_config):
+        """Test names are prepared once and unchanged rows are not reformatted."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+
+        assert monitor._display_names == {
+            "Alice": "Alice".ljust(20),
+            "Bartholomew Longname-Smith": "Bartholomew Longn...",
+        }
+
+        monitor.user_values["Alice"] = {"hr": 120, "speed": 25.04}
+        stdscr = Mock()
+        stdscr.getmaxyx.return_value = (24, 80)
+
+        def getch():
+            if stdscr.getch.call_count == 2:
+                # Same rendered text, but the raw value moved
+                monitor.user_values["Alice"] = {"hr": 120, "speed": 25.01}
+            if stdscr.getch.call_count >= 2:
+                monitor._dirty.set()
+            return ord("q") if stdscr.getch.call_count == 4 else -1
+
+        stdscr.getch.side_effect = getch
+
+        with patch.object(live_monitor, "curses"), patch.object(
+            monitor, "_format_row", wraps=monitor._format_row
+        ) as mock_format:
+            monitor.run_curses(stdscr)
+
+        # Frame 1 formats both rows, frame 2 reformats Alice for the new raw
+        # value, frame 3 skips both entirely
+        assert mock_format.call_count == 3
+        rows = [c.args for c in stdscr.addstr.call_args_list if c.args[0] == 5]
+        assert len(rows) == 5
+
+    @patch.object(
+        LiveMonitor,
+        "_load_config",
+        return_value={
+            "sensor_map": {
+                "users": [
+                    {"name": "Alice", "hr_device_ids": [111]},
+                    {"name": "NoStrap", "speed_device_id": 5},
+                ],
+                "wattbike": {"power_device_id": 9},
+            }
+        },
+    )
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_user_values_seeded_at_startup(self, mock_node, mock_config):
+        """Test HR users get their store up front and unknown targets are ignored."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+
+        assert monitor.user_values == {
+            "Alice": {
+                "hr": None,
+                "speed": None,
+                "cadence": None,
+                "power": None,
+                "updated": 0,
+            }
+        }
+
+        monitor.device_values[9] = {"power": 250}
+        monitor.last_hr_active_user = "Stranger"
+        monitor._assign_shared_sensors()
+        assert "Stranger" not in monitor.user_values
+
+        monitor.last_hr_active_user = "Alice"
+        monitor._assign_shared_sensors()
+        assert monitor.user_values["Alice"]["power"] == 250
+
+    @patch.object(
+        LiveMonitor,
+        "_load_config",
+        return_value={
+            "sensor_map": {
+                "users": [{"name": "Alice", "hr_device_ids": [111]}],
+                "wattbike": {"speed_device_id": 5, "power_device_id": 9},
+            }
+        },
+    )
+    @patch("src.pyantdisplay.ui.live_monitor.Node")
+    def test_shared_sensors_assigned_only_when_dirty(self, mock_node, mock_config):
+        """Test the wattbike pass only runs after relevant packets or rider changes."""
+        monitor = LiveMonitor(self.sensor_config, self.save_path)
+        power = monitor._make_apply(9, 11, "Wattbike-Power")
+        other_power = monitor._make_apply(10, 11, "Other-Power")
+        hr = monitor._make_apply(111, 120, "Alice-HR")
+
+        hr(bytes([0, 0, 0, 0, 0, 4, 1, 120]), 1.0)
+        assert monitor._shared_dirty
+        monitor._assign_shared_sensors()
+        assert not monitor._shared_dirty
+        stamped = monitor.user_values["Alice"]["updated"]
+
+        # Same rider, non-wattbike sensor: nothing to do
+        hr(bytes([0, 0, 0, 0, 0, 8, 2, 121]), 2.0)
+        other_power(bytes([0, 0, 0, 0, 0, 0, 0, 0x2C, 0x01]), 2.0)
+        assert not monitor._shared_dirty
+        monitor._assign_shared_sensors()
+        assert monitor.user_values["Alice"]["updated"] == stamped
+
+        power(bytes([0, 0, 0, 0, 0, 0, 0, 0xC8, 0x00]), 3.0)
+        assert monitor._shared_dirty
+        monitor._assign_shared_sensors()
+        assert monitor.user_values["Alice"]["power"] == 200
@@ -2,6 +2,8 @@
 Tests for MQTT monitor functionality.
 """
 
+import json
+import socket
 import threading
 from unittest.mock import Mock, patch, mock_open
 import tempfile
@@ -9,6 +11,7 @@ import os
 import sys
 
 import pytest
+import yaml  # imported before the sys.modules patch so the monitor shares it
 
 # Mock all openant imports to prevent USB device interaction during test collection
 openant_mock = Mock()
@@ -25,6 +28,7 @@ with patch.dict(
         "openant.easy.channel": openant_mock.easy.channel,
     },
 ):
+    from src.pyantdisplay.services import mqtt_monitor
     from src.pyantdisplay.services.mqtt_monitor import MqttMonitor
 
 
@@ -33,6 +37,9 @@ class TestMqttMonitor:
 
     def setup_method(self):
         """Set up test fixtures."""
+        # Parsed YAML is cached per file; start each test from a cold cache
+        mqtt_monitor._YAML_CACHE.clear()
+        mqtt_monitor._MERGED_CACHE.clear()
         self.temp_sensor_config = """
 devices:
   - device_type: 120
@@ -47,7 +54,7 @@ mqtt:
 """
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_init_basic(self, mock_yaml_load):
         """Test basic MQTT monitor initialization."""
         mock_yaml_load.side_effect = [
@@ -69,7 +76,7 @@ mqtt:
         assert monitor.channels == []
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_init_with_debug(self, mock_yaml_load):
         """Test MQTT monitor initialization with debug enabled."""
         mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
@@ -81,7 +88,7 @@ mqtt:
         assert monitor.debug is True
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_init_with_local_config(self, mock_yaml_load):
         """Test MQTT monitor initialization with local config override."""
         mock_yaml_load.side_effect = [
@@ -114,7 +121,7 @@ mqtt:
             assert True
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_device_values_thread_safety(self, mock_yaml_load):
         """Test thread-safe access to device values."""
         mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
@@ -124,11 +131,11 @@ mqtt:
         # Test that lock exists and is a threading.Lock instance
         assert hasattr(monitor, "lock")
         assert isinstance(monitor.lock, type(threading.Lock()))
-        assert monitor.device_values == {}
+        assert monitor._devices == []
         assert monitor.user_values == {}
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_stop_event_initialization(self, mock_yaml_load):
         """Test that stop event is properly initialized."""
         mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
@@ -139,7 +146,7 @@ mqtt:
         assert not monitor.stop_event.is_set()
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_yaml_merge_functionality(self, mock_yaml_load):
         """Test YAML configuration merging."""
         # Mock the YAML loading to return different configs
@@ -160,7 +167,7 @@ mqtt:
         assert monitor.app_config is not None
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_invalid_yaml_handling(self, mock_yaml_load):
         """Test handling of invalid YAML configurations."""
         # Mock sensor config and app config
@@ -181,7 +188,7 @@ mqtt:
             assert True
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_default_config_paths(self, mock_yaml_load):
         """Test default configuration paths."""
         mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
@@ -193,7 +200,7 @@ mqtt:
         assert monitor.local_app_config_path is None
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_thread_initialization(self, mock_yaml_load):
         """Test that thread-related attributes are properly initialized."""
         mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
@@ -205,7 +212,7 @@ mqtt:
 
     @patch("pyantdisplay.services.mqtt_monitor.load_manufacturers", return_value={})
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_configuration_loading(self, mock_yaml_load, mock_load_manufacturers):
         """Test that configurations are loaded during initialization."""
         sensor_config = {
@@ -222,7 +229,7 @@ mqtt:
         assert monitor.app_config == app_config
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_save_path_assignment(self, mock_yaml_load):
         """Test that save path is properly assigned."""
         mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
@@ -233,7 +240,7 @@ mqtt:
         assert monitor.save_path == save_path
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_empty_configurations(self, mock_yaml_load):
         """Test handling of empty configuration files."""
         mock_yaml_load.side_effect = [{}, {}]  # Empty configs
@@ -245,7 +252,7 @@ mqtt:
         assert monitor.channels == []
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_state_initialization(self, mock_yaml_load):
         """Test that internal state is properly initialized."""
         mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
@@ -253,16 +260,16 @@ mqtt:
         monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
 
         # Verify all state variables are initialized
-        assert isinstance(monitor.device_values, dict)
+        assert monitor._device_index == {}
         assert isinstance(monitor.user_values, dict)
-        assert monitor.device_values == {}
+        assert monitor._devices == []
         assert monitor.user_values == {}
         assert monitor.last_hr_active_user is None
         assert monitor.last_published_values == {}
         assert monitor.last_availability == {}
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     @patch("pyantdisplay.services.mqtt_monitor.mqtt")
     def test_publish_user_metrics_change_detection(self, mock_mqtt, mock_yaml_load):
         """Test that metrics are only published when values change."""
@@ -279,6 +286,7 @@ mqtt:
         # First publish - should publish all values
         user_vals = {"hr": 75, "speed": 25.5, "cadence": 90, "power": 150, "updated": 1}
         monitor._publish_user_metrics("TestUser", user_vals)
+        monitor._flush_publishes()
 
         # Should have published 4 messages
         assert mock_client.publish.call_count == 4
@@ -286,6 +294,7 @@ mqtt:
 
         # Second publish with same values - should publish nothing
         monitor._publish_user_metrics("TestUser", user_vals)
+        monitor._flush_publishes()
         assert mock_client.publish.call_count == 0
 
         # Third publish with changed HR only - should publish only HR
@@ -297,13 +306,14 @@ mqtt:
             "updated": 2,
         }
         monitor._publish_user_metrics("TestUser", user_vals_changed)
+        monitor._flush_publishes()
         assert mock_client.publish.call_count == 1
         mock_client.publish.assert_called_with(
             "test/users/TestUser/hr", payload="80", qos=1, retain=True
         )
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     @patch("pyantdisplay.services.mqtt_monitor.mqtt")
     def test_availability_change_detection(self, mock_mqtt, mock_yaml_load):
         """Test that availability is only published when status changes."""
@@ -319,6 +329,7 @@ mqtt:
 
         # First availability call - should publish
         monitor._availability("TestUser", True)
+        monitor._flush_publishes()
         assert mock_client.publish.call_count == 1
         mock_client.publish.assert_called_with(
             "test/users/TestUser/availability", payload="online", qos=1, retain=True
@@ -327,17 +338,19 @@ mqtt:
 
         # Second availability call with same status - should not publish
         monitor._availability("TestUser", True)
+        monitor._flush_publishes()
         assert mock_client.publish.call_count == 0
 
         # Third availability call with different status - should publish
         monitor._availability("TestUser", False)
+        monitor._flush_publishes()
         assert mock_client.publish.call_count == 1
         mock_client.publish.assert_called_with(
             "test/users/TestUser/availability", payload="offline", qos=1, retain=True
         )
 
     @patch("builtins.open", mock_open())
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     @patch("pyantdisplay.services.mqtt_monitor.mqtt")
     def test_last_published_values_tracking(self, mock_mqtt, mock_yaml_load):
         """Test that last published values are properly tracked."""
@@ -363,3 +376,431 @@ mqtt:
         # Check updated tracking
         expected_last_vals2 = {"hr": 80, "speed": 30.0, "cadence": None, "power": 200}
         assert monitor.last_published_values["TestUser"] == expected_last_vals2
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_assign_shared_sensors_uses_user_tables(self, mock_yaml_load):
+        """Test HR ownership and sensor assignment from the precomputed tables."""
+        mock_yaml_load.side_effect = [
+            {
+                "sensor_map": {
+                    "users": [
+                        {
+                            "name": "Alice",
+                            "hr_device_ids": [1, 2],
+                            "power_device_id": 5,
+                        },
+                        {"name": "Bob", "hr_device_id": 3},
+                    ],
+                    "wattbike": {"speed_device_id": 7, "cadence_device_id": 8},
+                }
+            },
+            {"mqtt": {"enabled": True}},
+        ]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+
+        assert monitor._hr_owner == {1: "Alice", 2: "Alice", 3: "Bob"}
+        assert monitor._user_for_hr(3) == "Bob"
+        assert monitor._wattbike_ids == (7, 8, None)
+
+        monitor._device_state(2, 120, "HR").hr = 120
+        monitor._device_state(5, 11, "Power").power = 200
+        monitor._device_state(7, 123, "Speed").speed = 30.0
+        monitor._device_state(8, 122, "Cadence").cadence = 85.0
+        monitor.last_hr_active_user = "Alice"
+        monitor._assign_shared_sensors()
+
+        alice = monitor.user_values["Alice"]
+        assert alice["hr"] == 120
+        assert alice["power"] == 200
+        assert alice["speed"] == 30.0
+        assert alice["cadence"] == 85.0
+        assert "Bob" not in monitor.user_values
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_publish_user_metrics_formats_and_reuses_tracking(self, mock_yaml_load):
+        """Test payload formatting and in-place update of the tracked values."""
+        mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        monitor.mqtt_client = Mock()
+        monitor.base_topic = "test"
+
+        monitor._publish_user_metrics("Ann", {"hr": 71.6, "speed": 30})
+        tracked = monitor.last_published_values["Ann"]
+        monitor._publish_user_metrics("Ann", {"hr": 72, "speed": 30})
+        monitor.mqtt_client.publish.assert_not_called()
+        monitor._flush_publishes()
+
+        payloads = [
+            (c.args[0], c.kwargs["payload"])
+            for c in monitor.mqtt_client.publish.call_args_list
+        ]
+        assert payloads == [
+            ("test/users/Ann/hr", "71"),
+            ("test/users/Ann/speed", "30.00"),
+            ("test/users/Ann/hr", "72"),
+        ]
+        assert monitor.last_published_values["Ann"] is tracked
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_assign_shared_sensors_only_touches_dirty_users(self, mock_yaml_load):
+        """Test a dirty-device pass refreshes and flags only the affected users."""
+        mock_yaml_load.side_effect = [
+            {
+                "sensor_map": {
+                    "users": [
+                        {"name": "Alice", "hr_device_ids": [1]},
+                        {"name": "Bob", "hr_device_ids": [2], "speed_device_id": 4},
+                    ]
+                }
+            },
+            {"mqtt": {"enabled": True}},
+        ]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        monitor._device_state(1, 120, "HR1").hr = 100
+        monitor._device_state(2, 120, "HR2").hr = 110
+        monitor._device_state(4, 123, "Speed").speed = 20.0
+
+        monitor._assign_shared_sensors({4: mqtt_monitor._SPEED_BIT})
+
+        assert set(monitor.user_values) == {"Bob"}
+        assert monitor.user_values["Bob"]["speed"] == 20.0
+        assert monitor._dirty_users == {"Bob"}
+
+        monitor._assign_shared_sensors({})
+        assert set(monitor.user_values) == {"Bob"}
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_assign_shared_sensors_unchanged_values_only_keep_alive(
+        self, mock_yaml_load
+    ):
+        """Test devices heard without new values skip the value copy."""
+        mock_yaml_load.side_effect = [
+            {"sensor_map": {"users": [{"name": "Bob", "hr_device_ids": [2]}]}},
+            {"mqtt": {"enabled": True}},
+        ]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        monitor._device_state(2, 120, "HR").hr = 110
+        monitor._assign_shared_sensors({2: mqtt_monitor._HR_BIT})
+        bob = monitor.user_values["Bob"]
+        monitor._dirty_users.clear()
+        monitor.last_availability["Bob"] = True
+        bob["updated"] = 1.0
+
+        # Same HR again: no value copy, no publish pass, but still alive
+        monitor._state_for(2).hr = 999  # would show up if values were copied
+        monitor._assign_shared_sensors({2: 0})
+        assert bob["hr"] == 110
+        assert bob["updated"] > 1.0
+        assert monitor._dirty_users == set()
+
+        # An offline user heard from again needs a pass to come back online
+        monitor.last_availability["Bob"] = False
+        monitor._assign_shared_sensors({2: 0})
+        assert monitor._dirty_users == {"Bob"}
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_users_without_new_data_go_offline(self, mock_yaml_load):
+        """Test a cached HR reading alone does not keep a user online."""
+        mock_yaml_load.side_effect = [
+            {
+                "sensor_map": {
+                    "users": [
+                        {"name": "Ann", "hr_device_ids": [1]},
+                        {"name": "Bob", "hr_device_ids": [2]},
+                    ]
+                }
+            },
+            {"mqtt": {"enabled": True}},
+        ]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        monitor._device_state(1, 120, "HR").hr = 72
+        monitor._device_state(2, 120, "HR").hr = 80
+        now = 100.0 + monitor.stale_secs
+        monitor.user_values = {
+            "Ann": dict(mqtt_monitor._new_user_values(), hr=72, updated=99.0),
+            "Bob": dict(mqtt_monitor._new_user_values(), hr=80, updated=now),
+        }
+        monitor.last_availability = {"Ann": True, "Bob": True}
+
+        monitor._mark_stale_offline(now)
+
+        assert monitor.last_availability == {"Ann": False, "Bob": True}
+        assert monitor._pending_pubs[-1][1:] == ("offline", True)
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_run_waits_on_wakeup_event(self, mock_yaml_load):
+        """Test the run loop blocks on the wakeup event instead of sleeping."""
+        mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        monitor.start = Mock()
+        monitor.stop = Mock()
+        monitor._flush_publishes = Mock(side_effect=monitor.stop_event.set)
+        monitor._wakeup.set()
+
+        with patch(
+            "src.pyantdisplay.services.mqtt_monitor.configure_logging"
+        ), patch.object(
+            monitor._wakeup, "wait", wraps=monitor._wakeup.wait
+        ) as mock_wait:
+            monitor.run()
+
+        mock_wait.assert_called_once_with(timeout=1.0)
+        assert not monitor._wakeup.is_set()
+        monitor.stop.assert_called_once()
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_publish_discovery_for_user_payloads(self, mock_yaml_load):
+        """Test discovery publishes one retained config per configured metric."""
+        mock_yaml_load.side_effect = [
+            {
+                "sensor_map": {
+                    "users": [
+                        {"name": "Ann", "hr_device_ids": [1], "power_device_id": 5}
+                    ]
+                }
+            },
+            {"mqtt": {"base_topic": "test"}},
+        ]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        monitor.mqtt_client = Mock()
+        monitor._publish_discovery_for_user("Ann")
+
+        calls = monitor.mqtt_client.publish.call_args_list
+        assert [c.args[0] for c in calls] == [
+            "homeassistant/sensor/pyantdisplay_Ann_hr/config",
+            "homeassistant/sensor/pyantdisplay_Ann_power/config",
+        ]
+        power = json.loads(calls[1].kwargs["payload"])
+        assert power["state_topic"] == "test/users/Ann/power"
+        assert power["availability_topic"] == "test/users/Ann/availability"
+        assert power["device_class"] == "power"
+        assert power["device"]["name"] == "PyANTDisplay Ann"
+        assert all(c.kwargs["retain"] is True for c in calls)
+
+        # Repeat publishes (e.g. after a reconnect) reuse the serialized payloads
+        monitor._publish_discovery_for_user("Ann")
+        again = monitor.mqtt_client.publish.call_args_list[2:]
+        assert [c.kwargs["payload"] for c in again] == [
+            c.kwargs["payload"] for c in calls[:2]
+        ]
+        assert again[0].kwargs["payload"] is calls[0].kwargs["payload"]
+
+        monitor._publish_discovery_for_user("Nobody")
+        assert monitor.mqtt_client.publish.call_count == 4
+
+    def test_load_yaml_cached_until_file_changes(self, tmp_path):
+        """Test YAML files are parsed once per on-disk version."""
+        sensors = tmp_path / "sensors.yaml"
+        sensors.write_text("sensor_map:\n  users: []\n")
+        app = tmp_path / "config.yaml"
+        app.write_text("mqtt:\n  host: broker\n")
+
+        with patch("yaml.load", wraps=yaml.load) as mock_load, patch.object(
+            mqtt_monitor, "load_manufacturers", return_value={}
+        ):
+            monitor = MqttMonitor(str(sensors), "/tmp/data", str(app))
+            assert monitor.mqtt_host == "broker"
+            assert mock_load.call_count == 2
+
+            MqttMonitor(str(sensors), "/tmp/data", str(app))
+            assert mock_load.call_count == 2
+
+            app.write_text("mqtt:\n  host: other-broker\n")
+            assert MqttMonitor(str(sensors), "/tmp/data", str(app)).mqtt_host == (
+                "other-broker"
+            )
+            assert mock_load.call_count == 3
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_open_configured_channels_single_pass(self, mock_yaml_load):
+        """Test users are seeded before their channels open, in one pass."""
+        mock_yaml_load.side_effect = [
+            {
+                "sensor_map": {
+                    "users": [
+                        {"name": "Ann", "hr_device_ids": [1, 2], "speed_device_id": 4},
+                        {"name": "Ben", "power_device_id": 5},
+                    ],
+                    "wattbike": {"cadence_device_id": 8},
+                }
+            },
+            {"mqtt": {"enabled": True}},
+        ]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        opened = []
+        monitor._open_channel = Mock(
+            side_effect=lambda *args: opened.append((args, set(monitor.user_values)))
+        )
+
+        monitor._open_configured_channels()
+
+        assert [args for args, _ in opened] == [
+            (1, 120, "Ann-HR1"),
+            (2, 120, "Ann-HR2"),
+            (4, 123, "Ann-Speed"),
+            (5, 11, "Ben-Power"),
+            (8, 122, "Wattbike-Cadence"),
+        ]
+        assert all(seeded == {"Ann"} for _, seeded in opened)
+        assert monitor.last_availability == {"Ann": False}
+
+    def test_decode_bike_speed_and_cadence(self):
+        """Test the speed/cadence decoder, including 16-bit rollover."""
+        # 2 revolutions in one second (1024 ticks) on a 2.0 m wheel
+        speed, cadence = mqtt_monitor._decode_bike(1024, 12, 0, 10, 2.0, True, True)
+        assert speed == pytest.approx(14.4)
+        assert cadence == pytest.approx(120.0)
+
+        # Counters wrapping past 0xFFFF still give the forward difference
+        speed, cadence = mqtt_monitor._decode_bike(
+            512, 1, 0xFE00, 0xFFFF, 2.0, True, False
+        )
+        assert speed == pytest.approx(14.4)
+        assert cadence is None
+
+        # No elapsed time means no reading
+        assert mqtt_monitor._decode_bike(5, 9, 5, 3, 2.0, True, True) == (None, None)
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_persist_device_meta_gates_channel_id_requests(self, mock_yaml_load):
+        """Test the channel ID is requested at most once per interval."""
+        mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        ch = Mock()
+        ch.request_message.return_value = (0, 0, [0x39, 0x30, 120, 1])
+        data_page = [4, 0, 0, 0, 0, 0, 0, 70]
+        common_page = [80, 0xFF, 0xFF, 1, 1, 0, 0, 0]
+
+        with patch.object(mqtt_monitor, "deep_merge_save") as mock_save:
+            monitor._persist_device_meta(ch, 12345, data_page, 100.0)
+            monitor._persist_device_meta(ch, 12345, data_page, 101.0)
+            monitor._persist_device_meta(ch, 12345, common_page, 102.0)
+            assert ch.request_message.call_count == 1
+            assert mock_save.call_count == 2
+            assert mock_save.call_args.args[1:] == (12345, 120, 1)
+
+            monitor._persist_device_meta(ch, 12345, data_page, 130.0)
+            assert ch.request_message.call_count == 2
+            assert mock_save.call_count == 3
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_user_topics_built_once(self, mock_yaml_load):
+        """Test per-user topics are formatted once and reused."""
+        mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"base_topic": "t"}}]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        topics = monitor._user_topics_for("Ann")
+
+        assert topics.hr == "t/users/Ann/hr"
+        assert topics.power == "t/users/Ann/power"
+        assert topics.availability == "t/users/Ann/availability"
+        assert monitor._user_topics_for("Ann") is topics
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_open_channel_queues_type_specific_updates(self, mock_yaml_load):
+        """Test callbacks queue updates that decode only their channel's type."""
+        mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        monitor.node = Mock()
+        hr_ch, power_ch = Mock(), Mock()
+        monitor.node.new_channel.side_effect = [hr_ch, power_ch]
+        monitor._open_channel(1, 120, "HR")
+        monitor._open_channel(2, 11, "Power")
+
+        with patch.object(monitor, "_persist_device_meta"):
+            hr_ch.on_broadcast_data([0, 0, 0, 0, 0, 0, 0, 142])
+            power_ch.on_broadcast_data([16, 0, 0, 0, 0, 0, 0, 0x2C, 0x01])
+
+        # Callbacks only queue; state changes when the run thread drains
+        assert monitor._state_for(1).hr is None
+        assert len(monitor._events) == 2
+        assert monitor._wakeup.is_set()
+        monitor._drain_events()
+
+        assert monitor._device_index == {1: 0, 2: 1}
+        assert monitor._state_for(1).hr == 142
+        assert monitor._state_for(1).label == "HR"
+        assert monitor._state_for(2).power == 300
+        assert monitor._state_for(2).device_type == 11
+        assert monitor._dirty_devices == {
+            1: mqtt_monitor._HR_BIT,
+            2: mqtt_monitor._POWER_BIT,
+        }
+        assert not monitor._events
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    @patch.object(mqtt_monitor, "mqtt")
+    def test_connect_mqtt_tunes_client(self, mock_mqtt, mock_yaml_load):
+        """Test the paho client limits and the TCP_NODELAY connect hook."""
+        mock_yaml_load.side_effect = [{"devices": []}, {"mqtt": {"enabled": True}}]
+        mock_client = Mock()
+        mock_mqtt.Client.return_value = mock_client
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        monitor._connect_mqtt()
+
+        mock_client.max_inflight_messages_set.assert_called_once_with(200)
+        mock_client.max_queued_messages_set.assert_called_once_with(10000)
+        assert mock_client.on_connect == monitor._on_mqtt_connect
+
+        sock = Mock()
+        mock_client.socket.return_value = sock
+        monitor._on_mqtt_connect(mock_client, None, {}, 0)
+        sock.setsockopt.assert_called_once_with(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
+
+    @patch("builtins.open", mock_open())
+    @patch("yaml.load")
+    def test_wheel_circumference_read_once(self, mock_yaml_load):
+        """Test the wheel circumference is parsed once and used for speed."""
+        mock_yaml_load.side_effect = [
+            {"devices": [], "wheel_circumference_m": "2.0"},
+            {"mqtt": {"enabled": True}},
+        ]
+
+        monitor = MqttMonitor(sensor_config_path="sensors.yaml", save_path="/tmp/data")
+        assert monitor._circ_m == 2.0
+
+        state = monitor._device_state(4, 123, "Speed")
+        apply = monitor._make_bike_apply(state)
+        monitor.sensor_config["wheel_circumference_m"] = 9.9
+        apply([0, 0, 0, 0, 0, 0, 0, 0], 1.0)
+        apply([0, 0, 0, 0, 0x00, 0x04, 2, 0], 2.0)  # 1 s, 2 revolutions
+        assert state.speed == pytest.approx(14.4)
+
+    def test_merge_config_does_not_modify_inputs(self):
+        """Test deep merge overrides nested keys without touching the inputs."""
+        base = {"mqtt": {"broker": "a", "port": 1883, "tls": {"on": False}}, "x": 1}
+        local = {"mqtt": {"broker": "b", "tls": {"on": True}}, "y": [1]}
+
+        merged = mqtt_monitor._merge_config(base, local)
+
+        assert merged == {
+            "mqtt": {"broker": "b", "port": 1883, "tls": {"on": True}},
+            "x": 1,
+            "y": [1],
+        }
+        assert base["mqtt"] == {"broker": "a", "port": 1883, "tls": {"on": False}}
@@ -116,9 +116,11 @@ class TestMultiHRDevices:
 
         app_config = {"mqtt": {"host": "localhost", "port": 1883, "base_topic": "test"}}
 
-        with patch("builtins.open"), patch("yaml.safe_load") as mock_yaml, patch(
+        with patch("builtins.open"), patch("yaml.load") as mock_yaml, patch(
             "pyantdisplay.services.mqtt_monitor.mqtt"
-        ) as mock_mqtt:
+        ) as mock_mqtt, patch.dict(
+            "pyantdisplay.services.mqtt_monitor._YAML_CACHE", clear=True
+        ):
             mock_yaml.side_effect = [sensor_config, app_config]
             mock_mqtt.Client.return_value = MagicMock()
 